@@ -1,27 +1,55 @@
 __all__ = [
     "AccessoryBoard",
+    "ActuationCounters",
     "BoardConfig",
     "BoardController",
+    "CompiledBoard",
+    "ConnectionResult",
+    "ConnectionStatus",
+    "CurrentSampler",
+    "ExclusiveConnectionConflictException",
     "I2CDriverBoardController",
-    "SimulatedBoardController",
+    "Metrics",
+    "OvercurrentInterlock",
     "PathUnsupportedException",
+    "PlanValidator",
+    "RecordingBoardController",
+    "RelayJournal",
+    "ReplayBoardController",
     "ResourceInUseException",
+    "SharedStateReader",
+    "SimulatedBoardController",
     "SourceConflictException",
-    "ExclusiveConnectionConflictException",
+    "read_journal",
 ]
 
 from aliaroaccessoryboards.accessory_board import AccessoryBoard
-from aliaroaccessoryboards.exceptions import (
-    PathUnsupportedException,
-    ResourceInUseException,
-    SourceConflictException,
-    ExclusiveConnectionConflictException,
-)
+from aliaroaccessoryboards.actuation_counters import ActuationCounters
 from aliaroaccessoryboards.board_config import BoardConfig
 from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
 from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
     I2CDriverBoardController,
 )
+from aliaroaccessoryboards.boardcontrollers.recording_board_controller import (
+    RecordingBoardController,
+)
+from aliaroaccessoryboards.boardcontrollers.replay_board_controller import (
+    ReplayBoardController,
+)
 from aliaroaccessoryboards.boardcontrollers.simulated_board_controller import (
     SimulatedBoardController,
 )
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.connection_status import ConnectionResult, ConnectionStatus
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+from aliaroaccessoryboards.exceptions import (
+    ExclusiveConnectionConflictException,
+    PathUnsupportedException,
+    ResourceInUseException,
+    SourceConflictException,
+)
+from aliaroaccessoryboards.interlock import OvercurrentInterlock
+from aliaroaccessoryboards.metrics import Metrics
+from aliaroaccessoryboards.plan_validation import PlanValidator
+from aliaroaccessoryboards.relay_journal import RelayJournal, read_journal
+from aliaroaccessoryboards.shared_state import SharedStateReader
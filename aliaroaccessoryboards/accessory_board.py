@@ -1,26 +1,54 @@
+from __future__ import annotations
+
+import threading
+import time
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Set, Union, List, Dict, Iterable
+from typing import Any
+
+import numpy as np
 
+from aliaroaccessoryboards.actuation_counters import (
+    ActuationCounters,
+    RelayActuations,
+)
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.board_state import BoardState, BoardStateArrays
+from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.connection_status import (
+    ALREADY_CONNECTED,
+    CONNECTED,
+    DISCONNECTED,
+    NOT_CONNECTED,
+    PATH_UNSUPPORTED,
+    ConnectionResult,
+    ConnectionStatus,
+)
 from aliaroaccessoryboards.exceptions import (
+    AccessoryBoardException,
+    ExclusiveConnectionConflictException,
     PathUnsupportedException,
     ResourceInUseException,
     SourceConflictException,
-    ExclusiveConnectionConflictException,
 )
-from aliaroaccessoryboards.board_config import (
-    BoardConfig,
-    ConnectionPath,
-    ExclusiveConnection,
+from aliaroaccessoryboards.metrics import Metrics
+from aliaroaccessoryboards.presets import (
+    CompiledPreset,
+    compile_preset,
+    preset_channels,
 )
-from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
-from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.profiling import BoardProfiler
+from aliaroaccessoryboards.relay_journal import JournalOperation, RelayJournal
+from aliaroaccessoryboards.shared_state import SharedStatePublisher
 
 
 class AccessoryBoard:
     def __init__(
         self,
-        board_config: Union[str, Path, BoardConfig],
+        board_config: str | Path | BoardConfig,
         board_controller: BoardController,
         reset: bool = True,
     ):
@@ -28,22 +56,34 @@ class AccessoryBoard:
         # Initialize configuration
         self.board_controller = board_controller
 
-        # Process board config information
+        # Process board config information. The lookup tables are shared with every other
+        # board and controller using the same config.
         self._board_config = self._initialize_board_config(board_config)
+        self._compiled = CompiledBoard.for_config(self._board_config)
         self._initial_state = self._board_config.initialization_commands
-        self.channels = frozenset(self._board_config.channels)
-        self._connection_map = self._build_connection_map(
-            self._board_config.connection_paths
-        )
-        self.relays = tuple(self._board_config.relays)
-        self._exclusive_connections = self._build_exclusive_connection_map(
-            self._board_config.exclusive_connections
-        )
+        self.channels = self._compiled.channels
+        self._connection_map = self._compiled.connection_map
+        self.relays = self._compiled.relays
+        self._relay_index = self._compiled.relay_index
+        self._exclusive_connections = self._compiled.exclusive_connections
+
+        # Held across every relay change, from setting the relays to the commit, so
+        # changes made from other threads, e.g. an interlock trip, are never interleaved.
+        self.lock = threading.RLock()
 
         # Initialize board state
-        self._source_channels = set()
-        self._relay_counter = Counter()
-        self._connections: Set[ConnectionKey] = set()
+        self._state = BoardState(len(self.relays))
+        self._source_channels = self._state.sources
+        self._connections = self._state.connections
+        self._state_publisher: SharedStatePublisher | None = None
+        self.metrics: Metrics | None = None
+        self._journal: RelayJournal | None = None
+        # Presets registered at runtime and compiled presets by their filled channel
+        # names, created on first use.
+        self._presets: dict[str, tuple[tuple[str, str], ...]] | None = None
+        self._compiled_presets: (
+            dict[tuple[tuple[str, str], ...], CompiledPreset] | None
+        ) = None
 
         # Reset and check existing connections if reset flag is True
         # If not, read actual board state
@@ -54,7 +94,7 @@ class AccessoryBoard:
 
     @staticmethod
     def _initialize_board_config(
-        board_config: Union[str, Path, BoardConfig],
+        board_config: str | Path | BoardConfig,
     ) -> BoardConfig:
         return (
             board_config
@@ -62,34 +102,48 @@ class AccessoryBoard:
             else BoardConfig.from_brd_file(board_config)
         )
 
-    @staticmethod
-    def _build_connection_map(
-        connection_list: List[ConnectionPath],
-    ) -> Dict[ConnectionKey, List[str]]:
-        """Create a map of connections to relays."""
-        return {
-            ConnectionKey(connection.src, connection.dest): connection.relays
-            for connection in connection_list
-        }
+    def _read_and_register_active_relays(self) -> int:
+        active_mask = self._read_relay_mask()
+        self._register_active_relays(active_mask)
+        return active_mask
 
-    @staticmethod
-    def _build_exclusive_connection_map(
-        exclusive_connections: List[ExclusiveConnection],
-    ) -> Dict[str, List[str]]:
-        """Create an exclusive connection map from configuration."""
-        return {entry.src: entry.dests for entry in exclusive_connections}
-
-    def _read_and_register_active_relays(self):
-        relay_list = self.board_controller.relays
-        active_channel_list = []
-        for idx, value in enumerate(self._board_config.relays):
-            if relay_list[idx]:
-                active_channel_list.append(self._board_config.relays[idx])
-
-        for key, value_list in self._connection_map.items():
-            for value in value_list:
-                if value in active_channel_list:
-                    self._connections.add(key)
+    def _read_relay_mask(self) -> int:
+        active_mask = 0
+        for idx, closed in enumerate(self.board_controller.relays):
+            if closed:
+                active_mask |= 1 << idx
+        return active_mask
+
+    def _register_active_relays(self, active_mask: int) -> None:
+        """
+        Register the connections of the closed relays in a mask.
+
+        A path is registered as connected when any of its relays is closed, as before
+        compiled boards, so a relay closed on reset marks every path using it as connected.
+        Paths without relays are never registered, as in `disconnect_all_channels`.
+        """
+        compiled = self._compiled
+        paths = compiled.paths
+        add_connection = self._state.add_connection
+        remaining = active_mask
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            for path in compiled.relay_paths[bit.bit_length() - 1]:
+                add_connection(paths[path])
+
+    def _holder_of(self, relay: str) -> ConnectionKey | None:
+        """
+        Return the active connection using a relay, or None if it is only in use because it
+        is closed on reset or by something outside this board.
+        """
+        compiled = self._compiled
+        connections = self._connections
+        for path in compiled.relay_paths[compiled.relay_index[relay]]:
+            key = compiled.paths[path]
+            if key in connections:
+                return key
+        return None
 
     def connect_channels(self, channel1: str, channel2: str):
         """
@@ -110,6 +164,13 @@ class AccessoryBoard:
         :param channel2: The identifier of the second input to connect.
         :return: None
         """
+        with self.lock:
+            if self.metrics is None:
+                return self._connect_channels(channel1, channel2)
+            with self.metrics.measure("connect"):
+                return self._connect_channels(channel1, channel2)
+
+    def _connect_channels(self, channel1: str, channel2: str):
         connection_key = ConnectionKey(channel1, channel2)
 
         # If already connected, no action required.
@@ -126,25 +187,75 @@ class AccessoryBoard:
         relays_to_close = self._connection_map[connection_key]
         self._validate_relays(relays_to_close)
 
+        self._close_path(connection_key)
+
+    def try_connect(self, channel1: str, channel2: str) -> ConnectionResult:
+        """
+        Connects two inputs on the device if possible, without raising on conflicts.
+
+        Runs the same checks as `connect_channels`, but reports a failed check as the
+        status of the result instead of raising an exception, which is cheaper when
+        conflicts are expected, e.g. when searching for a route.
+
+        :param channel1: The identifier of the first input to connect.
+        :param channel2: The identifier of the second input to connect.
+        :return: ``CONNECTED`` or ``ALREADY_CONNECTED`` on success, otherwise the status of
+            the first failed check with its detail.
+        """
+        with self.lock:
+            if self.metrics is None:
+                return self._try_connect(channel1, channel2)
+            with self.metrics.measure("connect"):
+                result = self._try_connect(channel1, channel2)
+            if not result.ok:
+                self.metrics.increment(
+                    "rejections_total", operation="connect", status=result.status.value
+                )
+            return result
+
+    def _try_connect(self, channel1: str, channel2: str) -> ConnectionResult:
+        connection_key = ConnectionKey(channel1, channel2)
+        if connection_key in self._connections:
+            return ALREADY_CONNECTED
+
+        failure = (
+            self._check_channel_names(connection_key)
+            or self._check_exclusive_connections(connection_key)
+            or self._check_single_source(connection_key)
+            or self._check_path_exists(connection_key)
+            or self._check_relays(self._connection_map[connection_key])
+        )
+        if failure is not None:
+            return failure
+
+        self._close_path(connection_key)
+        return CONNECTED
+
+    def _close_path(self, connection_key: ConnectionKey) -> None:
+        """Close the relays of a validated connection and register it."""
         # Close relays for the connection
-        for relay in relays_to_close:
-            self.board_controller.set_relay(self.relays.index(relay), True)
-            self._relay_counter[relay] += 1
+        indices = self._compiled.path_relay_indices[connection_key]
+        for idx in indices:
+            self.board_controller.set_relay(idx, True)
+        self._state.acquire(indices)
 
         # Commit the changes to the hardware
-        self.board_controller.commit_relays()
+        self._commit_relays(JournalOperation.CONNECT)
 
-        # Register the connection
-        self._connections.add(connection_key)
+        # Register the connection under the shared key of its path
+        compiled = self._compiled
+        self._state.add_connection(compiled.paths[compiled.path_index[connection_key]])
+        self._publish_state()
 
-    def _validate_relays(self, relays_to_close: List[str]) -> None:
+    def _validate_relays(self, relays_to_close: list[str]) -> None:
         """
         Validates the list of relays to be closed.
 
         The method iterates over the provided list of relay identifiers and checks
         if any of the relays are currently in use.
 
-        If a relay is found to be in use, a `ResourceInUseException` is raised.
+        If a relay is found to be in use, a `ResourceInUseException` is raised, naming the
+        connection holding the relay if there is one.
         This ensures that no relays that are currently in operation are inadvertently
         closed.
 
@@ -152,9 +263,20 @@ class AccessoryBoard:
         :raises ResourceInUseException: If any relay in the list is currently in use.
         :return: None
         """
+        failure = self._check_relays(relays_to_close)
+        if failure is not None:
+            raise ResourceInUseException(
+                failure.detail, holder=self._holder_of(failure.detail)
+            )
+
+    def _check_relays(self, relays_to_close: Iterable[str]) -> ConnectionResult | None:
+        used_mask = self._state.used_mask
+        if not used_mask:
+            return None
         for relay in relays_to_close:
-            if self._relay_counter[relay] > 0:
-                raise ResourceInUseException(relay)
+            if used_mask >> self._relay_index[relay] & 1:
+                return ConnectionResult(ConnectionStatus.RESOURCE_IN_USE, relay)
+        return None
 
     def _validate_path_exists(self, connection_key: ConnectionKey) -> None:
         """
@@ -171,9 +293,16 @@ class AccessoryBoard:
             in the connection map.
         :return: None
         """
-        if connection_key not in self._connection_map:
+        if self._check_path_exists(connection_key) is not None:
             raise PathUnsupportedException(connection_key)
 
+    def _check_path_exists(
+        self, connection_key: ConnectionKey
+    ) -> ConnectionResult | None:
+        if connection_key not in self._connection_map:
+            return PATH_UNSUPPORTED
+        return None
+
     def _validate_single_source(self, connection_key: ConnectionKey) -> None:
         """
         Validate that the connection does not connect multiple sources.
@@ -185,25 +314,33 @@ class AccessoryBoard:
         :param connection_key: The ConnectionKey object to be validated.
         :raises SourceConflictException: If conflicting source connections are detected.
         """
+        failure = self._check_single_source(connection_key)
+        if failure is not None:
+            raise SourceConflictException(connection_key, failure.detail)
 
+    def _check_single_source(
+        self, connection_key: ConnectionKey
+    ) -> ConnectionResult | None:
         # Check if both channels in the connection key are marked as sources
         if all(channel in self._source_channels for channel in connection_key):
-            raise SourceConflictException(connection_key, set(connection_key))
+            return ConnectionResult(
+                ConnectionStatus.SOURCE_CONFLICT, set(connection_key)
+            )
 
         for channel in connection_key:
             if channel in self._source_channels:
-                for connection in self._connections:
-                    if any(
-                        other_channel in set(connection_key) - {channel}
-                        for other_channel in connection
-                    ):
+                for other_channel in set(connection_key) - {channel}:
+                    for peer in self._state.peers_of(other_channel):
                         conflicting_sources = {
-                            ch for ch in connection if ch in self._source_channels
+                            ch
+                            for ch in (other_channel, peer)
+                            if ch in self._source_channels
                         }
                         if conflicting_sources:
-                            raise SourceConflictException(
-                                connection_key, conflicting_sources
+                            return ConnectionResult(
+                                ConnectionStatus.SOURCE_CONFLICT, conflicting_sources
                             )
+        return None
 
     def _validate_exclusive_connections(self, connection_key: ConnectionKey) -> None:
         """
@@ -213,15 +350,21 @@ class AccessoryBoard:
         :raises ExclusiveConnectionConflictException: If a conflicting channel is detected in the multiplexing
             configuration.
         """
+        failure = self._check_exclusive_connections(connection_key)
+        if failure is not None:
+            raise ExclusiveConnectionConflictException(connection_key, failure.detail)
+
+    def _check_exclusive_connections(
+        self, connection_key: ConnectionKey
+    ) -> ConnectionResult | None:
         for channel in connection_key:
             if channel in self._exclusive_connections:
-                for connection in self._connections:
-                    if channel in connection:
-                        existing_connection = next(iter(set(connection) - {channel}))
-                        if existing_connection in self._exclusive_connections[channel]:
-                            raise ExclusiveConnectionConflictException(
-                                connection_key, existing_connection
-                            )
+                for existing_connection in self._state.peers_of(channel):
+                    if existing_connection in self._exclusive_connections[channel]:
+                        return ConnectionResult(
+                            ConnectionStatus.EXCLUSIVE_CONFLICT, existing_connection
+                        )
+        return None
 
     def _validate_channel_names(self, channel_names: Iterable):
         """
@@ -232,11 +375,19 @@ class AccessoryBoard:
         :raises KeyError: If the provided ``connection_key`` contains channel
             names that are not part of the existing ``self.channels`` list.
         """
+        failure = self._check_channel_names(channel_names)
+        if failure is not None:
+            raise KeyError(
+                f"Invalid channel names provided: {', '.join(failure.detail)}"
+            )
+
+    def _check_channel_names(self, channel_names: Iterable) -> ConnectionResult | None:
         invalid_channels = [str(ch) for ch in channel_names if ch not in self.channels]
         if invalid_channels:
-            raise KeyError(
-                f"Invalid channel names provided: {', '.join(invalid_channels)}"
+            return ConnectionResult(
+                ConnectionStatus.INVALID_CHANNEL, tuple(invalid_channels)
             )
+        return None
 
     def disconnect_channels(self, channel1: str, channel2: str):
         """
@@ -249,23 +400,67 @@ class AccessoryBoard:
         :param channel2: The identifier for the second channel to disconnect.
         :return: None
         """
+        with self.lock:
+            if self.metrics is None:
+                return self._disconnect_channels(channel1, channel2)
+            with self.metrics.measure("disconnect"):
+                return self._disconnect_channels(channel1, channel2)
+
+    def _disconnect_channels(self, channel1: str, channel2: str):
         self._validate_channel_names(ConnectionKey(channel1, channel2))
         connection_key = ConnectionKey(channel1, channel2)
         if connection_key not in self._connections:
             return  # No action needed if the channels are not connected.
 
-        relays_to_open = self._connection_map.get(connection_key, [])
+        self._open_path(connection_key)
+
+    def try_disconnect(self, channel1: str, channel2: str) -> ConnectionResult:
+        """
+        Disconnects two channels, without raising on invalid channel names.
+
+        :param channel1: The identifier for the first channel to disconnect.
+        :param channel2: The identifier for the second channel to disconnect.
+        :return: ``DISCONNECTED`` or ``NOT_CONNECTED`` on success, ``INVALID_CHANNEL`` with
+            the invalid names otherwise.
+        """
+        with self.lock:
+            if self.metrics is None:
+                return self._try_disconnect(channel1, channel2)
+            with self.metrics.measure("disconnect"):
+                result = self._try_disconnect(channel1, channel2)
+            if not result.ok:
+                self.metrics.increment(
+                    "rejections_total",
+                    operation="disconnect",
+                    status=result.status.value,
+                )
+            return result
+
+    def _try_disconnect(self, channel1: str, channel2: str) -> ConnectionResult:
+        connection_key = ConnectionKey(channel1, channel2)
+        failure = self._check_channel_names(connection_key)
+        if failure is not None:
+            return failure
+        if connection_key not in self._connections:
+            return NOT_CONNECTED
+
+        self._open_path(connection_key)
+        return DISCONNECTED
 
-        for relay in relays_to_open:
-            self._relay_counter[relay] -= 1
-            if self._relay_counter[relay] == 0:
-                self.board_controller.set_relay(self.relays.index(relay), False)
+    def _open_path(self, connection_key: ConnectionKey) -> None:
+        """Open the relays of an active connection no other connection uses and remove it."""
+        indices = self._compiled.path_relay_indices.get(connection_key, ())
+        freed = self._state.release(indices)
+        for idx in indices:
+            if freed >> idx & 1:
+                self.board_controller.set_relay(idx, False)
 
         # Commit the changes to the hardware
-        self.board_controller.commit_relays()
+        self._commit_relays(JournalOperation.DISCONNECT)
 
         # Remove the connection from the active connections list.
-        self._connections.remove(connection_key)
+        self._state.remove_connection(connection_key)
+        self._publish_state()
 
     def disconnect_all_channels(self) -> None:
         """
@@ -276,12 +471,130 @@ class AccessoryBoard:
 
         :return: None
         """
-        for relay in self.relays:
-            self.board_controller.set_relay(self.relays.index(relay), False)
-        self.board_controller.commit_relays()
-        self._connections.clear()
-        self._relay_counter.clear()
-        self._relay_counter.update(self._initial_state.close_relays)
+        with self.lock:
+            if self.metrics is None:
+                return self._disconnect_all_channels()
+            with self.metrics.measure("disconnect_all"):
+                return self._disconnect_all_channels()
+
+    def _disconnect_all_channels(self) -> None:
+        for idx in range(len(self.relays)):
+            self.board_controller.set_relay(idx, False)
+        self._commit_relays(JournalOperation.DISCONNECT_ALL)
+        self._state.clear()
+        self._state.acquire(
+            self._relay_index[relay] for relay in self._compiled.close_relays
+        )
+        self._publish_state()
+
+    def register_preset(
+        self, name: str, connections: Iterable[tuple[str, str]]
+    ) -> None:
+        """
+        Register a route preset on this board, replacing a preset of the same name.
+
+        Presets without parameters are validated immediately, presets with parameters
+        when they are first applied with a set of parameter values.
+
+        :param name: Name of the preset.
+        :param connections: Pairs of channel names to connect. Channel names may contain
+            `str.format` fields, e.g. ``DUT_CH{ch:02d}``, filled from the parameters given
+            to `apply_preset`.
+        :raises KeyError: A channel name is invalid.
+        :raises PathUnsupportedException: Two channels have no path.
+        :raises ResourceInUseException: Two paths of the preset use the same relay.
+        :raises ExclusiveConnectionConflictException: Two connections of the preset are
+            mutually exclusive.
+        :return: None
+        """
+        connections = tuple((channel1, channel2) for channel1, channel2 in connections)
+        if not any("{" in channel for pair in connections for channel in pair):
+            compile_preset(self._compiled, connections)
+        if self._presets is None:
+            self._presets = {}
+        self._presets[name] = connections
+
+    def apply_preset(self, name: str, **params: Any) -> None:
+        """
+        Make all connections of a route preset at once.
+
+        The connections are checked like `connect_channels` does, in preset order, and
+        either all of them are made with a single commit to the device, or none if a check
+        fails. Connections that already exist are kept.
+
+        :param name: Name of a preset registered with `register_preset` or defined in the
+            board configuration.
+        :param params: Values of the fields in the channel names of the preset, of any
+            type the fields can format.
+        :raises KeyError: The preset does not exist, a parameter is missing or a channel
+            name is invalid.
+        :raises ValueError: A parameter cannot be formatted by its field.
+        :raises PathUnsupportedException: Two channels of the preset have no path.
+        :raises ResourceInUseException: A relay of the preset is in use.
+        :raises SourceConflictException: The preset would connect multiple sources.
+        :raises ExclusiveConnectionConflictException: The preset conflicts with a mutually
+            exclusive connection.
+        :return: None
+        """
+        with self.lock:
+            if self.metrics is None:
+                return self._apply_preset(name, params)
+            with self.metrics.measure("apply_preset"):
+                return self._apply_preset(name, params)
+
+    def _apply_preset(self, name: str, params: dict[str, Any]) -> None:
+        preset = self._compiled_preset(name, params)
+        compiled = self._compiled
+        state = self._state
+        added = []
+        try:
+            for connection_key in preset.connections:
+                if connection_key in self._connections:
+                    continue
+                self._validate_exclusive_connections(connection_key)
+                self._validate_single_source(connection_key)
+                self._validate_relays(self._connection_map[connection_key])
+                # Register the connection right away, so the next ones are checked
+                # against it.
+                state.add_connection(connection_key)
+                state.acquire(compiled.path_relay_indices[connection_key])
+                added.append(connection_key)
+        except AccessoryBoardException:
+            for connection_key in reversed(added):
+                state.release(compiled.path_relay_indices[connection_key])
+                state.remove_connection(connection_key)
+            raise
+        if not added:
+            return
+
+        relay_mask = preset.relay_mask
+        if len(added) < len(preset.connections):
+            relay_mask = 0
+            for connection_key in added:
+                relay_mask |= compiled.path_masks[connection_key]
+        self.board_controller.set_relays(relay_mask, True)
+        self._commit_relays(JournalOperation.PRESET)
+        self._publish_state()
+
+    def _compiled_preset(self, name: str, params: dict[str, Any]) -> CompiledPreset:
+        if self._presets is not None and name in self._presets:
+            connections = self._presets[name]
+        elif name in self._board_config.presets:
+            connections = [
+                (connection.src, connection.dest)
+                for connection in self._board_config.presets[name].connections
+            ]
+        else:
+            raise KeyError(f"Unknown preset: {name}")
+        # Keyed by the filled channel names, which are hashable whatever the parameters.
+        channels = tuple(preset_channels(connections, params))
+        if self._compiled_presets is None:
+            self._compiled_presets = {}
+        preset = self._compiled_presets.get(channels)
+        if preset is None:
+            preset = compile_preset(self._compiled, channels)
+            self._compiled_presets[channels] = preset
+        return preset
 
     def reset(self) -> None:
         """
@@ -289,18 +602,257 @@ class AccessoryBoard:
 
         :return: None.
         """
-        self.disconnect_all_channels()
+        with self.lock:
+            if self.metrics is None:
+                return self._reset()
+            with self.metrics.measure("reset"):
+                return self._reset()
+
+    def _reset(self) -> None:
+        self._disconnect_all_channels()
         # Set relays to their initial states
-        for relay in self._initial_state.open_relays:
-            self.board_controller.set_relay(self.relays.index(relay), False)
-        for relay in self._initial_state.close_relays:
-            self.board_controller.set_relay(self.relays.index(relay), True)
+        for relay in self._compiled.open_relays:
+            self.board_controller.set_relay(self._relay_index[relay], False)
+        for relay in self._compiled.close_relays:
+            self.board_controller.set_relay(self._relay_index[relay], True)
 
         # Commit changes to the hardware
-        self.board_controller.commit_relays()
+        self._commit_relays(JournalOperation.RESET)
 
         # Check if the initial relay states connect anything
         self._read_and_register_active_relays()
+        self._publish_state()
+
+    def reconcile(self, relay_mask: int | None = None) -> None:
+        """
+        Rebuild the connection bookkeeping from the relays actually closed on the device.
+
+        Use this after the relays were changed without going through this board, for
+        example by an `OvercurrentInterlock`. Closed relays that are not part of a
+        registered connection are treated as in use. The controller's relay buffer is
+        replaced with the mask, so relay changes buffered but not committed are discarded
+        when ``relay_mask`` is given.
+
+        :param relay_mask: The relays closed on the device, if known. Read from the
+            device otherwise.
+        :raises RuntimeError: ``relay_mask`` is omitted and relay changes are pending
+            commit on the controller. The bookkeeping is left unchanged.
+        :return: None
+        """
+        with self.lock:
+            if relay_mask is None:
+                relay_mask = self._read_relay_mask()
+            state = self._state
+            state.clear()
+            self._register_active_relays(relay_mask)
+            for connection in self._connections:
+                state.acquire(
+                    idx
+                    for idx in self._compiled.path_relay_indices[connection]
+                    if relay_mask >> idx & 1
+                )
+            state.acquire(
+                idx
+                for idx in range(len(self.relays))
+                if relay_mask >> idx & 1 and not state.relay_counts[idx]
+            )
+            self.board_controller.replace_relay_buffer(relay_mask)
+            self._publish_state()
+
+    @property
+    def reset_relay_mask(self) -> int:
+        """Mask of the relays closed on reset, with every other relay open."""
+        return self._compiled.close_mask
+
+    def force_open(self, relay_mask: int | None = None) -> float:
+        """
+        Open every relay outside a mask in a single write, without validation.
+
+        Meant for safety shutdowns such as an `OvercurrentInterlock` trip. Relay changes
+        buffered on the controller but not committed are discarded, so a later commit cannot
+        undo the write. The write is journaled as an interlock operation and the board is
+        reconciled with the mask.
+
+        :param relay_mask: The relays to leave closed. Defaults to `reset_relay_mask`.
+        :return: `time.perf_counter` when the mask was written to the device.
+        """
+        if relay_mask is None:
+            relay_mask = self._compiled.close_mask
+        controller = self.board_controller
+        with self.lock:
+            controller.replace_relay_buffer(relay_mask)
+            controller.commit_relays()
+            written = time.perf_counter()
+            self._record_journal(JournalOperation.INTERLOCK, relay_mask)
+            self.reconcile(relay_mask)
+        return written
+
+    @property
+    def _relay_counter(self) -> Counter:
+        """Snapshot of the number of users per relay name, omitting unused relays."""
+        relays = self.relays
+        return Counter(
+            {relays[idx]: n for idx, n in enumerate(self._state.relay_counts) if n}
+        )
+
+    def enable_metrics(self, metrics: Metrics | None = None) -> Metrics:
+        """
+        Start recording performance metrics for this board and its controller.
+
+        :param metrics: The collector to record into, e.g. one shared by several boards.
+            A new collector is created if omitted.
+        :return: The collector.
+        """
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.board_controller.metrics = self.metrics
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Stop recording performance metrics.
+
+        :return: None
+        """
+        self.metrics = None
+        self.board_controller.metrics = None
+
+    def profile(self) -> BoardProfiler:
+        """
+        Time the operations performed within a ``with`` block, broken down by phase.
+
+        Covers the validation steps, relay mask building, device writes, settling and
+        read-backs, with either a simulated or a hardware controller::
+
+            with board.profile() as profile:
+                board.connect_channels("DUT_CH01", "BUS_POS")
+            print(profile.report())
+
+        :return: A context manager that yields the `Profile` being recorded.
+        """
+        return BoardProfiler(self)
+
+    def publish_state(self, name: str | None = None) -> SharedStatePublisher:
+        """
+        Publish the board state into a shared memory segment.
+
+        Once enabled, the relay mask and the active connections are republished after every
+        operation that changes them. Other local processes can poll the state with a
+        `SharedStateReader` without accessing the board or taking any locks.
+
+        :param name: Name of the shared memory segment. A unique name is generated if omitted.
+        :return: The publisher. Its ``name`` attribute identifies the segment for readers.
+        """
+        if self._state_publisher is None:
+            self._state_publisher = SharedStatePublisher(
+                name,
+                len(self.relays),
+                self._board_config.channels,
+                len(self._connection_map),
+            )
+        self._publish_state()
+        return self._state_publisher
+
+    def stop_publishing_state(self) -> None:
+        """
+        Stop publishing the board state and destroy the shared memory segment.
+
+        :return: None
+        """
+        if self._state_publisher is not None:
+            self._state_publisher.close()
+            self._state_publisher = None
+
+    def enable_journal(
+        self,
+        path: str | Path,
+        board_id: int = 0,
+        max_bytes: int = 16 * 1024 * 1024,
+        backups: int = 3,
+    ) -> RelayJournal:
+        """
+        Record every relay mask applied to the board in a binary journal.
+
+        Records are appended through a memory-mapped file and can be decoded with
+        `read_journal`. See `RelayJournal` for the rotation parameters.
+
+        :param path: Path of the journal file.
+        :param board_id: Identifier stored with every record, to tell boards apart.
+        :param max_bytes: Size of a journal file before it is rotated.
+        :param backups: Number of rotated files to keep.
+        :return: The journal.
+        """
+        self.disable_journal()
+        self._journal = RelayJournal(
+            path, len(self.relays), board_id, max_bytes=max_bytes, backups=backups
+        )
+        return self._journal
+
+    def disable_journal(self) -> None:
+        """
+        Stop journaling and close the journal file.
+
+        :return: None
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _commit_relays(self, operation: JournalOperation) -> None:
+        self.board_controller.commit_relays()
+        if self._journal is not None:
+            self._journal.append(operation, self.board_controller.last_relay_mask)
+
+    def _record_journal(self, operation: JournalOperation, relay_mask: int) -> None:
+        if self._journal is not None:
+            self._journal.append(operation, relay_mask)
+
+    def enable_actuation_counters(
+        self, serial: str, directory: str | Path = "."
+    ) -> ActuationCounters:
+        """
+        Count relay closes and opens in a persistent counter file for this board.
+
+        Counts accumulate across sessions in ``<directory>/<serial>.actuations.npy``. Every
+        transition between consecutive relay masks written to the device is counted, starting
+        from the relay mask the controller last wrote or read.
+
+        :param serial: Serial number of the board, identifying its counter file.
+        :param directory: Directory holding the counter files.
+        :return: The counters.
+        """
+        self.disable_actuation_counters()
+        counters = ActuationCounters.for_serial(serial, len(self.relays), directory)
+        self.board_controller.actuation_counters = counters
+        return counters
+
+    def disable_actuation_counters(self) -> None:
+        """
+        Stop counting relay actuations and close the counter file.
+
+        :return: None
+        """
+        counters = self.board_controller.actuation_counters
+        if counters is not None:
+            self.board_controller.actuation_counters = None
+            counters.close()
+
+    def relay_actuations(self) -> dict[str, RelayActuations]:
+        """
+        Return the close and open count of every relay.
+
+        :raises RuntimeError: Actuation counting is not enabled.
+        :return: Counts keyed by relay name.
+        """
+        counters = self.board_controller.actuation_counters
+        if counters is None:
+            raise RuntimeError("Actuation counters are not enabled.")
+        return counters.by_relay(self.relays)
+
+    def _publish_state(self) -> None:
+        if self._state_publisher is not None:
+            self._state_publisher.publish(
+                self.board_controller.last_relay_mask, self._connections
+            )
 
     def mark_as_source(self, channel: str):
         self._validate_channel_names([channel])
@@ -310,6 +862,75 @@ class AccessoryBoard:
         self._validate_channel_names([channel])
         self._source_channels.remove(channel)
 
+    def is_connected_many(self, pairs: Iterable[tuple[str, str]]) -> list[bool]:
+        """
+        Check whether each pair of channels is directly connected.
+
+        :param pairs: Pairs of channel names.
+        :return: Whether the channels of each pair are connected, in order. Unknown channels
+            are not connected.
+        """
+        peers_of = self._state.peers_of
+        return [channel2 in peers_of(channel1) for channel1, channel2 in pairs]
+
+    def peers_of(self, channel: str) -> frozenset[str]:
+        """
+        Return the channels directly connected to a channel.
+
+        :param channel: The channel name.
+        :raises KeyError: If the channel name is invalid.
+        :return: The connected channels.
+        """
+        self._validate_channel_names([channel])
+        return frozenset(self._state.peers_of(channel))
+
+    def net_of(self, channel: str) -> frozenset[str]:
+        """
+        Return the channels electrically connected to a channel, directly or through other
+        channels, including the channel itself.
+
+        :param channel: The channel name.
+        :raises KeyError: If the channel name is invalid.
+        :return: The channels of the net.
+        """
+        self._validate_channel_names([channel])
+        peers_of = self._state.peers_of
+        net = {channel}
+        pending = [channel]
+        while pending:
+            for peer in peers_of(pending.pop()):
+                if peer not in net:
+                    net.add(peer)
+                    pending.append(peer)
+        return frozenset(net)
+
+    def connected_channels(self) -> frozenset[str]:
+        """Return the channels with at least one connection."""
+        return frozenset(self._state.peers)
+
+    def state_arrays(self) -> BoardStateArrays:
+        """
+        Export the active connections and the relay mask as compact arrays.
+
+        :return: The connections as channel index pairs and the last relay mask written to
+            or read from the device.
+        """
+        compiled = self._compiled
+        connections = self._connections
+        path_index = compiled.path_index
+        indices = np.fromiter(
+            (path_index[connection] for connection in connections),
+            dtype=np.intp,
+            count=len(connections),
+        )
+        indices.sort()
+        mask = self.board_controller.last_relay_mask.to_bytes(
+            (len(self.relays) + 7) // 8, byteorder="little"
+        )
+        return BoardStateArrays(
+            compiled.path_channels[indices], np.frombuffer(mask, dtype=np.uint8)
+        )
+
     def print_connections(self) -> None:
         """
         Prints all connections present in the given AccessoryBoard.
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+_CLOSES = 0
+_OPENS = 1
+
+
+class RelayActuations(NamedTuple):
+    """
+    Actuation counts of a single relay.
+
+    :ivar closes: Number of open to closed transitions.
+    :ivar opens: Number of closed to open transitions.
+    """
+
+    closes: int
+    opens: int
+
+
+class ActuationCounters:
+    """
+    Persistent per-relay close and open counts.
+
+    The counts are held in a memory-mapped ``.npy`` file of shape ``(2, relay_count)``, so
+    they survive restarts and updating them does not involve any file I/O calls. Transitions
+    are derived from the XOR of consecutive relay masks; commits that do not change the mask
+    cost a single comparison.
+    """
+
+    def __init__(self, path: str | Path, relay_count: int):
+        """
+        :param path: Path of the counter file. It is created if it does not exist.
+        :param relay_count: Number of relays on the board.
+        :raises ValueError: The existing file holds counts for a different relay count.
+        """
+        self.path = Path(path)
+        self.relay_count = relay_count
+        self._mask_size = (relay_count + 7) // 8
+        shape = (2, relay_count)
+        if self.path.exists():
+            counts = np.lib.format.open_memmap(self.path, mode="r+")
+            if counts.shape != shape or counts.dtype != np.uint64:
+                raise ValueError(
+                    f"{self.path} holds counts of shape {counts.shape}, expected {shape}"
+                )
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            counts = np.lib.format.open_memmap(
+                self.path, mode="w+", dtype=np.uint64, shape=shape
+            )
+        self._counts = counts
+        # Plain ndarray over the mapped memory, avoiding memmap overhead on every update.
+        self._view = counts.view(np.ndarray)
+
+    @classmethod
+    def for_serial(
+        cls, serial: str, relay_count: int, directory: str | Path = "."
+    ) -> ActuationCounters:
+        """
+        Open the counter file of a board by its serial number.
+
+        :param serial: Serial number of the board.
+        :param relay_count: Number of relays on the board.
+        :param directory: Directory holding the counter files.
+        :return: The counters stored in ``<directory>/<serial>.actuations.npy``.
+        """
+        return cls(Path(directory) / f"{serial}.actuations.npy", relay_count)
+
+    def record(self, previous_mask: int, relay_mask: int) -> None:
+        """
+        Count the relay transitions between two consecutive relay masks.
+
+        :param previous_mask: The relay mask before the change.
+        :param relay_mask: The relay mask after the change.
+        :return: None
+        """
+        changed = previous_mask ^ relay_mask
+        if not changed:
+            return
+        bits = self._mask_size * 8
+        # Closes in the low half, opens in the high half, unpacked in a single call.
+        packed = (changed & relay_mask) | (changed & previous_mask) << bits
+        transitions = np.unpackbits(
+            np.frombuffer(packed.to_bytes(self._mask_size * 2, "little"), np.uint8),
+            bitorder="little",
+        ).reshape(2, bits)
+        self._view += transitions[:, : self.relay_count]
+
+    @property
+    def closes(self) -> np.ndarray:
+        """Close count per relay, in relay order."""
+        return np.array(self._view[_CLOSES])
+
+    @property
+    def opens(self) -> np.ndarray:
+        """Open count per relay, in relay order."""
+        return np.array(self._view[_OPENS])
+
+    def by_relay(self, relays: Sequence[str]) -> dict[str, RelayActuations]:
+        """
+        Return the counts keyed by relay name.
+
+        :param relays: Relay names, in the order of the board config.
+        :return: Close and open count per relay.
+        """
+        return {
+            relay: RelayActuations(int(closes), int(opens))
+            for relay, closes, opens in zip(
+                relays, self._view[_CLOSES], self._view[_OPENS]
+            )
+        }
+
+    def reset(self) -> None:
+        """Zero all counts, e.g. after the board was replaced."""
+        self._view[:] = 0
+
+    def flush(self) -> None:
+        """Write the counts to disk."""
+        self._counts.flush()
+
+    def close(self) -> None:
+        self.flush()
+        del self._view
+        del self._counts
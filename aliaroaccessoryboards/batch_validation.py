@@ -0,0 +1,217 @@
+"""
+Validation of many switching plans against many board configurations in parallel.
+
+Each board configuration is loaded and compiled into a `PlanValidator` once. The compiled
+validators are sent to every worker process when it starts, so workers neither parse
+``.brd`` files nor run pydantic validation. Plans are distributed across the pool and
+results are reported as they finish::
+
+    python -m aliaroaccessoryboards.batch_validation --boards boards/*.brd --plans plans/*.yaml
+
+Plan files are YAML documents listing the channels marked as sources and the steps, each
+step being the channel pairs connected at the same time::
+
+    sources: [BUS1_1]
+    steps:
+      - [[DUT_CH01, BUS1_1]]
+      - [[DUT_CH01, BUS1_2], [DUT_CH02, BUS1_1]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+import yaml
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.plan_validation import PlanValidator
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+class SwitchingPlan(NamedTuple):
+    """
+    A switching plan.
+
+    :ivar sources: Channels marked as sources.
+    :ivar steps: Channel pairs connected at the same time, per step.
+    """
+
+    sources: list[str]
+    steps: list[list[list[str]]]
+
+
+class PlanResult(NamedTuple):
+    """
+    Outcome of validating one plan against one board.
+
+    :ivar board: Name of the board configuration.
+    :ivar plan: Path of the plan file.
+    :ivar steps: Number of steps in the plan.
+    :ivar failed_step: Index of the first failing step, if any.
+    :ivar error: Type name of the failure, e.g. ``ResourceInUseException``, if any.
+    :ivar reason: Description of the failure, if any.
+    :ivar seconds: Time taken to validate the plan against this board.
+    """
+
+    board: str
+    plan: str
+    steps: int
+    failed_step: int | None
+    error: str | None
+    reason: str | None
+    seconds: float
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None
+
+
+def load_plan(path: str | Path) -> SwitchingPlan:
+    """Load a plan file."""
+    with open(path) as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}
+    return SwitchingPlan(list(data.get("sources") or []), list(data.get("steps") or []))
+
+
+_validators: dict[str, PlanValidator] = {}
+
+
+def _init_worker(validators: dict[str, PlanValidator]) -> None:
+    global _validators
+    _validators = validators
+
+
+def _validate_plan(plan_path: str) -> list[PlanResult]:
+    """Validate one plan against every board, in a worker process."""
+    try:
+        plan = load_plan(plan_path)
+    except (OSError, yaml.YAMLError, AttributeError, TypeError, ValueError) as e:
+        return [
+            PlanResult(board, plan_path, 0, None, type(e).__name__, str(e), 0.0)
+            for board in _validators
+        ]
+
+    results = []
+    for board, validator in _validators.items():
+        start = time.perf_counter()
+        try:
+            failure = validator.validate(plan.steps, plan.sources)
+        except (KeyError, TypeError, ValueError) as e:
+            failure = None
+            error, reason = type(e).__name__, str(e)
+        else:
+            error = None if failure is None else type(failure.exception).__name__
+            reason = None if failure is None else failure.reason
+        results.append(
+            PlanResult(
+                board,
+                plan_path,
+                len(plan.steps),
+                None if failure is None else failure.step,
+                error,
+                reason,
+                time.perf_counter() - start,
+            )
+        )
+    return results
+
+
+def compile_boards(
+    boards: Sequence[str | Path | BoardConfig],
+) -> dict[str, PlanValidator]:
+    """
+    Load and compile board configurations.
+
+    :param boards: Paths of ``.brd`` files, or loaded configurations.
+    :return: Validators keyed by board name: the file stem, or ``board<index>`` for loaded
+        configurations.
+    """
+    validators = {}
+    for index, board in enumerate(boards):
+        if isinstance(board, BoardConfig):
+            validators[f"board{index}"] = PlanValidator(board)
+        else:
+            validators[Path(board).stem] = PlanValidator(
+                BoardConfig.from_brd_file(board)
+            )
+    return validators
+
+
+def validate_plans(
+    boards: dict[str, PlanValidator] | Sequence[str | Path | BoardConfig],
+    plans: Sequence[str | Path],
+    processes: int | None = None,
+) -> Iterator[PlanResult]:
+    """
+    Validate every plan against every board, yielding results as they finish.
+
+    :param boards: Compiled validators keyed by board name, or boards for `compile_boards`.
+    :param plans: Paths of plan files.
+    :param processes: Number of worker processes. Defaults to the CPU count. With 1, plans
+        are validated in the calling process.
+    :return: An iterator over the results, in completion order.
+    """
+    validators = boards if isinstance(boards, dict) else compile_boards(boards)
+    plan_paths = [str(plan) for plan in plans]
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(plan_paths) <= 1:
+        _init_worker(validators)
+        for plan in plan_paths:
+            yield from _validate_plan(plan)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(processes, len(plan_paths)),
+        initializer=_init_worker,
+        initargs=(validators,),
+    ) as executor:
+        futures = [executor.submit(_validate_plan, plan) for plan in plan_paths]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate switching plans against board configurations."
+    )
+    parser.add_argument("--boards", nargs="+", required=True, help=".brd files")
+    parser.add_argument("--plans", nargs="+", required=True, help="Plan files")
+    parser.add_argument("--processes", type=int, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    failures = []
+    count = 0
+    for result in validate_plans(args.boards, args.plans, args.processes):
+        count += 1
+        if result.passed:
+            print(f"PASS {result.board} {result.plan} ({result.steps} steps)")
+        else:
+            failures.append(result)
+            step = "" if result.failed_step is None else f" step {result.failed_step}"
+            print(f"FAIL {result.board} {result.plan}{step}: {result.reason}")
+        sys.stdout.flush()
+
+    print(
+        f"\n{count} validations, {len(failures)} failed, "
+        f"{time.perf_counter() - start:.2f}s"
+    )
+    for result in failures:
+        print(f"  {result.board} {result.plan}: {result.error}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
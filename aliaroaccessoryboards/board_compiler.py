@@ -0,0 +1,107 @@
+"""
+Compiles the bundled ``.brd`` files into the Python data modules of
+`aliaroaccessoryboards.compiled_boards`.
+
+Run after changing a bundled board definition, before building the package::
+
+    python -m aliaroaccessoryboards.board_compiler
+
+With ``--check``, nothing is written and the exit status is non-zero if any compiled module
+is missing or out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pprint
+import sys
+from pathlib import Path
+from typing import Any
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.compiled_boards import (
+    BOARDS_DIR,
+    module_name,
+    source_digest,
+)
+
+COMPILED_DIR = Path(__file__).parent / "compiled_boards"
+
+
+def compile_board_config(board_config: BoardConfig) -> dict[str, Any]:
+    """
+    Convert a board configuration into plain data with precomputed indexes.
+
+    :param board_config: The validated configuration.
+    :return: ``CONFIG`` (the configuration as plain data), ``PATH_RELAY_INDICES`` (relay
+        indices per connection path), ``PATH_MASKS`` (relay mask per connection path) and
+        ``EXCLUSIVE`` (exclusive destinations per source, sorted).
+    """
+    relay_index = {relay: i for i, relay in enumerate(board_config.relays)}
+    path_relay_indices = tuple(
+        tuple(relay_index[relay] for relay in path.relays)
+        for path in board_config.connection_paths
+    )
+    return {
+        "CONFIG": board_config.model_dump(),
+        "PATH_RELAY_INDICES": path_relay_indices,
+        "PATH_MASKS": tuple(
+            sum(1 << idx for idx in set(indices)) for indices in path_relay_indices
+        ),
+        "EXCLUSIVE": {
+            entry.src: tuple(sorted(entry.dests))
+            for entry in board_config.exclusive_connections
+        },
+    }
+
+
+def render_module(device_name: str) -> str:
+    """Return the source of the compiled module of a bundled board."""
+    config = BoardConfig.from_brd_file(BOARDS_DIR / f"{device_name}.brd")
+    config.check_integrity()
+    lines = [
+        f"# Generated from boards/{device_name}.brd by",
+        "# python -m aliaroaccessoryboards.board_compiler. Do not edit.",
+        "# fmt: off",
+        "",
+        f"SOURCE_SHA256 = {source_digest(device_name)!r}",
+    ]
+    for name, value in compile_board_config(config).items():
+        lines.append("")
+        lines.append(
+            f"{name} = {pprint.pformat(value, width=88, sort_dicts=False, compact=True)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def bundled_device_names() -> list[str]:
+    return sorted(path.stem for path in BOARDS_DIR.glob("*.brd"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile the bundled .brd files.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check the compiled modules are current",
+    )
+    args = parser.parse_args(argv)
+
+    stale = []
+    for device_name in bundled_device_names():
+        path = COMPILED_DIR / f"{module_name(device_name)}.py"
+        source = render_module(device_name)
+        if path.exists() and path.read_text() == source:
+            continue
+        stale.append(device_name)
+        if not args.check:
+            path.write_text(source)
+            print(f"Compiled {device_name} -> {path.name}")
+    if args.check and stale:
+        print(f"Out of date: {', '.join(stale)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
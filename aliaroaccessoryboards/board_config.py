@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import functools
+import weakref
+from collections.abc import Mapping
 from pathlib import Path
-from typing import List, Union
+from typing import IO, TYPE_CHECKING, Any
 
-import pydantic_yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from aliaroaccessoryboards.brd_loader import EntryConstructionError, load_brd_data
+from aliaroaccessoryboards.compiled_boards import load_compiled_board
+from aliaroaccessoryboards.exceptions import BoardConfigIntegrityException
+
+if TYPE_CHECKING:
+    from aliaroaccessoryboards.compiled_board import CompiledBoard
+
+# Content key and integrity problems per checked BoardConfig, keyed by id and dropped
+# with the config.
+_integrity_problems: dict[int, tuple[tuple, list[str]]] = {}
 
 
 class InitializationCommands(BaseModel):
@@ -18,8 +31,8 @@ class InitializationCommands(BaseModel):
     :ivar close_relays: List of relay names that should be closed.
     """
 
-    open_relays: List[str] = Field(default_factory=list)
-    close_relays: List[str] = Field(default_factory=list)
+    open_relays: list[str] = Field(default_factory=list)
+    close_relays: list[str] = Field(default_factory=list)
 
 
 class ConnectionPath(BaseModel):
@@ -37,7 +50,7 @@ class ConnectionPath(BaseModel):
 
     src: str
     dest: str
-    relays: List[str]
+    relays: list[str]
 
 
 class ExclusiveConnection(BaseModel):
@@ -52,7 +65,46 @@ class ExclusiveConnection(BaseModel):
     """
 
     src: str
-    dests: List[str]
+    dests: list[str]
+
+
+class PresetConnection(BaseModel):
+    """
+    A connection of a `RoutePreset`.
+
+    The channel names may contain `str.format` fields, e.g. ``DUT_CH{ch:02d}``, filled
+    from the parameters given to `AccessoryBoard.apply_preset`.
+
+    :ivar src: The source channel.
+    :ivar dest: The destination channel.
+    """
+
+    src: str
+    dest: str
+
+
+class RoutePreset(BaseModel):
+    """
+    A named set of connections, applied together with `AccessoryBoard.apply_preset`.
+
+    :ivar connections: The connections to make.
+    """
+
+    connections: list[PresetConnection]
+
+
+class CurrentSensorCalibration(BaseModel):
+    """
+    Linear calibration converting raw current sensor readings to engineering units.
+
+    The calibrated value is ``raw * scale + offset``.
+
+    :ivar scale: Multiplier applied to the raw reading.
+    :ivar offset: Value added after scaling.
+    """
+
+    scale: float = 1.0
+    offset: float = 0.0
 
 
 class BoardConfig(BaseModel):
@@ -69,33 +121,348 @@ class BoardConfig(BaseModel):
     :ivar initialization_commands: Commands used for initializing the board.
     :ivar exclusive_connections: List of exclusive connections.
     :ivar current_sensors: List of current sensor identifiers in the board.
+    :ivar current_sensor_calibration: Calibration per current sensor. Sensors without an entry
+        report raw readings.
+    :ivar presets: Route presets by name.
     """
 
-    relays: List[str]
-    channels: List[str]
-    connection_paths: List[ConnectionPath]
+    relays: list[str]
+    channels: list[str]
+    connection_paths: list[ConnectionPath]
     initialization_commands: InitializationCommands = Field(
         default_factory=InitializationCommands
     )
-    exclusive_connections: List[ExclusiveConnection] = Field(default_factory=list)
-    current_sensors: List[str] = Field(default_factory=list)
+    exclusive_connections: list[ExclusiveConnection] = Field(default_factory=list)
+    current_sensors: list[str] = Field(default_factory=list)
+    current_sensor_calibration: dict[str, CurrentSensorCalibration] = Field(
+        default_factory=dict
+    )
+    presets: dict[str, RoutePreset] = Field(default_factory=dict)
 
     @classmethod
-    def from_brd_file(cls, top_file: Union[str, Path]) -> BoardConfig:
-        with open(top_file) as f:
-            top = pydantic_yaml.parse_yaml_raw_as(BoardConfig, f.read())
-        return top
+    def from_brd_file(cls, top_file: str | Path) -> BoardConfig:
+        with open(top_file, "rb") as f:
+            return cls._from_brd_stream(f)
 
     @classmethod
     def from_brd_string(cls, top_string: str) -> BoardConfig:
-        top = pydantic_yaml.parse_yaml_raw_as(BoardConfig, top_string)
-        return top
+        return cls._from_brd_stream(top_string)
+
+    @classmethod
+    def _from_brd_stream(cls, stream: str | IO) -> BoardConfig:
+        """
+        Parse a board definition with the streaming loader, validating every connection
+        path as soon as it has been read.
+        """
+        try:
+            data = load_brd_data(
+                stream, {"connection_paths": ConnectionPath.model_validate}
+            )
+        except EntryConstructionError as e:
+            if isinstance(e.error, ValidationError):
+                raise _located_validation_error(cls.__name__, e) from e
+            raise
+        return cls.model_validate(data)
 
     @classmethod
     def from_device_name(cls, device_name: str) -> BoardConfig:
-        import os
+        """
+        Return the configuration of a bundled board.
 
-        top_file = os.path.join(
-            os.path.dirname(__file__), "boards", f"{device_name}.brd"
+        The board is loaded and compiled once per process, from the precompiled tables if
+        available. Every call returns a new copy of the configuration, which the caller may
+        modify; unmodified copies share one `CompiledBoard`.
+
+        :param device_name: Name of the bundled board.
+        :return: The configuration.
+        """
+        config, _ = _bundled_board(cls, device_name)
+        return config.model_copy(deep=True)
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> BoardConfig:
+        """
+        Build a configuration from trusted plain data without pydantic validation.
+
+        Use this for data produced by this package, such as compiled board modules,
+        generated boards or ``model_dump()`` output. Follows ``model_construct`` semantics:
+        the values are not type checked and no model validators run. Use `check_integrity`
+        to verify the configuration is consistent.
+
+        :param data: The configuration fields, with connection paths, exclusive connections,
+            initialization commands, calibrations and presets as plain mappings.
+        :return: The configuration.
+        """
+        init = data.get("initialization_commands") or {}
+        return _trusted(
+            cls,
+            relays=list(data["relays"]),
+            channels=list(data["channels"]),
+            connection_paths=[
+                _trusted(
+                    ConnectionPath,
+                    src=path["src"],
+                    dest=path["dest"],
+                    relays=list(path["relays"]),
+                )
+                for path in data["connection_paths"]
+            ],
+            initialization_commands=_trusted(
+                InitializationCommands,
+                open_relays=list(init.get("open_relays", ())),
+                close_relays=list(init.get("close_relays", ())),
+            ),
+            exclusive_connections=[
+                _trusted(
+                    ExclusiveConnection, src=entry["src"], dests=list(entry["dests"])
+                )
+                for entry in data.get("exclusive_connections", ())
+            ],
+            current_sensors=list(data.get("current_sensors", ())),
+            current_sensor_calibration={
+                sensor: _trusted(
+                    CurrentSensorCalibration,
+                    scale=calibration.get("scale", 1.0),
+                    offset=calibration.get("offset", 0.0),
+                )
+                for sensor, calibration in (
+                    data.get("current_sensor_calibration") or {}
+                ).items()
+            },
+            presets={
+                name: _trusted(
+                    RoutePreset,
+                    connections=[
+                        _trusted(
+                            PresetConnection,
+                            src=connection["src"],
+                            dest=connection["dest"],
+                        )
+                        for connection in preset["connections"]
+                    ],
+                )
+                for name, preset in (data.get("presets") or {}).items()
+            },
         )
-        return cls.from_brd_file(top_file)
+
+    def _content_key(self) -> tuple:
+        """
+        Return the content of this configuration as nested tuples, to find out whether a
+        cached result derived from it is still current.
+        """
+        init = self.initialization_commands
+        return (
+            tuple(self.relays),
+            tuple(self.channels),
+            tuple([(p.src, p.dest, tuple(p.relays)) for p in self.connection_paths]),
+            tuple(init.open_relays),
+            tuple(init.close_relays),
+            tuple([(e.src, tuple(e.dests)) for e in self.exclusive_connections]),
+            tuple(self.current_sensors),
+            tuple(
+                [
+                    (sensor, calibration.scale, calibration.offset)
+                    for sensor, calibration in self.current_sensor_calibration.items()
+                ]
+            ),
+            tuple(
+                [
+                    (name, tuple([(c.src, c.dest) for c in preset.connections]))
+                    for name, preset in self.presets.items()
+                ]
+            ),
+        )
+
+    def integrity_problems(self) -> list[str]:
+        """
+        Find inconsistencies that pydantic validation does not catch.
+
+        Checks for duplicate relay and channel names, connection paths and exclusive
+        connections referring to undefined channels or relays, duplicate connection paths,
+        initialization commands referring to undefined relays, calibrations of undefined
+        current sensors and presets without parameters connecting channels that have no
+        path. The result is cached per configuration and computed again only after the
+        configuration was modified.
+
+        :return: A description of every problem found.
+        """
+        key = self._content_key()
+        cached = _integrity_problems.get(id(self))
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+        problems = self._find_integrity_problems()
+        if cached is None:
+            weakref.finalize(self, _integrity_problems.pop, id(self), None)
+        _integrity_problems[id(self)] = (key, problems)
+        return list(problems)
+
+    def check_integrity(self) -> None:
+        """
+        Verify the configuration is consistent, see `integrity_problems`.
+
+        :raises BoardConfigIntegrityException: The configuration has problems.
+        :return: None
+        """
+        problems = self.integrity_problems()
+        if problems:
+            raise BoardConfigIntegrityException(problems)
+
+    def _find_integrity_problems(self) -> list[str]:
+        problems = []
+        relays = set(self.relays)
+        channels = set(self.channels)
+        if len(relays) != len(self.relays):
+            problems.append("Duplicate relay names")
+        if len(channels) != len(self.channels):
+            problems.append("Duplicate channel names")
+
+        seen = set()
+        for path in self.connection_paths:
+            name = f"{path.src} <--> {path.dest}"
+            for channel in (path.src, path.dest):
+                if channel not in channels:
+                    problems.append(f"Path {name} uses undefined channel {channel}")
+            for relay in path.relays:
+                if relay not in relays:
+                    problems.append(f"Path {name} uses undefined relay {relay}")
+            key = frozenset((path.src, path.dest))
+            if key in seen:
+                problems.append(f"Duplicate path {name}")
+            seen.add(key)
+
+        for entry in self.exclusive_connections:
+            for channel in [entry.src, *entry.dests]:
+                if channel not in channels:
+                    problems.append(
+                        f"Exclusive connection of {entry.src} uses undefined channel {channel}"
+                    )
+
+        init = self.initialization_commands
+        for relay in [*init.open_relays, *init.close_relays]:
+            if relay not in relays:
+                problems.append(f"Initialization command uses undefined relay {relay}")
+
+        for sensor in self.current_sensor_calibration:
+            if sensor not in self.current_sensors:
+                problems.append(f"Calibration for undefined current sensor {sensor}")
+
+        for preset_name, preset in self.presets.items():
+            for connection in preset.connections:
+                name = f"{connection.src} <--> {connection.dest}"
+                if "{" in name:
+                    continue
+                if frozenset((connection.src, connection.dest)) not in seen:
+                    problems.append(f"Preset {preset_name} uses undefined path {name}")
+        return problems
+
+
+@functools.cache
+def _bundled_board(cls: type, device_name: str) -> tuple[BoardConfig, CompiledBoard]:
+    """
+    Load and compile a bundled board, see `BoardConfig.from_device_name`.
+
+    The configuration is private to this cache. It keeps the compiled board alive, so
+    copies of it share the compiled board.
+    """
+    from aliaroaccessoryboards.compiled_board import CompiledBoard
+
+    module = load_compiled_board(device_name)
+    if module is not None:
+        config = cls.from_trusted(module.CONFIG)
+        compiled = CompiledBoard.for_config(
+            config, module.PATH_RELAY_INDICES, module.PATH_MASKS, module.EXCLUSIVE
+        )
+        return config, compiled
+
+    import os
+
+    top_file = os.path.join(os.path.dirname(__file__), "boards", f"{device_name}.brd")
+    config = cls.from_brd_file(top_file)
+    return config, CompiledBoard.for_config(config)
+
+
+def _located_validation_error(
+    title: str, error: EntryConstructionError
+) -> ValidationError:
+    """
+    Report the validation errors of a sequence entry like validating the whole document
+    would, under the index of the entry, with its position in the title.
+    """
+    mark = error.problem_mark
+    if mark is not None:
+        title = f"{title} at line {mark.line + 1}, column {mark.column + 1}"
+    line_errors = []
+    for detail in error.error.errors(include_url=False):
+        line_error = {
+            "type": detail["type"],
+            "loc": (error.key, error.index, *detail["loc"]),
+            "input": detail["input"],
+        }
+        if "ctx" in detail:
+            line_error["ctx"] = detail["ctx"]
+        line_errors.append(line_error)
+    try:
+        return ValidationError.from_exception_data(title, line_errors)
+    except (KeyError, TypeError, ValueError):
+        # Custom error types cannot be recreated, keep the original errors.
+        return error.error
+
+
+# Instance state of a pydantic model, as set by `_construct_unchecked`.
+_MODEL_SLOTS = (
+    "__dict__",
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+)
+
+
+def _construct_unchecked(model: type, **values: Any) -> Any:
+    """
+    Create a model instance from complete field values without validation.
+
+    Equivalent to ``model.model_construct(**values)`` when every field is given, but without
+    its per-field default and alias handling, which makes it about twice as fast. Relies on
+    pydantic internals, see `_unchecked_construction_supported`.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _construct_checked(model: type, **values: Any) -> Any:
+    return model.model_construct(**values)
+
+
+def _unchecked_construction_supported() -> bool:
+    """Whether `_construct_unchecked` builds the same instances as ``model_construct``."""
+    if tuple(BaseModel.__slots__) != _MODEL_SLOTS:
+        return False
+    samples = (
+        (ConnectionPath, {"src": "A", "dest": "B", "relays": ["R1"]}),
+        (CurrentSensorCalibration, {"scale": 2.0, "offset": 1.0}),
+    )
+    try:
+        for model, values in samples:
+            fast = _construct_unchecked(model, **dict(values))
+            reference = model.model_construct(**dict(values))
+            if (
+                fast != reference
+                or fast.model_fields_set != reference.model_fields_set
+                or fast.__pydantic_extra__ != reference.__pydantic_extra__
+                or fast.__pydantic_private__ != reference.__pydantic_private__
+                or fast.model_dump() != reference.model_dump()
+            ):
+                return False
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+    return True
+
+
+# Falls back to model_construct if the installed pydantic stores instance state differently.
+_trusted = (
+    _construct_unchecked if _unchecked_construction_supported() else _construct_checked
+)
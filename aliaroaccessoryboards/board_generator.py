@@ -0,0 +1,162 @@
+"""
+Generator for synthetic board configurations of parameterized topology and size.
+
+Generated boards are deterministic for a given set of arguments and seed, which makes them
+suitable for scale testing and benchmarking::
+
+    python -m aliaroaccessoryboards.board_generator --channels 1024 --buses 4 -o matrix.brd
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import Any
+
+import pydantic_yaml
+
+from aliaroaccessoryboards.board_config import BoardConfig
+
+
+def generate_board_config(
+    dut_channels: int = 32,
+    buses: int = 2,
+    stages: int = 1,
+    outputs: int = 0,
+    bank_size: int = 0,
+    exclusive: bool = True,
+    shuffle_relays: bool = False,
+    seed: int = 0,
+) -> BoardConfig:
+    """
+    Generate a valid board configuration.
+
+    Every DUT channel ``DUT_CHxx`` connects to each first-stage bus ``BUS1_y`` through its
+    own relay. With ``stages`` greater than one, further bus layers ``BUSs_y`` and the
+    output channels ``OUTxx`` are added. Each DUT channel then also has a path to every
+    output, routed through one bus per layer chosen by the seeded random generator, so the
+    relays between bus layers and outputs are shared by many paths.
+
+    :param dut_channels: Number of DUT channels.
+    :param buses: Number of buses per stage.
+    :param stages: Number of switching stages between DUT channels and outputs.
+    :param outputs: Number of output channels. Only used when ``stages`` is greater than one.
+    :param bank_size: If non-zero, DUT channels are grouped in banks of this size and every
+        DUT to bus path also closes a relay shared by its bank.
+    :param exclusive: Make every DUT channel mutually exclusive across the first-stage buses.
+    :param shuffle_relays: Randomize the order of the relays, i.e. their bit positions.
+    :param seed: Seed for the random routing and relay order.
+    :return: The generated configuration.
+    """
+    if dut_channels < 1 or buses < 1 or stages < 1:
+        raise ValueError("dut_channels, buses and stages must be positive")
+    if stages > 1 and outputs < 1:
+        raise ValueError("Multi-stage boards need at least one output")
+
+    rng = random.Random(seed)
+    width = max(2, len(str(dut_channels)))
+    duts = [f"DUT_CH{i:0{width}d}" for i in range(1, dut_channels + 1)]
+    layers = [
+        [f"BUS{stage}_{bus}" for bus in range(1, buses + 1)]
+        for stage in range(1, stages + 1)
+    ]
+    outs = [f"OUT{i:02d}" for i in range(1, outputs + 1)] if stages > 1 else []
+
+    relays: list[str] = []
+    paths: list[dict[str, Any]] = []
+    exclusive_connections: list[dict[str, Any]] = []
+
+    def relay_between(a: str, b: str) -> str:
+        return f"RELAY_{a}_{b}"
+
+    # First stage: DUT channels to the first bus layer, optionally through bank relays.
+    bank_relays = {}
+    if bank_size:
+        for bank in range((dut_channels + bank_size - 1) // bank_size):
+            for bus in layers[0]:
+                bank_relays[bank, bus] = f"RELAY_BANK{bank + 1}_{bus}"
+        relays.extend(bank_relays.values())
+    for index, dut in enumerate(duts):
+        for bus in layers[0]:
+            relay = relay_between(dut, bus)
+            relays.append(relay)
+            path_relays = [relay]
+            if bank_size:
+                path_relays.append(bank_relays[index // bank_size, bus])
+            paths.append({"src": dut, "dest": bus, "relays": path_relays})
+        if exclusive and len(layers[0]) > 1:
+            exclusive_connections.append({"src": dut, "dests": list(layers[0])})
+
+    # Further stages: bus layer to bus layer, and the last layer to the outputs.
+    hops = layers[1:] + ([outs] if outs else [])
+    previous = layers[0]
+    for layer in hops:
+        for a in previous:
+            for b in layer:
+                relays.append(relay_between(a, b))
+        previous = layer
+
+    # Routed paths from every DUT channel to every output.
+    for index, dut in enumerate(duts):
+        for out in outs:
+            route = [dut] + [rng.choice(layer) for layer in layers] + [out]
+            path_relays = [relay_between(a, b) for a, b in zip(route, route[1:])]
+            if bank_size:
+                path_relays.append(bank_relays[index // bank_size, route[1]])
+            paths.append({"src": dut, "dest": out, "relays": path_relays})
+
+    if shuffle_relays:
+        rng.shuffle(relays)
+
+    # The generated data is valid by construction, so pydantic validation is skipped.
+    return BoardConfig.from_trusted(
+        {
+            "relays": relays,
+            "channels": duts + [bus for layer in layers for bus in layer] + outs,
+            "connection_paths": paths,
+            "exclusive_connections": exclusive_connections,
+        }
+    )
+
+
+def dut_channel_names(board_config: BoardConfig) -> list[str]:
+    """Return the DUT channels of a generated board, in order."""
+    return [channel for channel in board_config.channels if channel.startswith("DUT_")]
+
+
+def write_brd_file(board_config: BoardConfig, path: str | Path) -> None:
+    """Write a board configuration to a .brd file."""
+    pydantic_yaml.to_yaml_file(path, board_config)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic .brd file.")
+    parser.add_argument("--channels", type=int, default=32)
+    parser.add_argument("--buses", type=int, default=2)
+    parser.add_argument("--stages", type=int, default=1)
+    parser.add_argument("--outputs", type=int, default=0)
+    parser.add_argument("--bank-size", type=int, default=0)
+    parser.add_argument("--no-exclusive", action="store_true")
+    parser.add_argument("--shuffle-relays", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    write_brd_file(
+        generate_board_config(
+            dut_channels=args.channels,
+            buses=args.buses,
+            stages=args.stages,
+            outputs=args.outputs,
+            bank_size=args.bank_size,
+            exclusive=not args.no_exclusive,
+            shuffle_relays=args.shuffle_relays,
+            seed=args.seed,
+        ),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection, Iterable
+from typing import NamedTuple
+
+import numpy as np
+
+from aliaroaccessoryboards.connection_key import ConnectionKey
+
+
+class BoardState:
+    """
+    Mutable bookkeeping of an `AccessoryBoard`, kept compact for large board fleets.
+
+    Relay use is held as a reference count per relay index in an unsigned 16-bit array, plus
+    an integer mask of the relays in use, so a path can be checked against the relays in use
+    with a single AND. Everything else about the board is in its shared `CompiledBoard`.
+
+    Connections are added and removed with `add_connection` and `remove_connection`, which
+    keep ``peers`` in sync. A channel with a single peer, the common case of a DUT channel
+    connected to a bus, stores the peer name itself instead of a set.
+
+    :ivar connections: The active connections.
+    :ivar peers: The channel each channel is directly connected to, or a set of channels
+        if there are several. Only channels with connections have an entry. Use `peers_of`
+        to read it.
+    :ivar sources: Channels marked as sources.
+    :ivar relay_counts: Number of users per relay index: active connections, or the
+        initialization commands for relays closed on reset.
+    :ivar used_mask: Mask of the relays with a non-zero count.
+    """
+
+    __slots__ = ("connections", "peers", "relay_counts", "sources", "used_mask")
+
+    def __init__(self, relay_count: int):
+        self.connections: set[ConnectionKey] = set()
+        self.peers: dict[str, str | set[str]] = {}
+        self.sources: set[str] = set()
+        self.relay_counts = array("H", bytes(2 * relay_count))
+        self.used_mask = 0
+
+    def add_connection(self, connection_key: ConnectionKey) -> None:
+        """Register an active connection."""
+        self.connections.add(connection_key)
+        channels = tuple(connection_key)
+        first, second = channels[0], channels[-1]
+        self._add_peer(first, second)
+        self._add_peer(second, first)
+
+    def remove_connection(self, connection_key: ConnectionKey) -> None:
+        """Unregister an active connection."""
+        self.connections.remove(connection_key)
+        channels = tuple(connection_key)
+        first, second = channels[0], channels[-1]
+        self._remove_peer(first, second)
+        self._remove_peer(second, first)
+
+    def peers_of(self, channel: str) -> Collection[str]:
+        """Return the channels directly connected to a channel."""
+        peers = self.peers.get(channel)
+        if peers is None:
+            return ()
+        if type(peers) is str:
+            return (peers,)
+        return peers
+
+    def _add_peer(self, channel: str, peer: str) -> None:
+        peers = self.peers.get(channel)
+        if peers is None:
+            self.peers[channel] = peer
+        elif type(peers) is str:
+            if peers != peer:
+                self.peers[channel] = {peers, peer}
+        else:
+            peers.add(peer)
+
+    def _remove_peer(self, channel: str, peer: str) -> None:
+        peers = self.peers.get(channel)
+        if peers is None:
+            return
+        if type(peers) is str:
+            if peers == peer:
+                del self.peers[channel]
+            return
+        peers.discard(peer)
+        if len(peers) == 1:
+            self.peers[channel] = peers.pop()
+
+    def acquire(self, indices: Iterable[int]) -> None:
+        """Count a use of every given relay."""
+        counts = self.relay_counts
+        mask = self.used_mask
+        for idx in indices:
+            counts[idx] += 1
+            mask |= 1 << idx
+        self.used_mask = mask
+
+    def release(self, indices: Iterable[int]) -> int:
+        """
+        Remove a use of every given relay.
+
+        :return: Mask of the relays no longer in use.
+        """
+        counts = self.relay_counts
+        freed = 0
+        for idx in indices:
+            if counts[idx]:
+                counts[idx] -= 1
+                if not counts[idx]:
+                    freed |= 1 << idx
+        self.used_mask &= ~freed
+        return freed
+
+    def clear(self) -> None:
+        """Forget all connections and relay uses. Sources are kept."""
+        self.connections.clear()
+        self.peers.clear()
+        self.relay_counts = array("H", bytes(2 * len(self.relay_counts)))
+        self.used_mask = 0
+
+
+class BoardStateArrays(NamedTuple):
+    """
+    The state of an `AccessoryBoard` as arrays, returned by `AccessoryBoard.state_arrays`.
+
+    :ivar connections: Channel indices into ``BoardConfig.channels`` of the source and
+        destination of each active connection, shape ``(connections, 2)``, in path order.
+    :ivar relay_mask: The relay mask as little-endian bytes, so
+        ``np.unpackbits(relay_mask, bitorder="little")`` gives the state of relay ``n`` at
+        index ``n``.
+    """
+
+    connections: np.ndarray
+    relay_mask: np.ndarray
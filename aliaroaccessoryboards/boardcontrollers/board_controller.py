@@ -1,9 +1,17 @@
+from __future__ import annotations
+
 import math
-from abc import abstractmethod, ABC
+import threading
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Union
 
+import numpy as np
+
+from aliaroaccessoryboards.actuation_counters import ActuationCounters
 from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.metrics import Metrics
 
 
 class BoardController(ABC):
@@ -15,14 +23,27 @@ class BoardController(ABC):
     with managing relay states and committing relay changes to the device.
     """
 
-    def __init__(self, board_config: Union[str, Path, BoardConfig]):
+    def __init__(self, board_config: str | Path | BoardConfig):
         if not isinstance(board_config, BoardConfig):
             board_config = BoardConfig.from_brd_file(board_config)
-        self.relay_count = len(board_config.relays)
-        self.current_count = len(board_config.current_sensors)
+        # Shared with every other board and controller using the same config.
+        self.compiled_board = CompiledBoard.for_config(board_config)
+        self.relay_count = len(self.compiled_board.relays)
+        self.current_count = len(self.compiled_board.current_sensors)
+        self.current_sensors = self.compiled_board.current_sensors
+        self._current_scale = self.compiled_board.current_scale
+        self._current_offset = self.compiled_board.current_offset
         self._relay_buffer_size = math.ceil(self.relay_count / 4)
-        self._relay_state_buffer = [False] * self.relay_count
+        # Relay states set since the last commit, one bit per relay.
+        self._relay_buffer_mask = 0
         self._pending_commit = False
+        self._last_relay_mask = 0
+        # Serializes transactions on the bus, e.g. relay commits against current sampling.
+        self.bus_lock = threading.RLock()
+        # Set to record performance metrics, see AccessoryBoard.enable_metrics.
+        self.metrics: Metrics | None = None
+        # Set to count relay transitions, see AccessoryBoard.enable_actuation_counters.
+        self.actuation_counters: ActuationCounters | None = None
 
     @abstractmethod
     def read_relays_from_device(self) -> int: ...
@@ -31,31 +52,134 @@ class BoardController(ABC):
     def write_relays_to_device(self, relay_mask: int): ...
 
     @abstractmethod
-    def read_currents_from_device(self) -> List[int]: ...
+    def read_currents_from_device(self) -> list[int]: ...
+
+    def read_currents_raw(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Read the raw current sensor values as an ``int16`` array.
+
+        Controllers that receive the readings as bytes override this to return a view over
+        the received buffer instead of building Python integers.
+
+        :param out: Optional ``int16`` array of length ``current_count`` to fill.
+        :return: ``out`` if given, otherwise a new array.
+        """
+        readings = self.read_currents_from_device()
+        if out is None:
+            return np.asarray(readings, dtype=np.int16)
+        out[:] = readings
+        return out
+
+    def read_currents(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Read the current sensors and apply the calibration declared in the board config.
+
+        :param out: Optional ``float64`` array of length ``current_count`` to fill.
+        :return: The calibrated readings, in the order of ``current_sensors``.
+        """
+        raw = self.read_currents_raw()
+        out = np.multiply(raw, self._current_scale, out=out)
+        out += self._current_offset
+        return out
 
     @property
-    def relays(self) -> List[bool]:
+    def relays(self) -> list[bool]:
         if self._pending_commit:
             raise RuntimeError(
                 "Relay state is pending commit. Commit relays before reading."
             )
-        raw = self.read_relays_from_device()
+        metrics = self.metrics
+        if metrics is None:
+            with self.bus_lock:
+                raw = self.read_relays_from_device()
+        else:
+            with metrics.measure("relay_read"), self.bus_lock:
+                raw = self.read_relays_from_device()
+        self._last_relay_mask = raw
         states = []
         for idx in range(self.relay_count):
             states.append(bool(raw & 1 << idx))
         return states
 
+    @property
+    def last_relay_mask(self) -> int:
+        """
+        The relay mask most recently written to or read from the device.
+
+        Unlike `relays`, this does not access the device.
+        """
+        return self._last_relay_mask
+
+    @property
+    def _relay_state_buffer(self) -> list[bool]:
+        """The buffered relay states as one bool per relay."""
+        mask = self._relay_buffer_mask
+        return [bool(mask >> idx & 1) for idx in range(self.relay_count)]
+
     def set_relay(self, index: int, value: bool):
-        self._relay_state_buffer[index] = value
+        if not 0 <= index < self.relay_count:
+            raise IndexError(f"Relay index out of range: {index}")
+        if value:
+            self._relay_buffer_mask |= 1 << index
+        else:
+            self._relay_buffer_mask &= ~(1 << index)
         self._pending_commit = True
 
+    def set_relays(self, relay_mask: int, value: bool):
+        """Set every relay in a mask, bit ``n`` corresponding to relay ``n``."""
+        if relay_mask >> self.relay_count or relay_mask < 0:
+            raise IndexError(f"Relay mask out of range: {relay_mask:#x}")
+        if value:
+            self._relay_buffer_mask |= relay_mask
+        else:
+            self._relay_buffer_mask &= ~relay_mask
+        self._pending_commit = True
+
+    def replace_relay_buffer(self, relay_mask: int) -> None:
+        """
+        Replace the buffered relay states with a mask, discarding changes not committed.
+
+        :param relay_mask: The relay states, bit ``n`` corresponding to relay ``n``.
+        :return: None
+        """
+        if relay_mask >> self.relay_count or relay_mask < 0:
+            raise IndexError(f"Relay mask out of range: {relay_mask:#x}")
+        self._relay_buffer_mask = relay_mask
+        self._pending_commit = False
+
     def set_all_relays(self, value: bool):
-        self._relay_state_buffer = [value] * self.relay_count
+        self._relay_buffer_mask = (1 << self.relay_count) - 1 if value else 0
         self._pending_commit = True
 
     def commit_relays(self) -> None:
-        raw = 0
-        for idx, state in enumerate(self._relay_state_buffer):
-            raw = raw | state << idx
-        self.write_relays_to_device(raw)
+        metrics = self.metrics
+        if metrics is None:
+            self._commit_relays()
+        else:
+            with metrics.measure("commit"):
+                self._commit_relays()
+
+    def _build_relay_mask(self) -> int:
+        return self._relay_buffer_mask
+
+    def _commit_relays(self) -> None:
+        raw = self._build_relay_mask()
+        metrics = self.metrics
+        with self.bus_lock:
+            if metrics is None:
+                self.write_relays_to_device(raw)
+            else:
+                start = time.perf_counter()
+                self.write_relays_to_device(raw)
+                metrics.observe("device_write_seconds", time.perf_counter() - start)
+                metrics.increment("device_write_total")
+                metrics.increment("bytes_written_total", self._relay_buffer_size)
+            self._relay_mask_written(raw)
         self._pending_commit = False
+
+    def _relay_mask_written(self, raw: int) -> None:
+        """Record a relay mask written to the device, counting the relay transitions."""
+        counters = self.actuation_counters
+        if counters is not None:
+            counters.record(self._last_relay_mask, raw)
+        self._last_relay_mask = raw
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+import struct
+import time
+from collections.abc import Sequence
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
+    I2CDriverBoardController,
+)
+
+
+class EmulatedBoardDevice:
+    """
+    Register-level model of an accessory board as seen from the I2C bus.
+
+    Implements the ``READ_CURRENT``, ``READ_RELAYS`` and ``WRITE_RELAYS`` registers used by
+    `I2CDriverBoardController`.
+
+    :ivar relay_bytes: The relay state as last written, little-endian.
+    :ivar currents: Current sensor readings returned from ``READ_CURRENT``.
+    """
+
+    def __init__(self, relay_buffer_size: int, current_count: int):
+        self.relay_bytes = bytearray(relay_buffer_size)
+        self.currents = [0] * current_count
+
+    @classmethod
+    def from_board_config(cls, board_config: BoardConfig) -> EmulatedBoardDevice:
+        return cls(
+            math.ceil(len(board_config.relays) / 4), len(board_config.current_sensors)
+        )
+
+    @property
+    def relay_mask(self) -> int:
+        return int.from_bytes(self.relay_bytes, byteorder="little")
+
+    def read_register(self, register: int, length: int) -> bytes:
+        if register == I2CDriverBoardController.READ_RELAYS:
+            data = bytes(self.relay_bytes)
+        elif register == I2CDriverBoardController.READ_CURRENT:
+            data = struct.pack(f"<{len(self.currents)}h", *self.currents)
+        else:
+            raise ValueError(f"Register {register} is not readable")
+        return data[:length].ljust(length, b"\x00")
+
+    def write_register(self, register: int, data: bytes) -> None:
+        if register != I2CDriverBoardController.WRITE_RELAYS:
+            raise ValueError(f"Register {register} is not writable")
+        if len(data) != len(self.relay_bytes):
+            raise ValueError(
+                f"Expected {len(self.relay_bytes)} relay bytes, received {len(data)}"
+            )
+        self.relay_bytes[:] = data
+
+
+class EmulatedI2CDriver:
+    """
+    Stand-in for an `i2cdriver.I2CDriver` with emulated devices attached.
+
+    Implements the ``regrd``/``regwr`` calls used by `I2CDriverBoardController` with the same
+    argument handling as the real driver, so the controller can be exercised and
+    benchmarked without hardware.
+
+    Bus timing is modeled as ``transaction_time`` per transaction plus ``byte_time`` per
+    byte on the bus (address, register and data bytes). The modeled time is accumulated in
+    ``bus_time`` and, unless ``sleep`` is False, also spent by sleeping.
+
+    :ivar transactions: Number of register reads and writes issued.
+    :ivar bytes_written: Data bytes written to devices.
+    :ivar bytes_read: Data bytes read from devices.
+    :ivar bus_time: Total modeled bus time in seconds.
+    """
+
+    def __init__(
+        self,
+        byte_time: float = 0.0,
+        transaction_time: float = 0.0,
+        sleep: bool = True,
+    ):
+        self.byte_time = byte_time
+        self.transaction_time = transaction_time
+        self.sleep = sleep
+        self.devices: dict[int, EmulatedBoardDevice] = {}
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.bus_time = 0.0
+
+    def attach(self, address: int, device: EmulatedBoardDevice) -> EmulatedBoardDevice:
+        """Attach a device to the bus at the given 7-bit address."""
+        self.devices[address] = device
+        return device
+
+    def _device(self, dev: int) -> EmulatedBoardDevice:
+        try:
+            return self.devices[dev]
+        except KeyError:
+            raise OSError(f"No device acknowledged address {dev:#04x}") from None
+
+    def _transfer(self, bus_bytes: int) -> None:
+        self.transactions += 1
+        duration = self.transaction_time + bus_bytes * self.byte_time
+        self.bus_time += duration
+        if self.sleep and duration > 0:
+            time.sleep(duration)
+
+    def regrd(self, dev: int, reg: int, fmt: str | int = "B"):
+        if isinstance(fmt, str):
+            r = struct.unpack(fmt, self.regrd(dev, reg, struct.calcsize(fmt)))
+            return r[0] if len(r) == 1 else r
+        data = self._device(dev).read_register(reg, fmt)
+        # Address + register, repeated-start address, then the data.
+        self._transfer(3 + fmt)
+        self.bytes_read += fmt
+        return data
+
+    def regwr(self, dev: int, reg: int, vv: int | bytes | Sequence[int]) -> bool:
+        if isinstance(vv, int):
+            vv = struct.pack("B", vv)
+        data = bytes(vv)
+        self._device(dev).write_register(reg, data)
+        # Address + register, then the data.
+        self._transfer(2 + len(data))
+        self.bytes_written += len(data)
+        return True
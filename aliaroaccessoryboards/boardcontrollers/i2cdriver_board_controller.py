@@ -1,6 +1,8 @@
-from time import sleep
-from typing import List
+from __future__ import annotations
 
+from time import perf_counter, sleep
+
+import numpy as np
 from i2cdriver import I2CDriver
 
 from aliaroaccessoryboards.board_config import BoardConfig
@@ -17,11 +19,22 @@ class I2CDriverBoardController(BoardController):
     WRITE_RELAYS = 160
 
     def __init__(
-        self, i2c_driver: I2CDriver, device_address: int, board_config: BoardConfig
+        self,
+        i2c_driver: I2CDriver,
+        device_address: int,
+        board_config: BoardConfig,
+        settle_time: float = 0.04,
     ):
+        """
+        :param i2c_driver: The I2CDriver (or a compatible object) the board is attached to.
+        :param device_address: 7-bit I2C address of the board.
+        :param board_config: The configuration of the board.
+        :param settle_time: Seconds to wait after writing the relays for them to settle.
+        """
         super().__init__(board_config)
         self._device_address = device_address
         self._i2c_driver = i2c_driver
+        self.settle_time = settle_time
 
     def read_relays_from_device(self) -> int:
         return self._i2c_driver.regrd(self._device_address, self.READ_RELAYS, "<Q")
@@ -32,9 +45,30 @@ class I2CDriverBoardController(BoardController):
             self.WRITE_RELAYS,
             relay_mask.to_bytes(self._relay_buffer_size, byteorder="little"),
         )
-        sleep(0.04)
+        self._settle()
+
+    def _settle(self) -> None:
+        if self.settle_time <= 0:
+            return
+        if self.metrics is None:
+            sleep(self.settle_time)
+            return
+        start = perf_counter()
+        sleep(self.settle_time)
+        self.metrics.observe("settle_seconds", perf_counter() - start)
+        self.metrics.increment("settle_total")
 
-    def read_currents_from_device(self) -> List[int]:
+    def read_currents_from_device(self) -> list[int]:
         return self._i2c_driver.regrd(
             self._device_address, self.READ_CURRENT, f"{self.current_count}h"
         )
+
+    def read_currents_raw(self, out: np.ndarray | None = None) -> np.ndarray:
+        raw = self._i2c_driver.regrd(
+            self._device_address, self.READ_CURRENT, self.current_count * 2
+        )
+        readings = np.frombuffer(raw, dtype="<i2")
+        if out is None:
+            return readings
+        out[:] = readings
+        return out
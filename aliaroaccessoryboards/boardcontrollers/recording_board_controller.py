@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
+
+DEVICE = "device"
+OPERATION = "operation"
+
+# AccessoryBoard methods captured by RecordingBoardController.attach.
+RECORDED_OPERATIONS = (
+    "connect_channels",
+    "disconnect_channels",
+    "try_connect",
+    "try_disconnect",
+    "register_preset",
+    "apply_preset",
+    "disconnect_all_channels",
+    "reset",
+    "mark_as_source",
+    "unmark_as_source",
+)
+
+
+class RecordedEvent(NamedTuple):
+    """
+    A device call or board operation captured in a `RecordedSession`.
+
+    :ivar kind: ``"device"`` for controller device calls, ``"operation"`` for board operations.
+    :ivar name: Name of the called method.
+    :ivar args: Positional arguments of the call.
+    :ivar result: Return value of device reads.
+    :ivar error: Type name of the exception raised by the call, if any.
+    :ivar time: Start of the call, in seconds since the recording started.
+    :ivar duration: Duration of the call in seconds.
+    :ivar kwargs: Keyword arguments of the call.
+    """
+
+    kind: str
+    name: str
+    args: tuple
+    result: Any
+    error: str | None
+    time: float
+    duration: float
+    kwargs: dict[str, Any]
+
+
+class RecordedSession:
+    """
+    Device calls and board operations captured by a `RecordingBoardController`.
+
+    :ivar events: The events in the order they started.
+    :ivar sources: Channels marked as sources when the board was attached.
+    """
+
+    def __init__(
+        self,
+        events: list[RecordedEvent] | None = None,
+        sources: list[str] | None = None,
+    ):
+        self.events: list[RecordedEvent] = list(events or [])
+        self.sources: list[str] = list(sources or [])
+
+    @property
+    def device_events(self) -> list[RecordedEvent]:
+        return [event for event in self.events if event.kind == DEVICE]
+
+    @property
+    def operations(self) -> list[RecordedEvent]:
+        return [event for event in self.events if event.kind == OPERATION]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sources": self.sources,
+            "events": [event._asdict() for event in self.events],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RecordedSession:
+        return cls(
+            [
+                RecordedEvent(**{"kwargs": {}, **event, "args": tuple(event["args"])})
+                for event in data["events"]
+            ],
+            data.get("sources", []),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the session to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> RecordedSession:
+        """Read a session from a JSON file written by `save`."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+class RecordingBoardController(BoardController):
+    """
+    Board controller that forwards to another controller and records every device call.
+
+    Relay writes, relay reads and current reads are captured with their arguments, results
+    and timing. Attaching an `AccessoryBoard` also captures its operations, so the session
+    can be replayed against the board logic with a `ReplayBoardController`::
+
+        controller = RecordingBoardController(I2CDriverBoardController(...), board_config)
+        board = AccessoryBoard(board_config, controller)
+        controller.attach(board)
+        ...
+        controller.session.save("session.json")
+    """
+
+    def __init__(
+        self, controller: BoardController, board_config: str | Path | BoardConfig
+    ):
+        """
+        :param controller: The controller that performs the device calls.
+        :param board_config: The configuration of the board.
+        """
+        super().__init__(board_config)
+        self.controller = controller
+        self.session = RecordedSession()
+        self._start = time.perf_counter()
+        self._read_relays = self._recorder(
+            DEVICE, "read_relays_from_device", controller.read_relays_from_device
+        )
+        self._write_relays = self._recorder(
+            DEVICE, "write_relays_to_device", controller.write_relays_to_device
+        )
+        self._read_currents = self._recorder(
+            DEVICE, "read_currents_from_device", controller.read_currents_from_device
+        )
+
+    def attach(self, board) -> None:
+        """
+        Record the operations of a board using this controller.
+
+        The operation methods are replaced on the board instance by recording wrappers.
+        The sources already marked on the board are stored in the session.
+
+        :param board: The AccessoryBoard to record.
+        :return: None
+        """
+        self.session.sources = sorted(board._source_channels)
+        for name in RECORDED_OPERATIONS:
+            setattr(board, name, self._recorder(OPERATION, name, getattr(board, name)))
+
+    def _recorder(self, kind: str, name: str, method):
+        events = self.session.events
+        perf_counter = time.perf_counter
+
+        def record(*args, **kwargs):
+            start = perf_counter()
+            result = error = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                events.append(
+                    RecordedEvent(
+                        kind,
+                        name,
+                        args,
+                        result if kind == DEVICE else None,
+                        error,
+                        start - self._start,
+                        perf_counter() - start,
+                        kwargs,
+                    )
+                )
+
+        return record
+
+    def read_relays_from_device(self) -> int:
+        return self._read_relays()
+
+    def write_relays_to_device(self, relay_mask: int):
+        self._write_relays(relay_mask)
+
+    def read_currents_from_device(self) -> list[int]:
+        return list(self._read_currents())
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
+from aliaroaccessoryboards.boardcontrollers.recording_board_controller import (
+    RecordedSession,
+)
+from aliaroaccessoryboards.exceptions import AccessoryBoardException
+
+ORIGINAL = "original"
+ZERO = "zero"
+
+
+class ReplayBoardController(BoardController):
+    """
+    Board controller that serves the device calls of a `RecordedSession`.
+
+    Reads return the recorded results. Every relay read and write is compared with the next
+    recorded one; calls in a different order and relay writes with a different mask are
+    collected in ``mismatches`` rather than raised, so a replay reports all behavior changes
+    at once. Current reads are not driven by the board and are served in recorded order
+    whenever they are made.
+
+    With ``timing="original"`` every call takes as long as its recorded counterpart,
+    modelling the latency of the recorded hardware. With ``timing="zero"`` calls return
+    immediately.
+
+    :ivar mismatches: Descriptions of the calls that did not match the recording.
+    """
+
+    def __init__(
+        self,
+        board_config: str | Path | BoardConfig,
+        session: RecordedSession,
+        timing: str = ZERO,
+    ):
+        """
+        :param board_config: The configuration of the recorded board.
+        :param session: The recorded session.
+        :param timing: ``"original"`` or ``"zero"``.
+        """
+        super().__init__(board_config)
+        if timing not in (ORIGINAL, ZERO):
+            raise ValueError(f"Invalid timing: {timing}")
+        self.timing = timing
+        self.mismatches: list[str] = []
+        self._events = [
+            event
+            for event in session.device_events
+            if event.name != "read_currents_from_device"
+        ]
+        self._position = 0
+        self._current_events = iter(
+            [
+                event
+                for event in session.device_events
+                if event.name == "read_currents_from_device"
+            ]
+        )
+        self._device_mask = 0
+        self._device_currents = [0] * self.current_count
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded relay reads and writes not replayed yet."""
+        return len(self._events) - self._position
+
+    def _next(self, name: str, *args):
+        if self._position >= len(self._events):
+            self.mismatches.append(f"Unexpected {name}{args} after end of recording")
+            return None
+        index = self._position
+        event = self._events[index]
+        self._position += 1
+        if event.name != name:
+            self.mismatches.append(
+                f"Call {index}: expected {event.name}{event.args}, got {name}{args}"
+            )
+            return None
+        if event.args != args:
+            self.mismatches.append(
+                f"Call {index}: expected {name}{event.args}, got {name}{args}"
+            )
+        return self._replay(event)
+
+    def _replay(self, event):
+        if self.timing == ORIGINAL:
+            time.sleep(event.duration)
+        if event.error is not None:
+            raise OSError(f"Recorded {event.error} in {event.name}")
+        return event
+
+    def read_relays_from_device(self) -> int:
+        event = self._next("read_relays_from_device")
+        if event is not None:
+            self._device_mask = event.result
+        return self._device_mask
+
+    def write_relays_to_device(self, relay_mask: int):
+        self._next("write_relays_to_device", relay_mask)
+        self._device_mask = relay_mask
+
+    def read_currents_from_device(self) -> list[int]:
+        event = next(self._current_events, None)
+        if event is not None:
+            self._replay(event)
+            self._device_currents = list(event.result)
+        return self._device_currents
+
+
+class ReplayResult(NamedTuple):
+    """
+    Outcome of `replay_session`.
+
+    :ivar operations: Number of board operations replayed.
+    :ivar elapsed: Wall time of the replay in seconds, including board construction.
+    :ivar operation_seconds: Time spent within board operations in seconds.
+    :ivar mismatches: Device calls and operation outcomes that differ from the recording.
+    """
+
+    operations: int
+    elapsed: float
+    operation_seconds: float
+    mismatches: list[str]
+
+
+def replay_session(
+    board_config: str | Path | BoardConfig,
+    session: RecordedSession,
+    timing: str = ZERO,
+    reset: bool = True,
+) -> ReplayResult:
+    """
+    Replay the board operations of a recorded session against a new AccessoryBoard.
+
+    With ``timing="original"`` the operations are also started at their recorded offsets,
+    so the replay reproduces the pacing of the recorded session.
+
+    :param board_config: The configuration of the recorded board.
+    :param session: The recorded session.
+    :param timing: ``"original"`` or ``"zero"``, see `ReplayBoardController`.
+    :param reset: Whether the recorded board was constructed with ``reset=True``.
+    :return: Timing of the replay and the differences from the recording.
+    """
+    controller = ReplayBoardController(board_config, session, timing)
+    mismatches = controller.mismatches
+    start = time.perf_counter()
+    board = AccessoryBoard(board_config, controller, reset=reset)
+    for source in session.sources:
+        board.mark_as_source(source)
+
+    operations = session.operations
+    operation_seconds = 0.0
+    for index, event in enumerate(operations):
+        if timing == ORIGINAL:
+            delay = event.time - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        error = None
+        operation_start = time.perf_counter()
+        try:
+            getattr(board, event.name)(*event.args, **event.kwargs)
+        except (
+            AccessoryBoardException,
+            LookupError,
+            RuntimeError,
+            TypeError,
+            ValueError,
+        ) as e:
+            error = type(e).__name__
+        operation_seconds += time.perf_counter() - operation_start
+        if error != event.error:
+            mismatches.append(
+                f"Operation {index} {event.name}{event.args}: "
+                f"recorded {event.error or 'success'}, replayed {error or 'success'}"
+            )
+    elapsed = time.perf_counter() - start
+
+    if controller.remaining:
+        mismatches.append(
+            f"{controller.remaining} recorded relay reads and writes not replayed"
+        )
+    return ReplayResult(len(operations), elapsed, operation_seconds, mismatches)
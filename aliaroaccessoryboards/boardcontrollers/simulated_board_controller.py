@@ -1,8 +1,12 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
 from pathlib import Path
-from typing import List, Union
+from time import perf_counter, sleep
 
-from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
 from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
 
 
 class SimulatedBoardController(BoardController):
@@ -12,25 +16,90 @@ class SimulatedBoardController(BoardController):
     This class provides a mock implementation of a board controller by simulating relay
     states and current measurements.
 
+    The relay state is held as an integer mask, like on the device. By default every call
+    completes instantly; the latency parameters add a simulated bus time to device calls and
+    a settle time after relay writes, each extended by a random jitter, so timing-sensitive
+    code can be evaluated without hardware.
+
     This class is primarily used in contexts where hardware access is not available or when testing control logic.
+
+    :ivar device_relay_mask: The simulated relay state of the device.
+    :ivar device_currents: The simulated current sensor readings.
     """
 
-    def __init__(self, board_config: Union[str, Path, BoardConfig]):
+    def __init__(
+        self,
+        board_config: str | Path | BoardConfig,
+        write_latency: float = 0.0,
+        read_latency: float = 0.0,
+        settle_time: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+    ):
+        """
+        :param board_config: The configuration of the board.
+        :param write_latency: Seconds a relay write takes, excluding settling.
+        :param read_latency: Seconds a relay or current read takes.
+        :param settle_time: Seconds to wait after writing the relays for them to settle.
+        :param jitter: Upper bound of a uniformly distributed random delay, in seconds,
+            added to every non-zero latency and settle time.
+        :param seed: Seed for the jitter, for reproducible timing.
+        """
         super().__init__(board_config)
-        self.device_relays = [False] * self.relay_count
+        self.device_relay_mask = 0
         self.device_currents = [0] * self.current_count
+        self.write_latency = write_latency
+        self.read_latency = read_latency
+        self.settle_time = settle_time
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    @property
+    def device_relays(self) -> tuple[bool, ...]:
+        """
+        The simulated relay state as one bool per relay.
+
+        This is a snapshot of ``device_relay_mask``. Assign a new sequence, or change the
+        mask, to change the state.
+        """
+        mask = self.device_relay_mask
+        return tuple(bool(mask >> i & 1) for i in range(self.relay_count))
+
+    @device_relays.setter
+    def device_relays(self, states: Sequence[bool]) -> None:
+        mask = 0
+        for i, state in enumerate(states):
+            if state:
+                mask |= 1 << i
+        self.device_relay_mask = mask
+
+    def _delay(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if self.jitter > 0:
+            seconds += self._random.uniform(0, self.jitter)
+        sleep(seconds)
 
     def read_relays_from_device(self) -> int:
-        relay_mask = 0
-        for i, relay in enumerate(self.device_relays):
-            if relay:
-                relay_mask |= 1 << i  # Set the bit at position i
-        return relay_mask
+        self._delay(self.read_latency)
+        return self.device_relay_mask
 
     def write_relays_to_device(self, relay_mask: int):
-        self.device_relays = [
-            (relay_mask & (1 << i)) > 0 for i in range(len(self.device_relays))
-        ]
+        self._delay(self.write_latency)
+        self.device_relay_mask = relay_mask
+        self._settle()
+
+    def _settle(self) -> None:
+        if self.settle_time <= 0:
+            return
+        if self.metrics is None:
+            self._delay(self.settle_time)
+            return
+        start = perf_counter()
+        self._delay(self.settle_time)
+        self.metrics.observe("settle_seconds", perf_counter() - start)
+        self.metrics.increment("settle_total")
 
-    def read_currents_from_device(self) -> List[int]:
+    def read_currents_from_device(self) -> list[int]:
+        self._delay(self.read_latency)
         return self.device_currents
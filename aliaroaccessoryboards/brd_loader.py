@@ -0,0 +1,363 @@
+"""
+Streaming loader for ``.brd`` board definitions.
+
+The document is read as a stream of parser events instead of being composed into a node
+tree first. Entries of large sequences such as ``connection_paths`` are handed to a
+constructor as soon as they are complete, so only the constructed objects are held in
+memory, not the YAML nodes of the whole file. The C-accelerated libyaml parser is used when
+PyYAML was built with it.
+
+Plain scalars are resolved with the YAML 1.2 core schema, like ``pydantic_yaml`` does, so
+names such as ``ON`` or ``NO`` stay strings. Duplicate mapping keys are an error.
+
+Repetitive entries of any sequence can be written as a template, which is expanded while
+loading::
+
+    relays:
+    - foreach: {ch: 1..32, pol: [NEG, POS]}
+      items:
+      - RELAY_CH{ch:02d}_{pol}
+
+``foreach`` maps variable names to their values, either a list or an inclusive integer range
+``first..last``. ``items`` is repeated for every combination of the values, the last variable
+changing fastest, with the variables substituted into every string by `str.format`.
+Templates may be nested in the items; the inner templates also see the outer variables.
+Strings with braces must be written in block style or quoted, as braces are YAML flow
+indicators.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from collections.abc import Iterator, Mapping
+from typing import IO, Any, Callable
+
+import yaml
+from yaml.constructor import ConstructorError
+from yaml.events import (
+    AliasEvent,
+    DocumentEndEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from yaml.nodes import ScalarNode
+
+try:
+    from yaml import CSafeLoader as _Loader
+
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+    LIBYAML = False
+
+_STR_TAG = "tag:yaml.org,2002:str"
+
+# YAML 1.2 core schema.
+_NULL = re.compile(r"^(?:~|null|Null|NULL|)$")
+_BOOL = {"true": True, "True": True, "TRUE": True}
+_BOOL.update({"false": False, "False": False, "FALSE": False})
+_INT = re.compile(r"^[-+]?[0-9]+$")
+_OCT = re.compile(r"^0o[0-7]+$")
+_HEX = re.compile(r"^0x[0-9a-fA-F]+$")
+_FLOAT = re.compile(r"^[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?$")
+_SPECIAL_FLOATS = {
+    ".inf": float("inf"),
+    ".Inf": float("inf"),
+    ".INF": float("inf"),
+    "+.inf": float("inf"),
+    "+.Inf": float("inf"),
+    "+.INF": float("inf"),
+    "-.inf": float("-inf"),
+    "-.Inf": float("-inf"),
+    "-.INF": float("-inf"),
+    ".nan": float("nan"),
+    ".NaN": float("nan"),
+    ".NAN": float("nan"),
+}
+
+
+def resolve_plain_scalar(value: str) -> Any:
+    """Convert an untagged, unquoted scalar according to the YAML 1.2 core schema."""
+    if _NULL.match(value):
+        return None
+    if value in _BOOL:
+        return _BOOL[value]
+    if _INT.match(value):
+        return int(value)
+    if _OCT.match(value):
+        return int(value, 8)
+    if _HEX.match(value):
+        return int(value, 16)
+    if _FLOAT.match(value):
+        return float(value)
+    return _SPECIAL_FLOATS.get(value, value)
+
+
+FOREACH = "foreach"
+ITEMS = "items"
+_RANGE = re.compile(r"^\s*(-?[0-9]+)\s*\.\.\s*(-?[0-9]+)\s*$")
+
+
+def is_template(entry: Any) -> bool:
+    """Whether a sequence entry is a template to expand."""
+    return type(entry) is dict and FOREACH in entry
+
+
+def expand_template(
+    template: Mapping[str, Any], variables: Mapping[str, Any] | None = None
+) -> Iterator[Any]:
+    """
+    Expand a template entry.
+
+    :param template: A mapping with ``foreach`` and ``items`` keys.
+    :param variables: Values of the variables of enclosing templates.
+    :raises yaml.YAMLError: The template is malformed or uses an undefined variable.
+    :return: An iterator over the expanded entries.
+    """
+    if set(template) != {FOREACH, ITEMS}:
+        raise yaml.YAMLError(
+            f"Template must have exactly the keys {FOREACH} and {ITEMS}: {template}"
+        )
+    loops = template[FOREACH]
+    items = template[ITEMS]
+    if type(loops) is not dict or not loops:
+        raise yaml.YAMLError(f"{FOREACH} must map variable names to values: {loops}")
+    if type(items) is not list:
+        raise yaml.YAMLError(f"{ITEMS} must be a list: {items}")
+
+    names = list(loops)
+    values = [_loop_values(name, loops[name]) for name in names]
+    for combination in itertools.product(*values):
+        scope = dict(variables or {})
+        scope.update(zip(names, combination))
+        for item in items:
+            if is_template(item):
+                yield from expand_template(item, scope)
+            else:
+                yield _substitute(item, scope)
+
+
+def _loop_values(name: str, values: Any) -> list[Any]:
+    if type(values) is list:
+        return values
+    match = _RANGE.match(values) if type(values) is str else None
+    if match is None:
+        raise yaml.YAMLError(
+            f"Values of {name} must be a list or a range first..last: {values}"
+        )
+    first, last = int(match.group(1)), int(match.group(2))
+    return list(range(first, last + 1) if first <= last else range(first, last - 1, -1))
+
+
+def _substitute(value: Any, scope: Mapping[str, Any]) -> Any:
+    cls = type(value)
+    if cls is str:
+        if "{" not in value:
+            return value
+        try:
+            return value.format_map(scope)
+        except (KeyError, IndexError, ValueError) as e:
+            raise yaml.YAMLError(f"Cannot expand {value!r}: {e!r}") from None
+    if cls is list:
+        result = []
+        for item in value:
+            if is_template(item):
+                result.extend(expand_template(item, scope))
+            else:
+                result.append(_substitute(item, scope))
+        return result
+    if cls is dict:
+        return {
+            _substitute(key, scope): _substitute(item, scope)
+            for key, item in value.items()
+        }
+    return value
+
+
+class EntryConstructionError(yaml.MarkedYAMLError):
+    """
+    An item constructor failed on an entry of a sequence.
+
+    :ivar key: Mapping key of the sequence.
+    :ivar index: Index of the entry in the loaded sequence, after template expansion.
+    :ivar error: The exception raised by the constructor.
+    """
+
+    def __init__(self, key: Any, index: int, mark: Any, error: Exception):
+        super().__init__(
+            problem=f"cannot construct entry {index} of {key}: {error}",
+            problem_mark=mark,
+        )
+        self.key = key
+        self.index = index
+        self.error = error
+
+
+class _EventReader:
+    def __init__(self, loader, item_constructors: Mapping[str, Callable[[Any], Any]]):
+        self.loader = loader
+        self.item_constructors = item_constructors
+        self.anchors: dict[str, Any] = {}
+        # Plain scalars repeat a lot, e.g. relay and channel names, so they are resolved
+        # once and the same object is reused.
+        self.plain: dict[str, Any] = {}
+        # Number of sequences being parsed, and whether a template was found within the
+        # current entry of the outermost one.
+        self.depth = 0
+        self.pending = False
+
+    def document(self) -> Any:
+        loader = self.loader
+        loader.get_event()  # StreamStartEvent
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return None
+        loader.get_event()
+        data = None if loader.check_event(DocumentEndEvent) else self.value()
+        loader.get_event()
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise yaml.YAMLError("Expected a single document in the board definition")
+        return data
+
+    def value(self, key: Any = None) -> Any:
+        event = self.loader.get_event()
+        cls = type(event)
+        if cls is ScalarEvent:
+            result = self.scalar(event)
+        elif cls is MappingStartEvent:
+            result = self.mapping(event)
+        elif cls is SequenceStartEvent:
+            result = self.sequence(event, key, self.item_constructors.get(key))
+        elif cls is AliasEvent:
+            if event.anchor not in self.anchors:
+                raise yaml.YAMLError(f"Undefined alias {event.anchor}")
+            return self.anchors[event.anchor]
+        else:
+            raise yaml.YAMLError(f"Unexpected {event}")
+        if event.anchor is not None:
+            self.anchors[event.anchor] = result
+        return result
+
+    def scalar(self, event: ScalarEvent) -> Any:
+        value = event.value
+        # libyaml reports plain scalars with an empty style, the Python parser with None.
+        if not event.style and event.implicit[0]:
+            result = self.plain.get(value, self)
+            if result is self:
+                result = self.plain[value] = resolve_plain_scalar(value)
+            return result
+        if event.tag in (None, "!", _STR_TAG):
+            return value
+        node = ScalarNode(event.tag, value, style=event.style)
+        return self.loader.construct_object(node, deep=True)
+
+    def mapping(self, event: MappingStartEvent) -> dict[Any, Any]:
+        loader = self.loader
+        result = {}
+        while not loader.check_event(MappingEndEvent):
+            mark = loader.peek_event().start_mark
+            key = self.value()
+            if key in result:
+                raise ConstructorError(
+                    "while constructing a mapping",
+                    event.start_mark,
+                    f"found duplicate key {key!r}",
+                    mark,
+                )
+            result[key] = self.value(key)
+        loader.get_event()
+        return result
+
+    def sequence(
+        self,
+        event: SequenceStartEvent,
+        key: Any = None,
+        constructor: Callable[[Any], Any] | None = None,
+    ) -> list:
+        loader = self.loader
+        value = self.value
+        result = []
+        append = result.append
+        if self.depth:
+            # Within an entry of an outer sequence, which may itself be a template using
+            # variables of its own, so templates are expanded with the outer entry.
+            self.depth += 1
+            while not loader.check_event(SequenceEndEvent):
+                item = value()
+                if type(item) is dict and FOREACH in item:
+                    self.pending = True
+                append(item)
+            loader.get_event()
+            self.depth -= 1
+            return result
+
+        self.depth = 1
+        mark = None
+        while not loader.check_event(SequenceEndEvent):
+            self.pending = False
+            if constructor is not None:
+                mark = loader.peek_event().start_mark
+            item = value()
+            if type(item) is dict and FOREACH in item:
+                entries = expand_template(item)
+            elif self.pending:
+                entries = (_expand_nested(item),)
+            elif constructor is None:
+                append(item)
+                continue
+            else:
+                entries = (item,)
+            if constructor is None:
+                result.extend(entries)
+                continue
+            for entry in entries:
+                try:
+                    entry = constructor(entry)
+                except Exception as e:
+                    raise EntryConstructionError(key, len(result), mark, e) from e
+                append(entry)
+        loader.get_event()
+        self.depth = 0
+        return result
+
+
+def _expand_nested(value: Any) -> Any:
+    """Expand the templates nested in an entry that is not a template itself."""
+    cls = type(value)
+    if cls is list:
+        result = []
+        for item in value:
+            if is_template(item):
+                result.extend(expand_template(item))
+            else:
+                result.append(_expand_nested(item))
+        return result
+    if cls is dict:
+        return {key: _expand_nested(item) for key, item in value.items()}
+    return value
+
+
+def load_brd_data(
+    stream: str | bytes | IO,
+    item_constructors: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> Any:
+    """
+    Parse a board definition into plain Python data.
+
+    :param stream: The document, as a string or an open file.
+    :param item_constructors: Constructors applied to every entry of the sequences stored
+        under the given mapping keys, as soon as the entry has been parsed.
+    :raises EntryConstructionError: A constructor failed, reported with the position of
+        the entry.
+    :raises yaml.YAMLError: The document is not valid YAML or has a duplicate mapping key.
+    :return: The parsed document, or None if it is empty.
+    """
+    loader = _Loader(stream)
+    try:
+        return _EventReader(loader, item_constructors or {}).document()
+    finally:
+        loader.dispose()
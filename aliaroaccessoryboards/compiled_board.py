@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.connection_key import ConnectionKey
+
+# Compiled boards in use, keyed by the content of their configuration, see _source_key.
+_compiled: weakref.WeakValueDictionary[tuple, CompiledBoard] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _FrozenDict(dict):
+    """A dict that cannot be modified, so it can be shared safely."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class CompiledBoard:
+    """
+    Immutable lookup tables derived from a `BoardConfig`.
+
+    A compiled board is built once per configuration by `for_config` and shared by reference
+    among every `AccessoryBoard` and `BoardController` using that configuration, so a rack
+    of identical boards holds one copy of the tables and each board only its mutable state.
+    The tables are a snapshot of the configuration; modifying the configuration later does
+    not change them. Relay and channel names are interned.
+
+    :ivar relays: Relay names, in bit order.
+    :ivar relay_index: Bit index per relay name.
+    :ivar channels: Channel names.
+    :ivar channel_index: Index in ``BoardConfig.channels`` per channel name.
+    :ivar paths: Connection key per connection path, in config order. Boards register these
+        keys as their connections, so connections do not allocate keys of their own.
+    :ivar path_index: Index in ``paths`` per connection key.
+    :ivar connection_map: Relay names per connection path.
+    :ivar path_relay_indices: Relay indices per connection path.
+    :ivar path_masks: Relay mask per connection path.
+    :ivar masks_by_path: Relay mask per index in ``paths``.
+    :ivar relay_paths: Indices in ``paths`` of the paths using a relay, per relay index.
+    :ivar channel_paths: Indices in ``paths`` of the paths ending at a channel, per channel.
+    :ivar relayless_paths: Indices in ``paths`` of the paths without relays.
+    :ivar path_channels: Channel indices of the source and destination of each path in
+        ``paths``, as a read-only array of shape ``(len(paths), 2)``.
+    :ivar exclusive_connections: Exclusive destinations per exclusive source.
+    :ivar open_relays: Relays opened on reset.
+    :ivar close_relays: Relays closed on reset.
+    :ivar close_mask: Relay mask of ``close_relays``.
+    :ivar current_sensors: Current sensor names.
+    :ivar current_scale: Calibration scale per current sensor, read-only.
+    :ivar current_offset: Calibration offset per current sensor, read-only.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "channel_index",
+        "channel_paths",
+        "channels",
+        "close_mask",
+        "close_relays",
+        "connection_map",
+        "current_offset",
+        "current_scale",
+        "current_sensors",
+        "exclusive_connections",
+        "masks_by_path",
+        "open_relays",
+        "path_channels",
+        "path_index",
+        "path_masks",
+        "path_relay_indices",
+        "paths",
+        "relay_index",
+        "relay_paths",
+        "relayless_paths",
+        "relays",
+    )
+
+    relays: tuple[str, ...]
+    relay_index: Mapping[str, int]
+    channels: frozenset[str]
+    channel_index: Mapping[str, int]
+    paths: tuple[ConnectionKey, ...]
+    path_index: Mapping[ConnectionKey, int]
+    connection_map: Mapping[ConnectionKey, tuple[str, ...]]
+    path_relay_indices: Mapping[ConnectionKey, tuple[int, ...]]
+    path_masks: Mapping[ConnectionKey, int]
+    masks_by_path: tuple[int, ...]
+    relay_paths: tuple[tuple[int, ...], ...]
+    channel_paths: Mapping[str, tuple[int, ...]]
+    relayless_paths: tuple[int, ...]
+    path_channels: np.ndarray
+    exclusive_connections: Mapping[str, frozenset[str]]
+    open_relays: tuple[str, ...]
+    close_relays: tuple[str, ...]
+    close_mask: int
+    current_sensors: tuple[str, ...]
+    current_scale: np.ndarray
+    current_offset: np.ndarray
+
+    def __init__(
+        self,
+        board_config: BoardConfig,
+        path_relay_indices: Sequence[tuple[int, ...]] | None = None,
+        path_masks: Sequence[int] | None = None,
+        exclusive: Mapping[str, Sequence[str]] | None = None,
+    ):
+        """
+        Prefer `for_config`, which returns the compiled board already built for a config.
+
+        The optional tables are the ones generated by `board_compiler` and are trusted to
+        match the configuration.
+
+        :param board_config: The configuration to compile.
+        :param path_relay_indices: Relay indices per entry of ``connection_paths``.
+        :param path_masks: Relay mask per entry of ``connection_paths``.
+        :param exclusive: Exclusive destinations per exclusive source.
+        """
+        intern = sys.intern
+        relays = tuple(intern(relay) for relay in board_config.relays)
+        relay_index = {}
+        for idx, relay in enumerate(relays):
+            relay_index.setdefault(relay, idx)
+        channels = {
+            intern(channel): intern(channel) for channel in board_config.channels
+        }
+
+        channel_index = {}
+        for idx, channel in enumerate(board_config.channels):
+            channel_index.setdefault(channels[channel], idx)
+
+        paths = []
+        path_index = {}
+        path_ends = []
+        connection_map = {}
+        relay_indices_by_path = {}
+        masks_by_key = {}
+        for path_idx, path in enumerate(board_config.connection_paths):
+            key = ConnectionKey(
+                channels.get(path.src, path.src), channels.get(path.dest, path.dest)
+            )
+            if key not in path_index:
+                path_index[key] = len(paths)
+                paths.append(key)
+                path_ends.append(
+                    (channel_index.get(path.src, -1), channel_index.get(path.dest, -1))
+                )
+            if path_relay_indices is None:
+                indices = tuple(relay_index[relay] for relay in path.relays)
+            else:
+                indices = path_relay_indices[path_idx]
+            connection_map[key] = tuple(relays[idx] for idx in indices)
+            relay_indices_by_path[key] = indices
+            if path_masks is None:
+                mask = 0
+                for idx in indices:
+                    mask |= 1 << idx
+            else:
+                mask = path_masks[path_idx]
+            masks_by_key[key] = mask
+
+        relay_paths = [[] for _ in relays]
+        channel_paths = {channel: [] for channel in channels}
+        relayless_paths = []
+        for idx, key in enumerate(paths):
+            indices = set(relay_indices_by_path[key])
+            for relay in indices:
+                relay_paths[relay].append(idx)
+            if not indices:
+                relayless_paths.append(idx)
+            for channel in key:
+                channel_paths.setdefault(channel, []).append(idx)
+
+        if exclusive is None:
+            exclusive = {
+                entry.src: entry.dests for entry in board_config.exclusive_connections
+            }
+
+        init = board_config.initialization_commands
+        close_mask = 0
+        for relay in init.close_relays:
+            close_mask |= 1 << relay_index[relay]
+
+        calibrations = [
+            board_config.current_sensor_calibration.get(sensor)
+            for sensor in board_config.current_sensors
+        ]
+        scale = np.array(
+            [1.0 if cal is None else cal.scale for cal in calibrations],
+            dtype=np.float64,
+        )
+        offset = np.array(
+            [0.0 if cal is None else cal.offset for cal in calibrations],
+            dtype=np.float64,
+        )
+        path_channels = np.array(
+            path_ends, dtype=np.min_scalar_type(-len(channel_index))
+        ).reshape(-1, 2)
+        path_channels.flags.writeable = False
+        scale.flags.writeable = False
+        offset.flags.writeable = False
+
+        values = {
+            "relays": relays,
+            "relay_index": _FrozenDict(relay_index),
+            "channels": frozenset(channels),
+            "channel_index": _FrozenDict(channel_index),
+            "paths": tuple(paths),
+            "path_index": _FrozenDict(path_index),
+            "connection_map": _FrozenDict(connection_map),
+            "path_relay_indices": _FrozenDict(relay_indices_by_path),
+            "path_masks": _FrozenDict(masks_by_key),
+            "masks_by_path": tuple(masks_by_key[key] for key in paths),
+            "relay_paths": tuple(tuple(indices) for indices in relay_paths),
+            "channel_paths": _FrozenDict(
+                (channel, tuple(indices)) for channel, indices in channel_paths.items()
+            ),
+            "relayless_paths": tuple(relayless_paths),
+            "path_channels": path_channels,
+            "exclusive_connections": _FrozenDict(
+                (src, frozenset(dests)) for src, dests in exclusive.items()
+            ),
+            "open_relays": tuple(relays[relay_index[r]] for r in init.open_relays),
+            "close_relays": tuple(relays[relay_index[r]] for r in init.close_relays),
+            "close_mask": close_mask,
+            "current_sensors": tuple(board_config.current_sensors),
+            "current_scale": scale,
+            "current_offset": offset,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def for_config(
+        cls,
+        board_config: BoardConfig,
+        path_relay_indices: Sequence[tuple[int, ...]] | None = None,
+        path_masks: Sequence[int] | None = None,
+        exclusive: Mapping[str, Sequence[str]] | None = None,
+    ) -> CompiledBoard:
+        """
+        Return the compiled board of a configuration, building it on first use.
+
+        Compiled boards are cached by the content of the configuration for as long as they
+        are in use, so equal configurations share one, and a configuration modified since
+        it was compiled gets a new one.
+
+        :param board_config: The configuration.
+        :param path_relay_indices: Precomputed relay indices per connection path, see
+            `__init__`. Ignored if the board was already compiled.
+        :param path_masks: Precomputed relay mask per connection path.
+        :param exclusive: Precomputed exclusive destinations per source.
+        :return: The compiled board shared by all users of the configuration.
+        """
+        key = _source_key(board_config)
+        compiled = _compiled.get(key)
+        if compiled is None:
+            compiled = cls(board_config, path_relay_indices, path_masks, exclusive)
+            _compiled[key] = compiled
+        return compiled
+
+
+def _source_key(board_config: BoardConfig) -> tuple:
+    """Return the parts of a configuration a compiled board is built from, as tuples."""
+    init = board_config.initialization_commands
+    return (
+        tuple(board_config.relays),
+        tuple(board_config.channels),
+        tuple(
+            [
+                (path.src, path.dest, tuple(path.relays))
+                for path in board_config.connection_paths
+            ]
+        ),
+        tuple(init.open_relays),
+        tuple(init.close_relays),
+        tuple(
+            [
+                (entry.src, tuple(entry.dests))
+                for entry in board_config.exclusive_connections
+            ]
+        ),
+        tuple(board_config.current_sensors),
+        tuple(
+            [
+                (sensor, calibration.scale, calibration.offset)
+                for sensor, calibration in board_config.current_sensor_calibration.items()
+            ]
+        ),
+    )
@@ -0,0 +1,49 @@
+"""
+Bundled board definitions compiled into Python data modules.
+
+The modules are generated from ``aliaroaccessoryboards/boards/*.brd`` by
+``python -m aliaroaccessoryboards.board_compiler`` and hold the validated configuration as
+plain data together with precomputed indexes, so loading a bundled board neither parses
+YAML nor runs pydantic validation.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import re
+from pathlib import Path
+from types import ModuleType
+
+BOARDS_DIR = Path(__file__).parent.parent / "boards"
+
+
+def module_name(device_name: str) -> str:
+    """Name of the compiled module of a bundled board."""
+    return "board_" + re.sub(r"\W", "_", device_name)
+
+
+def source_digest(device_name: str) -> str:
+    """SHA-256 of the ``.brd`` file of a bundled board."""
+    return hashlib.sha256((BOARDS_DIR / f"{device_name}.brd").read_bytes()).hexdigest()
+
+
+@functools.cache
+def load_compiled_board(device_name: str) -> ModuleType | None:
+    """
+    Import the compiled module of a bundled board, once per process.
+
+    :param device_name: Name of the bundled board.
+    :return: The module, or None if the board was not compiled or its ``.brd`` file changed
+        since it was compiled.
+    """
+    try:
+        module = importlib.import_module(f"{__name__}.{module_name(device_name)}")
+    except ModuleNotFoundError:
+        return None
+    try:
+        digest = source_digest(device_name)
+    except FileNotFoundError:
+        return module
+    return module if digest == module.SOURCE_SHA256 else None
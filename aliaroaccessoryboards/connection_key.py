@@ -1,8 +1,10 @@
 import collections
-from typing import Iterator
+from collections.abc import Iterator
 
 
 class ConnectionKey(collections.abc.Set):
+    __slots__ = ("_frozenset",)
+
     def __init__(self, channel1: str, channel2: str):
         self._frozenset = frozenset([channel1, channel2])
 
@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Any, NamedTuple
+
+
+class ConnectionStatus(Enum):
+    """Outcome of `AccessoryBoard.try_connect` and `AccessoryBoard.try_disconnect`."""
+
+    CONNECTED = "connected"
+    ALREADY_CONNECTED = "already_connected"
+    DISCONNECTED = "disconnected"
+    NOT_CONNECTED = "not_connected"
+    INVALID_CHANNEL = "invalid_channel"
+    PATH_UNSUPPORTED = "path_unsupported"
+    RESOURCE_IN_USE = "resource_in_use"
+    SOURCE_CONFLICT = "source_conflict"
+    EXCLUSIVE_CONFLICT = "exclusive_conflict"
+
+
+_SUCCESS = frozenset(
+    {
+        ConnectionStatus.CONNECTED,
+        ConnectionStatus.ALREADY_CONNECTED,
+        ConnectionStatus.DISCONNECTED,
+        ConnectionStatus.NOT_CONNECTED,
+    }
+)
+
+
+class ConnectionResult(NamedTuple):
+    """
+    Result of `AccessoryBoard.try_connect` and `AccessoryBoard.try_disconnect`.
+
+    Failures carry the detail the corresponding exception of `connect_channels` would
+    report, without formatting a message.
+
+    :ivar status: The outcome.
+    :ivar detail: The invalid channel names for ``INVALID_CHANNEL``, the relay in use for
+        ``RESOURCE_IN_USE``, the conflicting sources for ``SOURCE_CONFLICT`` and the other
+        channel of the conflicting connection for ``EXCLUSIVE_CONFLICT``. None otherwise.
+    """
+
+    status: ConnectionStatus
+    detail: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the channels are in the requested state."""
+        return self.status in _SUCCESS
+
+
+CONNECTED = ConnectionResult(ConnectionStatus.CONNECTED)
+ALREADY_CONNECTED = ConnectionResult(ConnectionStatus.ALREADY_CONNECTED)
+DISCONNECTED = ConnectionResult(ConnectionStatus.DISCONNECTED)
+NOT_CONNECTED = ConnectionResult(ConnectionStatus.NOT_CONNECTED)
+PATH_UNSUPPORTED = ConnectionResult(ConnectionStatus.PATH_UNSUPPORTED)
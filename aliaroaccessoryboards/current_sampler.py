@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+import numpy as np
+
+from aliaroaccessoryboards.boardcontrollers.board_controller import BoardController
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+SampleCallback = Callable[[float, np.ndarray], None]
+
+
+class CurrentStatistics(NamedTuple):
+    """
+    Per-sensor statistics over a window of samples.
+
+    Each array holds one value per current sensor, in the order of
+    `BoardController.current_sensors`.
+
+    :ivar count: Number of samples in the window.
+    :ivar minimum: Minimum reading per sensor.
+    :ivar maximum: Maximum reading per sensor.
+    :ivar mean: Mean reading per sensor.
+    :ivar rms: Root mean square reading per sensor.
+    """
+
+    count: int
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    rms: np.ndarray
+
+
+class CurrentSampler:
+    """
+    Continuously samples the current sensors of a board on a background thread.
+
+    Readings are calibrated with `BoardController.read_currents` and stored with their
+    timestamps (``time.monotonic()``) in a preallocated ring buffer, so the most recent
+    ``capacity`` samples are always available without allocating.
+
+    Each sample is a single read transaction taken while holding the controller's
+    ``bus_lock``. The lock is released between samples, so a relay commit on the same bus
+    waits for at most one read. Reads that take longer than ``overrun_threshold`` seconds
+    are counted in ``overruns``; the threshold only counts slow reads and does not limit
+    how long a read holds the lock.
+
+    A failing read or subscriber does not stop sampling: the exception is counted in
+    ``errors`` and kept in ``last_error``, and the remaining subscribers still run.
+    """
+
+    def __init__(
+        self,
+        board_controller: BoardController,
+        rate: float = 100.0,
+        capacity: int = 10_000,
+        overrun_threshold: float = 0.005,
+    ):
+        if rate <= 0:
+            raise ValueError("Sample rate must be positive")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.board_controller = board_controller
+        self.sensors = board_controller.current_sensors
+        self.rate = rate
+        self.capacity = capacity
+        self.overrun_threshold = overrun_threshold
+        self.overruns = 0
+        self.errors = 0
+        self.last_error: Exception | None = None
+
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros((capacity, len(self.sensors)), dtype=np.float64)
+        self._scratch = np.zeros(len(self.sensors), dtype=np.float64)
+        self._sample_count = 0
+        self._buffer_lock = threading.Lock()
+        self._subscribers: list[SampleCallback] = []
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="CurrentSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread and wait for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        period = 1.0 / self.rate
+        next_sample = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.sample_once()
+            # Any failure is recorded instead of ending the sampler thread.
+            except Exception as e:  # noqa: BLE001
+                self._record_error(e)
+            next_sample += period
+            delay = next_sample - time.monotonic()
+            if delay < 0:
+                # Fell behind; skip missed ticks rather than sampling in a burst.
+                next_sample = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def sample_once(self) -> tuple[float, np.ndarray]:
+        """
+        Take a single sample, store it and notify subscribers.
+
+        Exceptions raised by subscribers are recorded in ``errors`` and ``last_error``.
+
+        :return: The timestamp and readings of the sample.
+        """
+        controller = self.board_controller
+        with controller.bus_lock:
+            start = time.monotonic()
+            controller.read_currents(out=self._scratch)
+            timestamp = time.monotonic()
+        if timestamp - start > self.overrun_threshold:
+            self.overruns += 1
+
+        with self._buffer_lock:
+            row = self._sample_count % self.capacity
+            self._timestamps[row] = timestamp
+            values = self._values[row]
+            values[:] = self._scratch
+            self._sample_count += 1
+
+        for callback in tuple(self._subscribers):
+            try:
+                callback(timestamp, values)
+            # A failing subscriber must not keep the others from running.
+            except Exception as e:  # noqa: BLE001
+                self._record_error(e)
+        return timestamp, values
+
+    def _record_error(self, error: Exception) -> None:
+        self.errors += 1
+        self.last_error = error
+
+    def subscribe(self, callback: SampleCallback) -> Callable[[], None]:
+        """
+        Register a callback invoked on the sampler thread after every sample.
+
+        The callback receives the sample timestamp and a view of the readings in the ring
+        buffer. The view is overwritten once the buffer wraps, so copy it to keep it.
+
+        :param callback: Callable taking ``(timestamp, values)``.
+        :return: A callable that removes the subscription.
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    @property
+    def sample_count(self) -> int:
+        """Total number of samples taken, including those overwritten in the buffer."""
+        return self._sample_count
+
+    def latest(self) -> tuple[float, np.ndarray] | None:
+        """
+        Return the most recent sample.
+
+        :return: The timestamp and a copy of the readings, or None if nothing was sampled yet.
+        """
+        with self._buffer_lock:
+            if self._sample_count == 0:
+                return None
+            row = (self._sample_count - 1) % self.capacity
+            return float(self._timestamps[row]), self._values[row].copy()
+
+    def samples(self, window: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the buffered samples, oldest first.
+
+        :param window: Only return samples taken within the last ``window`` seconds.
+            All buffered samples are returned if omitted.
+        :return: A ``(timestamps, values)`` pair of copies, ``values`` having one column per sensor.
+        """
+        with self._buffer_lock:
+            count = min(self._sample_count, self.capacity)
+            start = (self._sample_count - count) % self.capacity
+            order = (np.arange(count) + start) % self.capacity
+            timestamps = self._timestamps[order]
+            values = self._values[order]
+        if window is not None and count:
+            first = np.searchsorted(timestamps, timestamps[-1] - window, side="left")
+            timestamps = timestamps[first:]
+            values = values[first:]
+        return timestamps, values
+
+    def statistics(self, window: float | None = None) -> CurrentStatistics:
+        """
+        Compute per-sensor statistics over the buffered samples.
+
+        :param window: Only include samples taken within the last ``window`` seconds.
+        :raises ValueError: No samples are available in the window.
+        :return: Minimum, maximum, mean and RMS per sensor.
+        """
+        _, values = self.samples(window)
+        if len(values) == 0:
+            raise ValueError("No samples available")
+        return CurrentStatistics(
+            count=len(values),
+            minimum=values.min(axis=0),
+            maximum=values.max(axis=0),
+            mean=values.mean(axis=0),
+            rms=np.sqrt(np.mean(np.square(values), axis=0)),
+        )
@@ -1,4 +1,5 @@
-from typing import Set
+from __future__ import annotations
+
 from aliaroaccessoryboards.connection_key import ConnectionKey
 
 
@@ -18,17 +19,24 @@ class PathUnsupportedException(AccessoryBoardException):
 
 
 class ResourceInUseException(AccessoryBoardException):
-    def __init__(self, relay_name: str, message="Relay in use by another connection"):
+    def __init__(
+        self,
+        relay_name: str,
+        message="Relay in use by another connection",
+        holder: ConnectionKey | None = None,
+    ):
         self.relay_name = relay_name
         self.message = message
-        super().__init__(f"{self.message}: Requested: {self.relay_name}")
+        self.holder = holder
+        held_by = f", Held by: {holder}" if holder is not None else ""
+        super().__init__(f"{self.message}: Requested: {self.relay_name}{held_by}")
 
 
 class SourceConflictException(AccessoryBoardException):
     def __init__(
         self,
         connection_key: ConnectionKey,
-        conflicting_sources: Set[str],
+        conflicting_sources: set[str],
         message="Connection would connect multiple sources",
     ):
         self.connection_key = connection_key
@@ -52,3 +60,14 @@ class ExclusiveConnectionConflictException(AccessoryBoardException):
         super().__init__(
             f"{self.message}: Requested: {connection_key}, Conflicting connection: {existing_connection}"
         )
+
+
+class BoardConfigIntegrityException(AccessoryBoardException):
+    def __init__(
+        self,
+        problems: list[str],
+        message="Board configuration is inconsistent",
+    ):
+        self.problems = problems
+        self.message = message
+        super().__init__(f"{self.message}: {'; '.join(problems)}")
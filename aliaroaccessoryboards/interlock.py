@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+
+
+class InterlockTrip(NamedTuple):
+    """
+    Record of an overcurrent interlock trip.
+
+    :ivar sensor: Name of the sensor that exceeded its threshold.
+    :ivar value: The offending (calibrated) reading.
+    :ivar threshold: The threshold that was exceeded.
+    :ivar timestamp: Monotonic timestamp of the sample that caused the trip.
+    :ivar latency: Seconds from detecting the overcurrent until the safe relay mask was written.
+    """
+
+    sensor: str
+    value: float
+    threshold: float
+    timestamp: float
+    latency: float
+
+
+class OvercurrentInterlock:
+    """
+    Opens relays as soon as a current sensor exceeds its threshold.
+
+    Thresholds are evaluated on the sampler thread for every sample. On a trip, the
+    precomputed safe relay mask is written to the device with `AccessoryBoard.force_open`,
+    in a single transaction under the board's lock that bypasses validation and replaces any
+    relay changes not committed yet. The board is then reconciled with the safe mask.
+
+    The interlock latches after a trip and ignores further samples until `reset` is called.
+    """
+
+    def __init__(
+        self,
+        board: AccessoryBoard,
+        sampler: CurrentSampler,
+        thresholds: dict[str, float],
+        safe_mask: int | None = None,
+        on_trip: Callable[[InterlockTrip], None] | None = None,
+    ):
+        """
+        :param board: The board whose relays are opened on a trip.
+        :param sampler: The sampler reading the board's current sensors.
+        :param thresholds: Maximum absolute reading per sensor name, in calibrated units.
+        :param safe_mask: Relay mask written on a trip. Defaults to the relays the board
+            closes on reset, i.e. every other relay open.
+        :param on_trip: Optional callback invoked on the sampler thread after a trip.
+        :raises KeyError: A threshold refers to an unknown current sensor.
+        """
+        self.board = board
+        self.sampler = sampler
+        self.on_trip = on_trip
+
+        sensors = list(sampler.sensors)
+        self._limits = np.full(len(sensors), np.inf)
+        for sensor, threshold in thresholds.items():
+            if sensor not in sensors:
+                raise KeyError(f"Invalid current sensor: {sensor}")
+            self._limits[sensors.index(sensor)] = threshold
+        self._sensors = tuple(sensors)
+
+        if safe_mask is None:
+            safe_mask = board.reset_relay_mask
+        self.safe_mask = safe_mask
+
+        self.trips: list[InterlockTrip] = []
+        self._tripped = threading.Event()
+        self._unsubscribe: Callable[[], None] | None = None
+
+    def arm(self) -> None:
+        """Start evaluating thresholds on every sample."""
+        if self._unsubscribe is None:
+            self._unsubscribe = self.sampler.subscribe(self._on_sample)
+
+    def disarm(self) -> None:
+        """Stop evaluating thresholds."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @property
+    def tripped(self) -> bool:
+        return self._tripped.is_set()
+
+    def reset(self) -> None:
+        """Clear the latched trip so the interlock can trip again."""
+        self._tripped.clear()
+
+    def _on_sample(self, timestamp: float, values: np.ndarray) -> None:
+        if self._tripped.is_set():
+            return
+        over = np.abs(values) > self._limits
+        if not over.any():
+            return
+
+        detected = time.perf_counter()
+        # Waits for at most one board operation to finish its commit.
+        latency = self.board.force_open(self.safe_mask) - detected
+        self._tripped.set()
+
+        idx = int(np.argmax(over))
+        trip = InterlockTrip(
+            sensor=self._sensors[idx],
+            value=float(values[idx]),
+            threshold=float(self._limits[idx]),
+            timestamp=timestamp,
+            latency=latency,
+        )
+        self.trips.append(trip)
+        if self.on_trip is not None:
+            self.on_trip(trip)
+
+    def latency_report(self) -> dict[str, float]:
+        """
+        Summarize the trip-to-write latency of all recorded trips.
+
+        :return: Trip count and minimum, mean and maximum latency in seconds.
+        """
+        latencies = np.array([trip.latency for trip in self.trips])
+        if len(latencies) == 0:
+            return {"trips": 0}
+        return {
+            "trips": len(latencies),
+            "min": float(latencies.min()),
+            "mean": float(latencies.mean()),
+            "max": float(latencies.max()),
+        }
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+LabelSet = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    1e-6,
+    5e-6,
+    1e-5,
+    5e-5,
+    1e-4,
+    5e-4,
+    1e-3,
+    5e-3,
+    1e-2,
+    5e-2,
+    1e-1,
+    5e-1,
+    1.0,
+)
+
+
+class Histogram:
+    """
+    Latency histogram with fixed bucket upper bounds, in seconds.
+
+    :ivar bounds: Upper bound of each bucket, ascending. Larger values fall in an implicit
+        ``+Inf`` bucket.
+    :ivar counts: Number of observations per bucket (not cumulative), including ``+Inf``.
+    :ivar count: Total number of observations.
+    :ivar sum: Sum of all observed values.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[str, int]:
+        """Return the cumulative count per upper bound, as used by Prometheus."""
+        result = {}
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            result["+Inf" if bound == float("inf") else repr(bound)] = total
+        return result
+
+
+class Metrics:
+    """
+    Collects counters and latency histograms for an AccessoryBoard and its controller.
+
+    Instrumentation is opt-in: boards and controllers only record metrics while their
+    ``metrics`` attribute is set, e.g. by `AccessoryBoard.enable_metrics`. When unset, the
+    instrumented paths cost a single attribute check.
+
+    Recorded metrics:
+
+    - ``<operation>_total`` and ``<operation>_seconds`` for ``connect``, ``disconnect``,
+      ``disconnect_all``, ``reset``, ``apply_preset``, ``commit``, ``device_write`` and
+      ``relay_read``.
+    - ``bytes_written_total``: Relay bytes written to the device.
+    - ``settle_total`` and ``settle_seconds``: Settle sleeps after relay writes.
+    - ``exceptions_total``: Exceptions raised by an operation, labeled by operation and type.
+    - ``rejections_total``: Failed ``try_connect`` and ``try_disconnect`` calls, labeled by
+      operation and status. They are timed as ``connect`` and ``disconnect``.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "aliaro_board",
+        labels: dict[str, str] | None = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        :param prefix: Prefix of the exported metric names.
+        :param labels: Constant labels added to every exported sample, e.g. a board name.
+        :param buckets: Upper bounds of the latency histogram buckets, in seconds.
+        """
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+        self.buckets = tuple(buckets)
+        self.counters: dict[tuple[str, LabelSet], float] = {}
+        self.histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        """
+        Count and time an operation, and count the exceptions it raises by type.
+
+        :param operation: Name of the operation, e.g. ``connect``.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.increment(
+                "exceptions_total", operation=operation, type=type(e).__name__
+            )
+            raise
+        finally:
+            self.observe(f"{operation}_seconds", time.perf_counter() - start)
+            self.increment(f"{operation}_total")
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Return the recorded values as plain data.
+
+        :return: ``{"counters": {...}, "histograms": {...}}``. Counters are keyed by name,
+            with labels appended in Prometheus notation if present. Histograms hold their
+            ``count``, ``sum`` and cumulative ``buckets``.
+        """
+        return {
+            "counters": {
+                name + _format_labels(labels): value
+                for (name, labels), value in sorted(self.counters.items())
+            },
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "buckets": histogram.cumulative(),
+                }
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the recorded values in the Prometheus text exposition format."""
+        lines = []
+        constant = tuple(self.labels.items())
+        counter_names = sorted({name for name, _ in self.counters})
+        for name in counter_names:
+            full_name = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {full_name} counter")
+            for (counter, labels), value in sorted(self.counters.items()):
+                if counter == name:
+                    lines.append(
+                        f"{full_name}{_format_labels(constant + labels)} {_format_value(value)}"
+                    )
+        for name, histogram in sorted(self.histograms.items()):
+            full_name = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {full_name} histogram")
+            for bound, count in histogram.cumulative().items():
+                labels = _format_labels(constant + (("le", bound),))
+                lines.append(f"{full_name}_bucket{labels} {count}")
+            labels = _format_labels(constant)
+            lines.append(f"{full_name}_sum{labels} {_format_value(histogram.sum)}")
+            lines.append(f"{full_name}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(value)
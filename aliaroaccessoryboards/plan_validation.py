@@ -0,0 +1,370 @@
+"""
+Offline validation of switching plans against a board configuration.
+
+A plan is a sequence of steps. Each step is the set of connections that are active at the
+same time, i.e. the state the board is switched to by connecting them in order from a reset
+board. `PlanValidator` checks all steps with NumPy array operations instead of replaying
+them on an `AccessoryBoard`, applying the same rules:
+
+- Every connection must have a connection path (`PathUnsupportedException`) between valid
+  channels (`KeyError`).
+- Once an exclusive source is connected to one of its exclusive destinations, it may not be
+  connected to any other channel (`ExclusiveConnectionConflictException`). As on the board,
+  this depends on the order of the connections: connecting the source to a channel that is
+  not an exclusive destination first, and to a destination afterward, is allowed.
+- No channel may be connected to two sources, directly or through one connection each
+  (`SourceConflictException`).
+- No relay may be used by two connections, or by a connection and the relays closed on
+  initialization (`ResourceInUseException`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import (
+    NamedTuple,
+)
+
+import numpy as np
+
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.exceptions import (
+    ExclusiveConnectionConflictException,
+    PathUnsupportedException,
+    ResourceInUseException,
+    SourceConflictException,
+)
+
+Step = Iterable[tuple[str, str]]
+
+# Number of steps checked per batch, bounding the size of the intermediate arrays.
+CHUNK_SIZE = 1 << 16
+
+
+class PlanFailure(NamedTuple):
+    """
+    The first step of a plan that cannot be applied.
+
+    :ivar step: Index of the failing step.
+    :ivar reason: Description of the failure.
+    :ivar exception: The exception `AccessoryBoard` raises for the failure.
+    """
+
+    step: int
+    reason: str
+    exception: Exception
+
+
+class PlanValidator:
+    """
+    Validates switching plans against a board configuration using array operations.
+
+    Connections are encoded as connection path indices and steps as rows of a ``-1``-padded
+    integer array, so plans can also be validated directly in encoded form with
+    `validate_indices`.
+    """
+
+    def __init__(self, board_config: BoardConfig):
+        channels = list(board_config.channels)
+        relays = list(board_config.relays)
+        self.channels = channels
+        self.relays = relays
+        self._channel_index = {channel: i for i, channel in enumerate(channels)}
+        relay_index = {relay: i for i, relay in enumerate(relays)}
+
+        paths = board_config.connection_paths
+        self._path_index: dict[frozenset[str], int] = {}
+        for idx, path in enumerate(paths):
+            self._path_index.setdefault(frozenset((path.src, path.dest)), idx)
+        self._path_src = np.array(
+            [self._channel_index[path.src] for path in paths], dtype=np.int64
+        )
+        self._path_dest = np.array(
+            [self._channel_index[path.dest] for path in paths], dtype=np.int64
+        )
+
+        # Relays per path in compressed sparse row form.
+        self._path_relay_counts = np.array(
+            [len(path.relays) for path in paths], dtype=np.int64
+        )
+        self._path_relay_offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        np.cumsum(self._path_relay_counts, out=self._path_relay_offsets[1:])
+        self._path_relays = np.array(
+            [relay_index[relay] for path in paths for relay in path.relays],
+            dtype=np.int64,
+        )
+
+        self._reserved = np.zeros(len(relays), dtype=bool)
+        for relay in board_config.initialization_commands.close_relays:
+            self._reserved[relay_index[relay]] = True
+
+        # Exclusive group of each path, per end: the exclusive source at that end, in
+        # _touch_groups, and the exclusive source connected to one of its exclusive
+        # destinations, in _path_groups.
+        exclusive = {
+            self._channel_index[entry.src]: (
+                group,
+                {self._channel_index[dest] for dest in entry.dests},
+            )
+            for group, entry in enumerate(board_config.exclusive_connections)
+        }
+        self._group_src = np.zeros(len(board_config.exclusive_connections), np.int64)
+        for src, (group, _) in exclusive.items():
+            self._group_src[group] = src
+        self._group_dests = [
+            frozenset(entry.dests) for entry in board_config.exclusive_connections
+        ]
+        self._touch_groups = np.full((2, len(paths)), -1, dtype=np.int64)
+        self._path_groups = np.full((2, len(paths)), -1, dtype=np.int64)
+        for idx, (u, v) in enumerate(
+            zip(self._path_src.tolist(), self._path_dest.tolist())
+        ):
+            for end, (src, dest) in enumerate(((u, v), (v, u))):
+                entry = exclusive.get(src)
+                if entry is not None:
+                    self._touch_groups[end, idx] = entry[0]
+                    if dest in entry[1]:
+                        self._path_groups[end, idx] = entry[0]
+
+    def encode_step(self, step: Step) -> list[int]:
+        """
+        Encode the connections of a step as connection path indices.
+
+        :param step: Channel pairs to connect.
+        :raises KeyError: A channel name is invalid.
+        :raises PathUnsupportedException: No path exists between two channels.
+        :return: The path indices.
+        """
+        path_index = self._path_index
+        indices = []
+        for channel1, channel2 in step:
+            idx = path_index.get(frozenset((channel1, channel2)))
+            if idx is None:
+                invalid = [
+                    ch for ch in (channel1, channel2) if ch not in self._channel_index
+                ]
+                if invalid:
+                    raise KeyError(
+                        f"Invalid channel names provided: {', '.join(invalid)}"
+                    )
+                raise PathUnsupportedException(ConnectionKey(channel1, channel2))
+            indices.append(idx)
+        return indices
+
+    @staticmethod
+    def pad(steps: Sequence[Sequence[int]]) -> np.ndarray:
+        """Stack path index lists into a ``-1``-padded array of shape ``(steps, width)``."""
+        width = max((len(step) for step in steps), default=0)
+        array = np.full((len(steps), max(width, 1)), -1, dtype=np.int64)
+        for row, step in enumerate(steps):
+            array[row, : len(step)] = step
+        return array
+
+    def validate(
+        self, steps: Iterable[Step], sources: Iterable[str] = ()
+    ) -> PlanFailure | None:
+        """
+        Validate a plan given as channel pairs.
+
+        :param steps: The steps of the plan, each an iterable of channel pairs.
+        :param sources: Channels marked as sources.
+        :return: The first failing step, or None if the whole plan is valid.
+        """
+        encoded = []
+        encode_failure = None
+        for index, step in enumerate(steps):
+            try:
+                encoded.append(self.encode_step(step))
+            except (KeyError, PathUnsupportedException) as e:
+                encode_failure = PlanFailure(index, _reason(e), e)
+                break
+        failure = self.validate_indices(self.pad(encoded), sources)
+        return failure if failure is not None else encode_failure
+
+    def validate_indices(
+        self, steps: np.ndarray, sources: Iterable[str] = ()
+    ) -> PlanFailure | None:
+        """
+        Validate a plan given as connection path indices.
+
+        :param steps: Array of shape ``(steps, width)`` holding path indices in connection
+            order, padded with -1.
+        :param sources: Channels marked as sources.
+        :return: The first failing step, or None if the whole plan is valid.
+        """
+        is_source = np.zeros(len(self.channels), dtype=bool)
+        for source in sources:
+            is_source[self._channel_index[source]] = True
+
+        for start in range(0, len(steps), CHUNK_SIZE):
+            chunk = _unique_rows(steps[start : start + CHUNK_SIZE])
+            rows, cols = np.nonzero(chunk >= 0)
+            paths = chunk[rows, cols]
+            failing = min(
+                self._first_relay_conflict(rows, paths),
+                self._first_exclusive_conflict(rows, cols, paths),
+                self._first_source_conflict(rows, paths, is_source),
+            )
+            if failing < len(chunk):
+                row = steps[start + failing]
+                exception = self._explain(row[row >= 0], is_source)
+                return PlanFailure(start + failing, _reason(exception), exception)
+        return None
+
+    def _first_relay_conflict(self, rows: np.ndarray, paths: np.ndarray) -> int:
+        counts = self._path_relay_counts[paths]
+        total = int(counts.sum())
+        if total == 0:
+            return _NONE
+        entry_rows = np.repeat(rows, counts)
+        ends = np.cumsum(counts)
+        offsets = np.repeat(self._path_relay_offsets[paths] - (ends - counts), counts)
+        relays = self._path_relays[offsets + np.arange(total)]
+
+        first = _NONE
+        reserved = self._reserved[relays]
+        if reserved.any():
+            first = int(entry_rows[reserved].min())
+        keys = entry_rows * len(self.relays) + relays
+        return min(first, _first_duplicate(keys, len(self.relays)))
+
+    def _first_exclusive_conflict(
+        self, rows: np.ndarray, cols: np.ndarray, paths: np.ndarray
+    ) -> int:
+        groups = len(self._group_src)
+        if groups == 0:
+            return _NONE
+        # A step conflicts if its exclusive source is connected to anything after it was
+        # first connected to one of its exclusive destinations.
+        member_keys, member_cols = _group_entries(
+            self._path_groups[:, paths], rows, cols, groups
+        )
+        if len(member_keys) == 0:
+            return _NONE
+        touch_keys, touch_cols = _group_entries(
+            self._touch_groups[:, paths], rows, cols, groups
+        )
+        width = int(cols.max()) + 1
+        member_keys, first_member = _reduce_by_key(member_keys, member_cols, width)
+        touch_keys, last_touch = _reduce_by_key(
+            touch_keys, touch_cols, width, last=True
+        )
+        # Every path connecting a source to a destination touches the source.
+        last_touch = last_touch[np.searchsorted(touch_keys, member_keys)]
+        conflicts = member_keys[last_touch > first_member]
+        return int(conflicts[0] // groups) if len(conflicts) else _NONE
+
+    def _first_source_conflict(
+        self, rows: np.ndarray, paths: np.ndarray, is_source: np.ndarray
+    ) -> int:
+        if not is_source.any():
+            return _NONE
+        n = len(self.channels)
+        u = self._path_src[paths]
+        v = self._path_dest[paths]
+        # (row, channel, source) for every source a channel is connected to or is itself.
+        triples = []
+        for channel, other in ((u, v), (v, u), (u, u), (v, v)):
+            connected = is_source[other]
+            triples.append(
+                (rows[connected] * n + channel[connected]) * n + other[connected]
+            )
+        pairs = np.unique(np.concatenate(triples)) // n
+        return _first_duplicate(pairs, n)
+
+    def _explain(self, paths: np.ndarray, is_source: np.ndarray) -> Exception:
+        """
+        Determine why a failing step fails by connecting its paths one by one, running the
+        checks in the order `AccessoryBoard.connect_channels` does.
+        """
+        peers: dict[str, list[str]] = {}
+        connected_sources: dict[str, set] = {}
+        # Connection holding each relay in use, None for relays closed on reset.
+        used: dict[str, ConnectionKey | None] = dict.fromkeys(
+            self.relays[idx] for idx in np.flatnonzero(self._reserved)
+        )
+        for path in dict.fromkeys(paths.tolist()):
+            key = ConnectionKey(
+                self.channels[self._path_src[path]],
+                self.channels[self._path_dest[path]],
+            )
+
+            for group in self._touch_groups[:, path].tolist():
+                if group >= 0:
+                    src = self.channels[self._group_src[group]]
+                    for peer in peers.get(src, ()):
+                        if peer in self._group_dests[group]:
+                            return ExclusiveConnectionConflictException(key, peer)
+
+            sources = {ch for ch in key if is_source[self._channel_index[ch]]}
+            for channel in key:
+                found = connected_sources.get(channel, set()) | sources
+                if len(found) > 1:
+                    return SourceConflictException(key, found)
+
+            start, end = self._path_relay_offsets[path : path + 2]
+            relays = [self.relays[idx] for idx in self._path_relays[start:end]]
+            for relay in relays:
+                if relay in used:
+                    return ResourceInUseException(relay, holder=used[relay])
+
+            channels = tuple(key)
+            peers.setdefault(channels[0], []).append(channels[-1])
+            peers.setdefault(channels[-1], []).append(channels[0])
+            for channel in key:
+                connected_sources.setdefault(channel, set()).update(sources)
+            used.update(dict.fromkeys(relays, key))
+        raise AssertionError("Step reported as failing has no conflict")
+
+
+_NONE = np.iinfo(np.int64).max
+
+
+def _unique_rows(steps: np.ndarray) -> np.ndarray:
+    """Replace path indices repeated within a row with -1, keeping the first occurrence."""
+    order = np.argsort(steps, axis=1, kind="stable")
+    ordered = np.take_along_axis(steps, order, axis=1)
+    repeated = np.zeros(steps.shape, dtype=bool)
+    repeated[:, 1:] = (ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] >= 0)
+    unique = np.empty_like(steps)
+    np.put_along_axis(unique, order, np.where(repeated, -1, ordered), axis=1)
+    return unique
+
+
+def _group_entries(
+    path_groups: np.ndarray, rows: np.ndarray, cols: np.ndarray, groups: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``row * groups + group`` and the column of every path end in a group."""
+    member = path_groups >= 0
+    keys = np.concatenate(
+        [rows[member[end]] * groups + path_groups[end][member[end]] for end in (0, 1)]
+    )
+    return keys, np.concatenate([cols[member[end]] for end in (0, 1)])
+
+
+def _reduce_by_key(
+    keys: np.ndarray, cols: np.ndarray, width: int, last: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the sorted unique keys and the lowest (or highest) column of each."""
+    combined = np.sort(keys * width + cols)
+    keys = combined // width
+    boundary = np.ones(len(keys), dtype=bool)
+    if last:
+        boundary[:-1] = keys[1:] != keys[:-1]
+    else:
+        boundary[1:] = keys[1:] != keys[:-1]
+    return keys[boundary], combined[boundary] % width
+
+
+def _first_duplicate(keys: np.ndarray, stride: int) -> int:
+    """Return the lowest row of a key occurring twice, keys being ``row * stride + value``."""
+    if len(keys) < 2:
+        return _NONE
+    keys = np.sort(keys)
+    duplicates = keys[1:][keys[1:] == keys[:-1]]
+    return int(duplicates[0] // stride) if len(duplicates) else _NONE
+
+
+def _reason(exception: Exception) -> str:
+    return exception.args[0] if isinstance(exception, KeyError) else str(exception)
@@ -0,0 +1,111 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.exceptions import (
+    ExclusiveConnectionConflictException,
+    PathUnsupportedException,
+    ResourceInUseException,
+)
+
+
+class CompiledPreset(NamedTuple):
+    """
+    A route preset resolved against a board.
+
+    :ivar connections: The shared connection keys of the preset paths, in preset order,
+        without duplicates.
+    :ivar relay_mask: Mask of all relays of the preset paths.
+    """
+
+    connections: tuple[ConnectionKey, ...]
+    relay_mask: int
+
+
+def preset_channels(
+    connections: Iterable[tuple[str, str]], params: Mapping[str, Any]
+) -> list[tuple[str, str]]:
+    """
+    Fill the parameters into the channel names of preset connections.
+
+    :param connections: Pairs of channel names, possibly with `str.format` fields.
+    :param params: Values of the fields.
+    :raises KeyError: A field has no value.
+    :raises ValueError: A field cannot be filled with its value, e.g. ``{ch:02d}`` with a
+        string, or is not a named field.
+    :return: The channel name pairs.
+    """
+    filled = []
+    for connection in connections:
+        pair = []
+        for channel in connection:
+            try:
+                pair.append(channel.format_map(params))
+            except KeyError as e:
+                raise KeyError(f"Missing preset parameter: {e.args[0]}") from None
+            except (AttributeError, IndexError, TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Cannot fill preset channel name {channel!r}: {e}"
+                ) from None
+        filled.append((pair[0], pair[1]))
+    return filled
+
+
+def compile_preset(
+    compiled: CompiledBoard, connections: Iterable[tuple[str, str]]
+) -> CompiledPreset:
+    """
+    Validate the connections of a preset against each other and resolve their paths.
+
+    Performs the checks of `AccessoryBoard.connect_channels` that do not depend on the
+    state of a board, as if the connections were made one by one on an empty board.
+    Sources are checked when the preset is applied.
+
+    :param compiled: The compiled board.
+    :param connections: Pairs of channel names.
+    :raises KeyError: A channel name is invalid.
+    :raises PathUnsupportedException: Two channels have no path.
+    :raises ResourceInUseException: Two paths of the preset use the same relay.
+    :raises ExclusiveConnectionConflictException: Two connections of the preset are
+        mutually exclusive.
+    :return: The compiled preset.
+    """
+    keys: dict[ConnectionKey, None] = {}
+    peers: dict[str, set[str]] = {}
+    mask = 0
+    for channel1, channel2 in connections:
+        invalid_channels = [
+            ch for ch in (channel1, channel2) if ch not in compiled.channels
+        ]
+        if invalid_channels:
+            raise KeyError(
+                f"Invalid channel names provided: {', '.join(invalid_channels)}"
+            )
+        path = compiled.path_index.get(ConnectionKey(channel1, channel2))
+        if path is None:
+            raise PathUnsupportedException(ConnectionKey(channel1, channel2))
+        key = compiled.paths[path]
+        if key in keys:
+            continue
+
+        for channel in key:
+            dests = compiled.exclusive_connections.get(channel)
+            if dests is not None:
+                for peer in peers.get(channel, ()):
+                    if peer in dests:
+                        raise ExclusiveConnectionConflictException(key, peer)
+
+        path_mask = compiled.masks_by_path[path]
+        if mask & path_mask:
+            overlap = mask & path_mask
+            relay = (overlap & -overlap).bit_length() - 1
+            holder = next(k for k in keys if compiled.path_masks[k] >> relay & 1)
+            raise ResourceInUseException(compiled.relays[relay], holder=holder)
+
+        mask |= path_mask
+        keys[key] = None
+        channels = tuple(key)
+        peers.setdefault(channels[0], set()).add(channels[-1])
+        peers.setdefault(channels[-1], set()).add(channels[0])
+    return CompiledPreset(tuple(keys), mask)
@@ -0,0 +1,157 @@
+import time
+from typing import Any
+
+# Board methods timed as operations, and the name they are reported under.
+BOARD_OPERATIONS = (
+    ("_connect_channels", "connect_channels"),
+    ("_disconnect_channels", "disconnect_channels"),
+    ("_disconnect_all_channels", "disconnect_all_channels"),
+    ("_reset", "reset"),
+    ("_try_connect", "try_connect"),
+    ("_try_disconnect", "try_disconnect"),
+    ("_apply_preset", "apply_preset"),
+)
+
+# Board and controller methods timed as phases of an operation. The checks shared by the
+# raising and the try_ operations are reported under the name of the validation step.
+BOARD_PHASES = (
+    ("_check_channel_names", "validate_channel_names"),
+    ("_check_exclusive_connections", "validate_exclusive_connections"),
+    ("_check_single_source", "validate_single_source"),
+    ("_check_path_exists", "validate_path_exists"),
+    ("_check_relays", "validate_relays"),
+)
+CONTROLLER_PHASES = (
+    ("set_relay", "set_relay"),
+    ("_build_relay_mask", "build_relay_mask"),
+    ("write_relays_to_device", "write_relays_to_device"),
+    ("_settle", "settle"),
+    ("read_relays_from_device", "read_relays_from_device"),
+)
+
+
+class PhaseTiming:
+    """
+    Accumulated timing of one operation or phase.
+
+    :ivar calls: Number of timed calls.
+    :ivar total: Total time in seconds.
+    :ivar max: Longest single call in seconds.
+    """
+
+    __slots__ = ("calls", "max", "total")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class Profile:
+    """
+    Timings captured by `AccessoryBoard.profile`.
+
+    Operations are the public board operations. Phases are the steps they are made of;
+    they nest, e.g. ``write_relays_to_device`` includes ``settle``.
+
+    :ivar operations: Timing per operation name.
+    :ivar phases: Timing per phase name.
+    """
+
+    def __init__(self):
+        self.operations: dict[str, PhaseTiming] = {}
+        self.phases: dict[str, PhaseTiming] = {}
+
+    @staticmethod
+    def _record(table: dict[str, PhaseTiming], name: str, seconds: float) -> None:
+        timing = table.get(name)
+        if timing is None:
+            timing = table[name] = PhaseTiming()
+        timing.calls += 1
+        timing.total += seconds
+        timing.max = max(timing.max, seconds)
+
+    def report(self) -> str:
+        """Render the operations and phases as tables sorted by total time."""
+        lines = []
+        for title, table in (("Operation", self.operations), ("Phase", self.phases)):
+            if not table:
+                continue
+            width = max(len(title), *(len(name) for name in table))
+            lines.append(
+                f"{title:<{width}}  {'calls':>8}  {'total ms':>10}  {'mean us':>10}  {'max us':>10}"
+            )
+            for name, timing in sorted(
+                table.items(), key=lambda item: item[1].total, reverse=True
+            ):
+                lines.append(
+                    f"{name:<{width}}  {timing.calls:>8}  {timing.total * 1e3:>10.3f}"
+                    f"  {timing.mean * 1e6:>10.1f}  {timing.max * 1e6:>10.1f}"
+                )
+            lines.append("")
+        return "\n".join(lines) if lines else "No operations profiled."
+
+    def __str__(self) -> str:
+        return self.report()
+
+
+class BoardProfiler:
+    """
+    Context manager timing the operations of an AccessoryBoard and its controller.
+
+    While active, the timed methods are replaced on the board and controller instances by
+    timing wrappers. They are restored on exit, so profiling has no cost outside the block.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.profile = Profile()
+        self._patched: list[tuple[Any, str, bool, Any]] = []
+
+    def __enter__(self) -> Profile:
+        if getattr(self.board, "_profiling", False):
+            raise RuntimeError("Board is already being profiled")
+        self.board._profiling = True
+        board = self.board
+        controller = board.board_controller
+        operations = self.profile.operations
+        phases = self.profile.phases
+        for attr, name in BOARD_OPERATIONS:
+            self._wrap(board, attr, operations, name)
+        for attr, name in BOARD_PHASES:
+            self._wrap(board, attr, phases, name)
+        for attr, name in CONTROLLER_PHASES:
+            if hasattr(controller, attr):
+                self._wrap(controller, attr, phases, name)
+        return self.profile
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        for obj, attr, had_own, previous in reversed(self._patched):
+            if had_own:
+                setattr(obj, attr, previous)
+            else:
+                delattr(obj, attr)
+        self._patched.clear()
+        self.board._profiling = False
+
+    def _wrap(
+        self, obj: Any, attr: str, table: dict[str, PhaseTiming], name: str
+    ) -> None:
+        original = getattr(obj, attr)
+        record = Profile._record
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(table, name, perf_counter() - start)
+
+        own = vars(obj)
+        self._patched.append((obj, attr, attr in own, own.get(attr)))
+        setattr(obj, attr, timed)
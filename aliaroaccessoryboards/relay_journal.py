@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+from enum import IntEnum
+from pathlib import Path
+
+import numpy as np
+
+_MAGIC = b"ARJ1"
+_VERSION = 1
+# magic, version, mask_size, record_size, capacity, count, relay_count
+_HEADER = struct.Struct("<4sHHIQQI")
+_HEADER_SIZE = 64
+_COUNT_OFFSET = struct.calcsize("<4sHHIQ")
+# timestamp_ns, board_id, operation; followed by the relay mask bytes
+_RECORD_PREFIX = struct.Struct("<QIH2x")
+
+
+class JournalOperation(IntEnum):
+    """Operation that applied a relay mask."""
+
+    CONNECT = 1
+    DISCONNECT = 2
+    DISCONNECT_ALL = 3
+    RESET = 4
+    INTERLOCK = 5
+    PRESET = 6
+
+
+def _record_size(mask_size: int) -> int:
+    return (_RECORD_PREFIX.size + mask_size + 7) // 8 * 8
+
+
+def record_dtype(mask_size: int) -> np.dtype:
+    """NumPy dtype of a journal record with a relay mask of ``mask_size`` bytes."""
+    return np.dtype(
+        {
+            "names": ["timestamp_ns", "board_id", "operation", "mask"],
+            "formats": ["<u8", "<u4", "<u2", ("u1", (mask_size,))],
+            "offsets": [0, 8, 12, _RECORD_PREFIX.size],
+            "itemsize": _record_size(mask_size),
+        }
+    )
+
+
+class RelayJournal:
+    """
+    Append-only binary journal of applied relay masks.
+
+    Records have a fixed size and are written through a memory-mapped, preallocated file:
+    a monotonic timestamp in nanoseconds, the board id, the `JournalOperation` and the
+    relay mask. The record count in the file header is updated after each record, so a
+    reader never sees a partially written record.
+
+    When the file is full it is rotated to ``<path>.1`` (shifting older files up to
+    ``backups``) and a new file is started.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        relay_count: int,
+        board_id: int = 0,
+        max_bytes: int = 16 * 1024 * 1024,
+        backups: int = 3,
+    ):
+        """
+        :param path: Path of the journal file. An existing compatible journal is appended to.
+        :param relay_count: Number of relays on the board.
+        :param board_id: Identifier stored with every record.
+        :param max_bytes: Size of a journal file before it is rotated.
+        :param backups: Number of rotated files to keep.
+        """
+        self.path = Path(path)
+        self.relay_count = relay_count
+        self.board_id = board_id
+        self.backups = backups
+        self.mask_size = (relay_count + 7) // 8
+        self.record_size = _record_size(self.mask_size)
+        self.capacity = max(1, (max_bytes - _HEADER_SIZE) // self.record_size)
+        self._lock = threading.Lock()
+        self._open()
+
+    def _open(self) -> None:
+        size = _HEADER_SIZE + self.capacity * self.record_size
+        count = self._existing_count(size)
+        if count is None:
+            if self.path.exists():
+                self._rotate_files()
+            with open(self.path, "wb") as f:
+                f.truncate(size)
+            count = 0
+        # The mapping keeps its own handle to the file.
+        with open(self.path, "r+b") as f:
+            self._map = mmap.mmap(f.fileno(), size)
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            _VERSION,
+            self.mask_size,
+            self.record_size,
+            self.capacity,
+            count,
+            self.relay_count,
+        )
+        self._count = count
+
+    def _existing_count(self, size: int):
+        """Return the record count of a compatible existing journal, or None."""
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(_HEADER.size)
+        except FileNotFoundError:
+            return None
+        if len(header) < _HEADER.size or os.path.getsize(self.path) != size:
+            return None
+        magic, version, mask_size, _record_size, capacity, count, relay_count = (
+            _HEADER.unpack(header)
+        )
+        if (magic, version, mask_size, relay_count, capacity) != (
+            _MAGIC,
+            _VERSION,
+            self.mask_size,
+            self.relay_count,
+            self.capacity,
+        ) or count >= capacity:
+            return None
+        return count
+
+    def _rotate_files(self) -> None:
+        if self.backups == 0:
+            self.path.unlink()
+            return
+        for index in range(self.backups, 0, -1):
+            source = self._rotated_path(index - 1)
+            if source.exists():
+                os.replace(source, self._rotated_path(index))
+
+    def _rotated_path(self, index: int) -> Path:
+        return (
+            self.path
+            if index == 0
+            else self.path.with_name(f"{self.path.name}.{index}")
+        )
+
+    def append(self, operation: int, relay_mask: int) -> None:
+        """
+        Append a record for an applied relay mask.
+
+        :param operation: The `JournalOperation` that applied the mask.
+        :param relay_mask: The applied relay mask.
+        :return: None
+        """
+        timestamp = time.monotonic_ns()
+        with self._lock:
+            if self._count == self.capacity:
+                self._close_map()
+                self._open()
+            offset = _HEADER_SIZE + self._count * self.record_size
+            _RECORD_PREFIX.pack_into(
+                self._map, offset, timestamp, self.board_id, operation
+            )
+            start = offset + _RECORD_PREFIX.size
+            self._map[start : start + self.mask_size] = relay_mask.to_bytes(
+                self.mask_size, byteorder="little"
+            )
+            self._count += 1
+            struct.pack_into("<Q", self._map, _COUNT_OFFSET, self._count)
+
+    def flush(self) -> None:
+        """Flush written records to disk."""
+        self._map.flush()
+
+    def _close_map(self) -> None:
+        self._map.flush()
+        self._map.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_map()
+
+
+def read_journal(path: str | Path, include_rotated: bool = False) -> np.ndarray:
+    """
+    Decode a journal file into a NumPy structured array.
+
+    :param path: Path of the journal file.
+    :param include_rotated: Also read the rotated files, oldest first.
+    :return: Records with fields ``timestamp_ns``, ``board_id``, ``operation`` and ``mask``
+        (the relay mask as little-endian bytes).
+    """
+    path = Path(path)
+    paths: list[Path] = [path]
+    if include_rotated:
+        index = 1
+        while path.with_name(f"{path.name}.{index}").exists():
+            paths.insert(0, path.with_name(f"{path.name}.{index}"))
+            index += 1
+
+    chunks = []
+    dtype = None
+    for file_path in paths:
+        data = file_path.read_bytes()
+        magic, version, mask_size, _record_size, _capacity, count, _ = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{file_path} is not a relay journal")
+        if dtype is not None and dtype != record_dtype(mask_size):
+            raise ValueError(f"{file_path} has a different record layout")
+        dtype = record_dtype(mask_size)
+        chunks.append(
+            np.frombuffer(data, dtype=dtype, count=count, offset=_HEADER_SIZE)
+        )
+    return np.concatenate(chunks)
+
+
+def unpack_relays(records: np.ndarray, relay_count: int) -> np.ndarray:
+    """
+    Expand the relay masks of journal records into a boolean array.
+
+    :param records: Records returned by `read_journal`.
+    :param relay_count: Number of relays on the board.
+    :return: Array of shape ``(len(records), relay_count)``, True where a relay is closed.
+    """
+    bits = np.unpackbits(records["mask"], axis=1, bitorder="little")
+    return bits[:, :relay_count].astype(bool)
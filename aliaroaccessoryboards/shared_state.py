@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+from collections.abc import Iterable, Sequence
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+from aliaroaccessoryboards.connection_key import ConnectionKey
+
+_MAGIC = b"ABSS"
+_VERSION = 1
+
+# Static header, written once when the segment is created.
+# magic, version, relay_count, channel_count, max_connections, names_size
+_HEADER = struct.Struct("<4sIIIII")
+# Sequence counter guarding the payload. Odd while an update is in progress.
+_SEQUENCE = struct.Struct("<Q")
+# Payload prefix: publish time (ns since epoch), number of active connections.
+_PAYLOAD = struct.Struct("<QI4x")
+# A connection is stored as a pair of channel indices.
+_CONNECTION = struct.Struct("<HH")
+
+_SEQUENCE_OFFSET = _HEADER.size
+_PAYLOAD_OFFSET = _SEQUENCE_OFFSET + _SEQUENCE.size
+
+
+class _Layout(NamedTuple):
+    relay_count: int
+    channel_count: int
+    max_connections: int
+    names_size: int
+
+    @property
+    def mask_size(self) -> int:
+        return (self.relay_count + 7) // 8
+
+    @property
+    def mask_offset(self) -> int:
+        return _PAYLOAD_OFFSET + _PAYLOAD.size
+
+    @property
+    def connections_offset(self) -> int:
+        return self.mask_offset + self.mask_size
+
+    @property
+    def names_offset(self) -> int:
+        return self.connections_offset + self.max_connections * _CONNECTION.size
+
+    @property
+    def size(self) -> int:
+        return self.names_offset + self.names_size
+
+
+class SharedStateSnapshot(NamedTuple):
+    """
+    A consistent copy of the state published by an AccessoryBoard.
+
+    :ivar sequence: Version of the published state. Increases by two on every publish.
+    :ivar timestamp_ns: Wall clock time of the publish, in nanoseconds since the epoch.
+    :ivar relay_mask: Last known relay mask of the board, bit ``n`` corresponding to relay ``n``.
+    :ivar connections: The active connections on the board.
+    """
+
+    sequence: int
+    timestamp_ns: int
+    relay_mask: int
+    connections: frozenset[ConnectionKey]
+
+
+# Segments created by publishers of this process, which own their registration with
+# the resource tracker.
+_published: set[str] = set()
+
+
+class SharedStatePublisher:
+    """
+    Publishes the state of an AccessoryBoard into a shared memory segment.
+
+    Updates are guarded by a sequence counter (a seqlock): the counter is odd while an
+    update is being written and even once it is complete. Readers never block the
+    publisher and retry if the counter changed while they were copying the state.
+
+    There must be only one publisher per segment.
+    """
+
+    def __init__(
+        self,
+        name: str | None,
+        relay_count: int,
+        channels: Sequence[str],
+        max_connections: int,
+    ):
+        if len(channels) > 0xFFFF:
+            raise ValueError("Shared state supports at most 65535 channels")
+        self._channel_index = {channel: idx for idx, channel in enumerate(channels)}
+        names = "\n".join(channels).encode("utf-8")
+        self._layout = _Layout(relay_count, len(channels), max_connections, len(names))
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=self._layout.size
+        )
+        buf = self._shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, _VERSION, *self._layout)
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, 0)
+        buf[self._layout.names_offset : self._layout.size] = names
+        self._sequence = 0
+        _published.add(self._shm.name)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment, used to attach a SharedStateReader."""
+        return self._shm.name
+
+    def publish(self, relay_mask: int, connections: Iterable[ConnectionKey]) -> None:
+        """
+        Write a new state into the shared memory segment.
+
+        :param relay_mask: The relay mask to publish.
+        :param connections: The active connections to publish. A connection of a channel
+            to itself is stored as a pair of the same channel.
+        :return: None
+        """
+        layout = self._layout
+        channel_index = self._channel_index
+        pairs = []
+        for connection in connections:
+            channels = tuple(connection)
+            pairs.append((channel_index[channels[0]], channel_index[channels[-1]]))
+        if len(pairs) > layout.max_connections:
+            raise ValueError(
+                f"Cannot publish {len(pairs)} connections, segment holds at most {layout.max_connections}"
+            )
+
+        buf = self._shm.buf
+        self._sequence += 1
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence)
+
+        _PAYLOAD.pack_into(buf, _PAYLOAD_OFFSET, time.time_ns(), len(pairs))
+        buf[layout.mask_offset : layout.connections_offset] = relay_mask.to_bytes(
+            layout.mask_size, byteorder="little"
+        )
+        offset = layout.connections_offset
+        for first, second in pairs:
+            _CONNECTION.pack_into(buf, offset, first, second)
+            offset += _CONNECTION.size
+
+        self._sequence += 1
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence)
+
+    def close(self, unlink: bool = True) -> None:
+        """
+        Detach from the shared memory segment.
+
+        :param unlink: Also destroy the segment. Attached readers keep their mapping.
+        :return: None
+        """
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+            _published.discard(self._shm.name)
+
+
+class SharedStateReader:
+    """
+    Reads the state published by a SharedStatePublisher without taking any locks.
+
+    Readers attach to an existing segment by name and never write to it, so any number of
+    local processes can poll the state without touching the board or its owning process.
+    """
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        buf = self._shm.buf
+        magic, version, *layout = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory segment '{name}' is not a board state")
+        self._layout = _Layout(*layout)
+        names = bytes(buf[self._layout.names_offset : self._layout.size])
+        self.channels = tuple(names.decode("utf-8").split("\n")) if names else ()
+        self.relay_count = self._layout.relay_count
+
+    def read(self, timeout: float = 1.0) -> SharedStateSnapshot:
+        """
+        Return a consistent snapshot of the published state.
+
+        :param timeout: Maximum time in seconds to retry while the publisher is mid-update.
+        :raises TimeoutError: No consistent snapshot could be taken within ``timeout``.
+        :return: The published state.
+        """
+        layout = self._layout
+        buf = self._shm.buf
+        end = layout.names_offset
+        deadline = None
+        while True:
+            before = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0]
+            if not before & 1:
+                payload = bytes(buf[_PAYLOAD_OFFSET:end])
+                if _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0] == before:
+                    return self._decode(before, payload)
+            if deadline is None:
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for a consistent board state")
+            time.sleep(0)
+
+    @property
+    def sequence(self) -> int:
+        """The current sequence number, useful to cheaply detect changes between reads."""
+        return _SEQUENCE.unpack_from(self._shm.buf, _SEQUENCE_OFFSET)[0]
+
+    def _decode(self, sequence: int, payload: bytes) -> SharedStateSnapshot:
+        layout = self._layout
+        timestamp_ns, connection_count = _PAYLOAD.unpack_from(payload, 0)
+        mask_start = layout.mask_offset - _PAYLOAD_OFFSET
+        connections_start = layout.connections_offset - _PAYLOAD_OFFSET
+        relay_mask = int.from_bytes(
+            payload[mask_start:connections_start], byteorder="little"
+        )
+        connections = frozenset(
+            ConnectionKey(self.channels[first], self.channels[second])
+            for first, second in _CONNECTION.iter_unpack(
+                payload[
+                    connections_start : connections_start
+                    + connection_count * _CONNECTION.size
+                ]
+            )
+        )
+        return SharedStateSnapshot(sequence, timestamp_ns, relay_mask, connections)
+
+    def close(self) -> None:
+        self._shm.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without handing its lifetime to this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached segments with the resource tracker, which
+        # would destroy the segment when the reader exits.
+        shm = shared_memory.SharedMemory(name=name)
+        # Registrations are per name, so keep the one of a publisher in this process.
+        # POSIX segments are registered under their name with a leading slash.
+        if os.name == "posix" and shm.name not in _published:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister("/" + shm.name, "shared_memory")
+        return shm
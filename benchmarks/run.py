@@ -0,0 +1,322 @@
+"""
+Benchmarks for the AccessoryBoard hot paths on synthetic boards of increasing size.
+
+Results are written as JSON so runs can be compared across commits::
+
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --output current.json --compare baseline.json --threshold 0.25
+
+The comparison exits with a non-zero status if any benchmark is slower than the baseline
+by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterable
+from typing import Any, Callable, NamedTuple
+
+import pydantic_yaml
+
+from aliaroaccessoryboards import AccessoryBoard, BoardConfig, SimulatedBoardController
+from aliaroaccessoryboards.board_generator import (
+    dut_channel_names,
+    generate_board_config,
+)
+from aliaroaccessoryboards.exceptions import AccessoryBoardException
+
+DEFAULT_SIZES = (32, 256, 1024, 4096)
+BUS = "BUS1_1"
+OTHER_BUS = "BUS1_2"
+# Boards created by the board_footprint benchmark.
+FLEET_SIZE = 10
+
+
+class Benchmark(NamedTuple):
+    """
+    :ivar name: Name of the benchmark.
+    :ivar setup: Called before every round with the board config, returns the state passed to ``run``.
+    :ivar run: The timed operation.
+    :ivar operations: Number of operations ``run`` performs for a board with the given channel count.
+    :ivar memory: Also measure the memory allocated by ``run`` in an extra round: the peak,
+        and what is still held by its return value.
+    """
+
+    name: str
+    setup: Callable[[BoardConfig], Any]
+    run: Callable[[Any], None]
+    operations: Callable[[int], int]
+    memory: bool = False
+
+
+def _new_board(config: BoardConfig) -> AccessoryBoard:
+    return AccessoryBoard(config, SimulatedBoardController(config))
+
+
+def _connected_board(config: BoardConfig) -> AccessoryBoard:
+    board = _new_board(config)
+    _connect_all(board)
+    return board
+
+
+def _connect_all(board: AccessoryBoard) -> None:
+    for channel in dut_channel_names(board._board_config):
+        board.connect_channels(channel, BUS)
+
+
+def _disconnect_all(board: AccessoryBoard) -> None:
+    for channel in dut_channel_names(board._board_config):
+        board.disconnect_channels(channel, BUS)
+
+
+def _connect_conflicting(board: AccessoryBoard) -> None:
+    # Every DUT channel is already connected to BUS, which is exclusive with the others.
+    for channel in dut_channel_names(board._board_config):
+        try:
+            board.connect_channels(channel, OTHER_BUS)
+        except AccessoryBoardException:
+            pass
+
+
+def _try_connect_conflicting(board: AccessoryBoard) -> None:
+    for channel in dut_channel_names(board._board_config):
+        board.try_connect(channel, OTHER_BUS)
+
+
+def _parse_pydantic_yaml(text: str) -> BoardConfig:
+    return pydantic_yaml.parse_yaml_raw_as(BoardConfig, text)
+
+
+def _compiled_config(config: BoardConfig) -> BoardConfig:
+    # Create a board first, so the shared tables of the config are not counted.
+    _new_board(config)
+    return config
+
+
+def _new_fleet(config: BoardConfig) -> list[AccessoryBoard]:
+    return [_connected_board(config) for _ in range(FLEET_SIZE)]
+
+
+def _query_state(board: AccessoryBoard) -> None:
+    board.peers_of(BUS)
+    board.net_of(BUS)
+    board.connected_channels()
+    board.state_arrays()
+
+
+def _preset_board(config: BoardConfig) -> AccessoryBoard:
+    board = _new_board(config)
+    board.register_preset(
+        "all", [(channel, BUS) for channel in dut_channel_names(config)]
+    )
+    # Compile the preset, so only applying it is timed.
+    board.apply_preset("all")
+    board.disconnect_all_channels()
+    return board
+
+
+def _apply_preset(board: AccessoryBoard) -> None:
+    board.apply_preset("all")
+
+
+def _recover_state(board: AccessoryBoard) -> None:
+    AccessoryBoard(board._board_config, board.board_controller, reset=False)
+
+
+BENCHMARKS = (
+    Benchmark(
+        "config_load",
+        lambda config: pydantic_yaml.to_yaml_str(config),
+        BoardConfig.from_brd_string,
+        lambda size: 1,
+        memory=True,
+    ),
+    Benchmark(
+        "config_load_pydantic_yaml",
+        lambda config: pydantic_yaml.to_yaml_str(config),
+        _parse_pydantic_yaml,
+        lambda size: 1,
+        memory=True,
+    ),
+    Benchmark(
+        "config_validate",
+        lambda config: config.model_dump(),
+        BoardConfig.model_validate,
+        lambda size: 1,
+    ),
+    Benchmark(
+        "config_trusted",
+        lambda config: config.model_dump(),
+        BoardConfig.from_trusted,
+        lambda size: 1,
+    ),
+    Benchmark("construction", lambda config: config, _new_board, lambda size: 1),
+    Benchmark("connect_channels", _new_board, _connect_all, lambda size: size),
+    Benchmark("disconnect_channels", _connected_board, _disconnect_all, lambda s: s),
+    Benchmark("apply_preset", _preset_board, _apply_preset, lambda size: size),
+    Benchmark("connect_conflicts", _connected_board, _connect_conflicting, lambda s: s),
+    Benchmark(
+        "try_connect_conflicts",
+        _connected_board,
+        _try_connect_conflicting,
+        lambda size: size,
+    ),
+    Benchmark("reset", _connected_board, AccessoryBoard.reset, lambda size: 1),
+    Benchmark(
+        "disconnect_all_channels",
+        _connected_board,
+        AccessoryBoard.disconnect_all_channels,
+        lambda size: 1,
+    ),
+    Benchmark("state_recovery", _connected_board, _recover_state, lambda size: 1),
+    Benchmark("state_queries", _connected_board, _query_state, lambda size: 1),
+    Benchmark(
+        "board_footprint",
+        _compiled_config,
+        _new_fleet,
+        lambda size: FLEET_SIZE,
+        memory=True,
+    ),
+)
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    rounds: int = 5,
+    names: Iterable[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Run the benchmarks for every board size.
+
+    :param sizes: DUT channel counts of the synthetic boards.
+    :param rounds: Number of timed rounds per benchmark and size.
+    :param names: Only run the benchmarks with these names.
+    :return: Timings in seconds per operation, keyed ``"<benchmark>[<size>]"``, and for
+        benchmarks measuring memory the peak allocation in bytes as ``"peak_bytes"`` and the
+        memory held by the result per operation as ``"retained_bytes_per_op"``, e.g. the
+        footprint of one board for ``board_footprint``.
+    """
+    selected = [b for b in BENCHMARKS if names is None or b.name in set(names)]
+    results = {}
+    for size in sizes:
+        config = generate_board_config(dut_channels=size, buses=2)
+        for benchmark in selected:
+            operations = benchmark.operations(size)
+            timings = []
+            for _ in range(rounds):
+                state = benchmark.setup(config)
+                start = time.perf_counter()
+                benchmark.run(state)
+                timings.append((time.perf_counter() - start) / operations)
+            result = results[f"{benchmark.name}[{size}]"] = {
+                "median": statistics.median(timings),
+                "min": min(timings),
+                "max": max(timings),
+                "rounds": rounds,
+                "operations": operations,
+            }
+            if benchmark.memory:
+                peak, retained = _measure_memory(benchmark, config)
+                result["peak_bytes"] = peak
+                result["retained_bytes_per_op"] = retained / operations
+    return results
+
+
+def _measure_memory(benchmark: Benchmark, config: BoardConfig) -> tuple[int, int]:
+    state = benchmark.setup(config)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = benchmark.run(state)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+        return peak, retained
+    finally:
+        tracemalloc.stop()
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    :param results: Timings from `run_benchmarks`.
+    :param baseline: Timings from an earlier run.
+    :param threshold: Allowed relative slowdown of the median, e.g. 0.25 for 25%.
+    :return: A description of every benchmark slower than allowed.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median"]
+        after = result["median"]
+        if after > before * (1 + threshold):
+            regressions.append(
+                f"{name}: {after * 1e6:.1f}us vs {before * 1e6:.1f}us (+{after / before - 1:.0%})"
+            )
+    return regressions
+
+
+def _report(results: dict[str, dict[str, float]]) -> str:
+    width = max(len(name) for name in results)
+    return "\n".join(
+        f"{name:<{width}}  {result['median'] * 1e6:12.2f} us/op"
+        + (
+            f"  {result['peak_bytes'] / 2**20:8.2f} MiB peak"
+            f"  {result['retained_bytes_per_op'] / 1024:10.2f} KiB/op retained"
+            if "peak_bytes" in result
+            else ""
+        )
+        for name, result in results.items()
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="Benchmark names to run")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.rounds, args.only)
+    print(_report(results))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
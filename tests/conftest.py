@@ -0,0 +1,10 @@
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from tests.shared import board_config
+
+
+@pytest.fixture
+def board(board_config: board_config) -> AccessoryBoard:
+    return AccessoryBoard(board_config, SimulatedBoardController(board_config))
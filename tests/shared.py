@@ -3,8 +3,8 @@ import pytest
 from aliaroaccessoryboards.board_config import (
     BoardConfig,
     ConnectionPath,
-    InitializationCommands,
     ExclusiveConnection,
+    InitializationCommands,
 )
 
 
@@ -1,13 +1,18 @@
-import pytest
 from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
 from aliaroaccessoryboards import (
-    SimulatedBoardController,
+    ConnectionStatus,
+    ExclusiveConnectionConflictException,
     PathUnsupportedException,
     ResourceInUseException,
+    SimulatedBoardController,
     SourceConflictException,
-    ExclusiveConnectionConflictException,
 )
 from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.board_config import ConnectionPath
 from aliaroaccessoryboards.connection_key import ConnectionKey
 from tests.shared import board_config
 
@@ -276,8 +281,27 @@ def test_accessory_board_connect_relay_in_other_path_raises_resource_in_use_exce
     )
 
     accessory_board.connect_channels("A", "C")  # Uses relay AC
-    with pytest.raises(ResourceInUseException):
+    with pytest.raises(ResourceInUseException) as exc_info:
         accessory_board.connect_channels("X", "Y")  # Uses relays AC and BD
+    assert exc_info.value.holder == ConnectionKey("A", "C")
+
+
+def test_accessory_board_relay_closed_on_reset_is_held_by_its_path(
+    board_config: board_config,
+):
+    board_config.initialization_commands.close_relays = ["BD"]
+    accessory_board = AccessoryBoard(
+        board_config, SimulatedBoardController(board_config)
+    )
+
+    # Both paths using BD are registered on reset, so X-Y is already connected.
+    assert accessory_board._holder_of("BD") in {
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
+    assert accessory_board.try_connect("X", "Y").status == (
+        ConnectionStatus.ALREADY_CONNECTED
+    )
 
 
 def test_accessory_board_direct_connect_two_sources_raises_source_conflict_exception(
@@ -404,3 +428,200 @@ def test_accessory_board_connect_two_exclusive_values_raises_exclusive_connectio
     accessory_board.connect_channels("A", "C")
     with pytest.raises(ExclusiveConnectionConflictException):
         accessory_board.connect_channels("A", "D")
+
+
+def test_accessory_board_reconcile_reads_device_state(board_config: board_config):
+    board_controller = SimulatedBoardController(board_config)
+    accessory_board = AccessoryBoard(
+        board_config=board_config,
+        board_controller=board_controller,
+        reset=True,
+    )
+    accessory_board.connect_channels("A", "C")
+
+    # Change the relays behind the board's back.
+    board_controller.write_relays_to_device(1 << board_config.relays.index("BD"))
+    accessory_board.reconcile()
+
+    # X-Y uses the closed BD, so it is registered as well.
+    assert accessory_board._connections == {
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
+    assert accessory_board._relay_counter["AC"] == 0
+    assert accessory_board._relay_counter["BD"] == 2
+    accessory_board.connect_channels("A", "C")
+    assert board_controller.read_relays_from_device() == 0b1001
+
+
+def test_accessory_board_force_open_keeps_reset_relays(board_config: board_config):
+    board_config.initialization_commands.close_relays = ["BD"]
+    board_controller = SimulatedBoardController(board_config)
+    accessory_board = AccessoryBoard(board_config, board_controller)
+    accessory_board.connect_channels("A", "D")
+    board_controller.set_relay(board_config.relays.index("BC"), True)
+
+    accessory_board.force_open()
+    assert board_controller.read_relays_from_device() == (
+        accessory_board.reset_relay_mask
+    )
+    assert accessory_board._connections == {
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
+    board_controller.commit_relays()
+    assert board_controller.read_relays_from_device() == 0b1000
+
+
+def test_accessory_board_failed_reconcile_keeps_bookkeeping(
+    board_config: board_config,
+):
+    board_controller = SimulatedBoardController(board_config)
+    accessory_board = AccessoryBoard(board_config, board_controller)
+    accessory_board.connect_channels("A", "C")
+    board_controller.set_relay(board_config.relays.index("BD"), True)
+
+    with pytest.raises(RuntimeError):
+        accessory_board.reconcile()
+    assert accessory_board._connections == {ConnectionKey("A", "C")}
+    assert accessory_board._relay_counter["AC"] == 1
+    assert accessory_board.try_connect("X", "Y").status == (
+        ConnectionStatus.RESOURCE_IN_USE
+    )
+
+
+@pytest.mark.parametrize("reset", [True, False])
+def test_accessory_board_registers_paths_with_any_relay_closed(
+    board_config: board_config, reset: bool
+):
+    board_config.initialization_commands.close_relays = ["BD"]
+    board_controller = SimulatedBoardController(board_config)
+    if not reset:
+        board_controller.write_relays_to_device(1 << board_config.relays.index("BD"))
+    accessory_board = AccessoryBoard(board_config, board_controller, reset=reset)
+
+    # X-Y also uses the open AC, but one closed relay is enough.
+    assert accessory_board._connections == {
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
+    accessory_board.reconcile()
+    assert accessory_board._connections == {
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
+
+
+def test_accessory_board_does_not_register_paths_without_relays(
+    board_config: board_config,
+):
+    board_config.connection_paths.append(ConnectionPath(src="A", dest="B", relays=[]))
+    board_config.exclusive_connections = []
+    board_config.initialization_commands.close_relays = ["AC"]
+    board_controller = SimulatedBoardController(board_config)
+    accessory_board = AccessoryBoard(board_config, board_controller)
+
+    assert accessory_board._connections == {
+        ConnectionKey("A", "C"),
+        ConnectionKey("X", "Y"),
+    }
+    accessory_board.reconcile()
+    assert ConnectionKey("A", "B") not in accessory_board._connections
+    accessory_board.disconnect_all_channels()
+    assert accessory_board._connections == set()
+
+
+def test_accessory_board_try_connect_reports_conflicts(board_config: board_config):
+    board_controller = SimulatedBoardController(board_config)
+    accessory_board = AccessoryBoard(board_config, board_controller)
+    accessory_board.mark_as_source("B")
+
+    result = accessory_board.try_connect("A", "C")
+    assert result.status == ConnectionStatus.CONNECTED
+    assert result.ok
+    assert accessory_board.try_connect("C", "A").status == (
+        ConnectionStatus.ALREADY_CONNECTED
+    )
+
+    expected = {
+        ("A", "Z"): (ConnectionStatus.INVALID_CHANNEL, ("Z",)),
+        ("A", "D"): (ConnectionStatus.EXCLUSIVE_CONFLICT, "C"),
+        ("C", "D"): (ConnectionStatus.PATH_UNSUPPORTED, None),
+        ("X", "Y"): (ConnectionStatus.RESOURCE_IN_USE, "AC"),
+    }
+    for (channel1, channel2), (status, detail) in expected.items():
+        result = accessory_board.try_connect(channel1, channel2)
+        assert (result.status, result.detail) == (status, detail)
+        assert not result.ok
+
+    accessory_board.mark_as_source("A")
+    result = accessory_board.try_connect("B", "C")
+    assert result.status == ConnectionStatus.SOURCE_CONFLICT
+    assert result.detail == {"A"}
+
+    assert accessory_board._connections == {ConnectionKey("A", "C")}
+    assert board_controller.read_relays_from_device() == 0b0001
+
+
+def test_accessory_board_try_disconnect(board_config: board_config):
+    accessory_board = AccessoryBoard(
+        board_config, SimulatedBoardController(board_config)
+    )
+    accessory_board.connect_channels("A", "C")
+
+    assert accessory_board.try_disconnect("A", "Z").status == (
+        ConnectionStatus.INVALID_CHANNEL
+    )
+    assert accessory_board.try_disconnect("C", "A").status == (
+        ConnectionStatus.DISCONNECTED
+    )
+    assert accessory_board.try_disconnect("A", "C").status == (
+        ConnectionStatus.NOT_CONNECTED
+    )
+    assert accessory_board._connections == set()
+
+
+def test_accessory_board_state_queries(board_config: board_config):
+    board_config.exclusive_connections = []
+    accessory_board = AccessoryBoard(
+        board_config, SimulatedBoardController(board_config)
+    )
+    accessory_board.connect_channels("A", "C")
+    accessory_board.connect_channels("A", "D")
+    accessory_board.connect_channels("B", "C")
+
+    assert accessory_board.is_connected_many(
+        [("A", "C"), ("C", "A"), ("B", "D"), ("X", "Z")]
+    ) == [True, True, False, False]
+    assert accessory_board.peers_of("A") == {"C", "D"}
+    assert accessory_board.peers_of("X") == frozenset()
+    assert accessory_board.net_of("D") == {"A", "B", "C", "D"}
+    assert accessory_board.net_of("X") == {"X"}
+    assert accessory_board.connected_channels() == {"A", "B", "C", "D"}
+    with pytest.raises(KeyError):
+        accessory_board.peers_of("Z")
+
+
+def test_accessory_board_state_arrays(board_config: board_config):
+    accessory_board = AccessoryBoard(
+        board_config, SimulatedBoardController(board_config)
+    )
+    accessory_board.connect_channels("D", "B")
+    accessory_board.connect_channels("C", "A")
+
+    arrays = accessory_board.state_arrays()
+    channels = board_config.channels
+    assert [[channels[i] for i in pair] for pair in arrays.connections.tolist()] == [
+        ["A", "C"],
+        ["B", "D"],
+    ]
+    assert arrays.relay_mask.tolist() == [0b1001]
+    assert np.unpackbits(arrays.relay_mask, bitorder="little")[:4].tolist() == [
+        1,
+        0,
+        0,
+        1,
+    ]
+
+    accessory_board.disconnect_all_channels()
+    assert accessory_board.state_arrays().connections.shape == (0, 2)
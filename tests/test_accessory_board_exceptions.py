@@ -1,8 +1,8 @@
 from aliaroaccessoryboards import (
-    SourceConflictException,
+    ExclusiveConnectionConflictException,
     PathUnsupportedException,
     ResourceInUseException,
-    ExclusiveConnectionConflictException,
+    SourceConflictException,
 )
 from aliaroaccessoryboards.connection_key import ConnectionKey
 
@@ -42,6 +42,16 @@ def test_resource_in_use_exception_custom_message() -> None:
     assert str(exception) == "Custom error: Resource busy: Requested: Relay123"
 
 
+def test_resource_in_use_exception_holder() -> None:
+    holder = ConnectionKey("A", "C")
+    exception = ResourceInUseException("AC", holder=holder)
+    assert exception.holder == holder
+    assert (
+        str(exception)
+        == "Relay in use by another connection: Requested: AC, Held by: A <--> C"
+    )
+
+
 def test_exclusive_connection_conflict_exception_initialization() -> None:
     key = ConnectionKey("Ch1", "Ch2")
     conflicting_connection = "Ch3 <--> Ch4"
@@ -67,8 +77,7 @@ def test_exclusive_connection_conflict_exception_custom_message() -> None:
     )
     assert exception.message == custom_message
     assert str(exception) == (
-        "Custom error message: "
-        f"Requested: {key}, Conflicting connection: Ch3 <--> Ch4"
+        f"Custom error message: Requested: {key}, Conflicting connection: Ch3 <--> Ch4"
     )
 
 
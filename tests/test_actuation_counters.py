@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.actuation_counters import (
+    ActuationCounters,
+    RelayActuations,
+)
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+from aliaroaccessoryboards.interlock import OvercurrentInterlock
+
+
+def test_record_counts_transitions(tmp_path):
+    counters = ActuationCounters(tmp_path / "counts.npy", relay_count=10)
+    counters.record(0b0000000000, 0b1000000011)
+    counters.record(0b1000000011, 0b1000000110)
+    counters.record(0b1000000110, 0b1000000110)
+    assert list(counters.closes) == [1, 1, 1, 0, 0, 0, 0, 0, 0, 1]
+    assert list(counters.opens) == [1, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def test_counts_persist(tmp_path):
+    counters = ActuationCounters.for_serial("SN001", 4, tmp_path)
+    counters.record(0, 0b0101)
+    counters.close()
+
+    counters = ActuationCounters.for_serial("SN001", 4, tmp_path)
+    counters.record(0b0101, 0)
+    assert list(counters.closes) == [1, 0, 1, 0]
+    assert list(counters.opens) == [1, 0, 1, 0]
+    assert (tmp_path / "SN001.actuations.npy").exists()
+
+
+def test_relay_count_mismatch(tmp_path):
+    ActuationCounters(tmp_path / "counts.npy", 4).close()
+    with pytest.raises(ValueError):
+        ActuationCounters(tmp_path / "counts.npy", 8)
+
+
+def test_board_counts_actuations(board: AccessoryBoard, tmp_path):
+    with pytest.raises(RuntimeError):
+        board.relay_actuations()
+
+    board.enable_actuation_counters("SN001", tmp_path)
+    board.connect_channels("A", "C")
+    board.disconnect_channels("A", "C")
+    board.connect_channels("X", "Y")
+    board.reset()
+
+    counts = board.relay_actuations()
+    assert counts["AC"] == RelayActuations(closes=2, opens=2)
+    assert counts["BD"] == RelayActuations(closes=1, opens=1)
+    assert counts["AD"] == RelayActuations(closes=0, opens=0)
+    board.disable_actuation_counters()
+    assert board.board_controller.actuation_counters is None
+
+
+def test_interlock_trip_is_counted(board: AccessoryBoard, tmp_path):
+    counters = board.enable_actuation_counters("SN001", tmp_path)
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    board.connect_channels("A", "C")
+    board.board_controller.device_currents = [2, 0]
+    sampler.sample_once()
+    assert np.array_equal(counters.opens, counters.closes)
+    assert counters.opens[board.relays.index("AC")] == 1
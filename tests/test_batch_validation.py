@@ -0,0 +1,74 @@
+import pytest
+
+from aliaroaccessoryboards.batch_validation import (
+    compile_boards,
+    load_plan,
+    main,
+    validate_plans,
+)
+from aliaroaccessoryboards.board_generator import generate_board_config, write_brd_file
+from tests.shared import board_config
+
+
+@pytest.fixture
+def boards(board_config: board_config, tmp_path):
+    paths = []
+    for name, config in (
+        ("small", board_config),
+        ("generated", generate_board_config(dut_channels=4)),
+    ):
+        path = tmp_path / f"{name}.brd"
+        write_brd_file(config, path)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def plans(tmp_path):
+    valid = tmp_path / "valid.yaml"
+    valid.write_text("steps:\n  - [[A, C]]\n  - [[A, C], [B, D]]\n")
+    conflict = tmp_path / "conflict.yaml"
+    conflict.write_text("sources: [A, B]\nsteps:\n  - [[A, C]]\n  - [[A, C], [B, C]]\n")
+    return [valid, conflict]
+
+
+def test_load_plan(plans):
+    plan = load_plan(plans[1])
+    assert plan.sources == ["A", "B"]
+    assert plan.steps[1] == [["A", "C"], ["B", "C"]]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_validate_plans(boards, plans, processes):
+    results = {
+        (result.board, result.plan.rsplit("/", 1)[-1]): result
+        for result in validate_plans(boards, plans, processes=processes)
+    }
+    assert len(results) == 4
+    assert results["small", "valid.yaml"].passed
+    conflict = results["small", "conflict.yaml"]
+    assert conflict.failed_step == 1
+    assert conflict.error == "SourceConflictException"
+    # The generated board has no channel A.
+    assert results["generated", "valid.yaml"].error == "KeyError"
+    assert results["generated", "valid.yaml"].failed_step == 0
+
+
+def test_compiled_validators_are_reused(boards, plans):
+    validators = compile_boards(boards)
+    assert set(validators) == {"small", "generated"}
+    results = list(validate_plans(validators, plans[:1], processes=1))
+    assert [result.board for result in results] == ["small", "generated"]
+
+
+def test_unreadable_plan(boards, tmp_path):
+    results = list(validate_plans(boards, [tmp_path / "missing.yaml"], processes=1))
+    assert all(result.error == "FileNotFoundError" for result in results)
+
+
+def test_main(boards, plans, capsys):
+    assert main(["--boards", str(boards[0]), "--plans", str(plans[0])]) == 0
+    assert main(["--boards", str(boards[0]), "--plans", *map(str, plans)]) == 1
+    out = capsys.readouterr().out
+    assert "FAIL small" in out
+    assert "2 validations, 1 failed" in out
@@ -0,0 +1,32 @@
+import json
+
+from benchmarks.run import find_regressions, main, run_benchmarks
+
+
+def test_run_benchmarks_reports_every_benchmark_and_size():
+    results = run_benchmarks(sizes=[2, 4], rounds=1)
+    assert "connect_channels[4]" in results
+    assert "state_recovery[2]" in results
+    assert results["connect_channels[4]"]["operations"] == 4
+    assert all(result["median"] > 0 for result in results.values())
+    assert results["config_load[4]"]["peak_bytes"] > 0
+    assert "peak_bytes" not in results["connect_channels[4]"]
+    assert results["board_footprint[4]"]["retained_bytes_per_op"] > 0
+
+
+def test_find_regressions():
+    baseline = {"a[1]": {"median": 1.0}, "b[1]": {"median": 1.0}}
+    results = {"a[1]": {"median": 1.2}, "b[1]": {"median": 1.5}, "c[1]": {"median": 9}}
+    regressions = find_regressions(results, baseline, threshold=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b[1]")
+
+
+def test_main_compares_against_baseline(tmp_path):
+    output = tmp_path / "results.json"
+    assert main(["--sizes", "2", "--rounds", "1", "--output", str(output)]) == 0
+    baseline = json.loads(output.read_text())
+    for result in baseline["results"].values():
+        result["median"] /= 1000
+    output.write_text(json.dumps(baseline))
+    assert main(["--sizes", "2", "--rounds", "1", "--compare", str(output)]) == 1
@@ -0,0 +1,89 @@
+from aliaroaccessoryboards import board_config
+from aliaroaccessoryboards.board_compiler import (
+    COMPILED_DIR,
+    bundled_device_names,
+    main,
+    render_module,
+)
+from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.compiled_boards import (
+    BOARDS_DIR,
+    load_compiled_board,
+    module_name,
+)
+
+
+def test_compiled_boards_are_up_to_date():
+    for device_name in bundled_device_names():
+        path = COMPILED_DIR / f"{module_name(device_name)}.py"
+        assert path.read_text() == render_module(device_name), (
+            f"Run python -m aliaroaccessoryboards.board_compiler to update {path.name}"
+        )
+    assert main(["--check"]) == 0
+
+
+def test_compiled_board_matches_brd_file():
+    for device_name in bundled_device_names():
+        compiled = BoardConfig.from_device_name(device_name)
+        parsed = BoardConfig.from_brd_file(BOARDS_DIR / f"{device_name}.brd")
+        assert compiled == parsed
+
+        module = load_compiled_board(device_name)
+        for path, mask in zip(parsed.connection_paths, module.PATH_MASKS):
+            assert mask == sum(1 << parsed.relays.index(relay) for relay in path.relays)
+
+
+def test_from_device_name_does_not_parse_yaml(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed")
+
+    monkeypatch.setattr(board_config, "load_brd_data", fail)
+    config = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    assert len(config.relays) == 76
+
+
+def test_from_device_name_returns_copies_sharing_compiled_board():
+    config = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    other = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    assert other is not config
+    assert CompiledBoard.for_config(config) is CompiledBoard.for_config(other)
+
+    config.relays.clear()
+    config.connection_paths[0].relays.clear()
+    config = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    assert len(config.relays) == 76
+    assert config.connection_paths[0].relays
+
+
+def test_compiled_tables_are_used():
+    config = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    compiled = CompiledBoard.for_config(config)
+    assert compiled.exclusive_connections["DUT_GND"] == frozenset(
+        {"BUS_NEG", "BUS_POS"}
+    )
+
+    computed = CompiledBoard(config.model_copy(deep=True))
+    for name in CompiledBoard.__slots__:
+        if name not in (
+            "__weakref__",
+            "path_channels",
+            "current_scale",
+            "current_offset",
+        ):
+            assert getattr(compiled, name) == getattr(computed, name), name
+    assert compiled.path_channels.tolist() == computed.path_channels.tolist()
+
+
+def test_stale_compiled_board_falls_back_to_brd_file(monkeypatch):
+    from aliaroaccessoryboards import compiled_boards
+
+    load_compiled_board.cache_clear()
+    board_config._bundled_board.cache_clear()
+    monkeypatch.setattr(compiled_boards, "source_digest", lambda name: "changed")
+    try:
+        assert load_compiled_board("32ch_instrumentation_switch") is None
+        assert BoardConfig.from_device_name("32ch_instrumentation_switch").relays
+    finally:
+        load_compiled_board.cache_clear()
+        board_config._bundled_board.cache_clear()
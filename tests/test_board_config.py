@@ -1,7 +1,10 @@
 import pytest
-from ruamel.yaml import YAMLError
+from pydantic import ValidationError
+from yaml import YAMLError
 
+from aliaroaccessoryboards import board_config
 from aliaroaccessoryboards.board_config import BoardConfig
+from aliaroaccessoryboards.exceptions import BoardConfigIntegrityException
 from tests.shared import yaml_config
 
 
@@ -48,3 +51,145 @@ def test_board_config_from_device_name_success() -> None:
     config = BoardConfig.from_device_name("32ch_instrumentation_switch")
 
     assert isinstance(config, BoardConfig)
+
+
+def test_board_config_current_sensor_calibration(yaml_config) -> None:
+    config = BoardConfig.from_brd_string(
+        yaml_config
+        + """
+    current_sensors:
+    - SENSE_A
+    - SENSE_B
+    current_sensor_calibration:
+      SENSE_B:
+        scale: 0.01
+        offset: -0.5
+    """
+    )
+
+    assert "SENSE_A" not in config.current_sensor_calibration
+    assert config.current_sensor_calibration["SENSE_B"].scale == 0.01
+    assert config.current_sensor_calibration["SENSE_B"].offset == -0.5
+
+
+def test_board_config_reports_invalid_path_with_its_position() -> None:
+    text = """
+relays: [R1]
+channels: [A, B, C]
+connection_paths:
+- {src: A, dest: B, relays: [R1]}
+- {src: A, dest: C}
+"""
+    with pytest.raises(ValidationError) as info:
+        BoardConfig.from_brd_string(text)
+    errors = info.value.errors()
+    assert [error["loc"] for error in errors] == [("connection_paths", 1, "relays")]
+    assert info.value.title == "BoardConfig at line 6, column 3"
+
+
+def test_board_config_from_trusted_matches_validated(yaml_config) -> None:
+    config = BoardConfig.from_brd_string(yaml_config)
+
+    assert BoardConfig.from_trusted(config.model_dump()) == config
+    assert BoardConfig.from_trusted(
+        {"relays": ["R1"], "channels": ["A", "B"], "connection_paths": []}
+    ) == BoardConfig(relays=["R1"], channels=["A", "B"], connection_paths=[])
+
+
+def test_unchecked_construction_supported_by_installed_pydantic() -> None:
+    # Fails when a pydantic release changes how model instances store their state. The
+    # trusted path then falls back to model_construct.
+    assert board_config._unchecked_construction_supported()
+    assert board_config._trusted is board_config._construct_unchecked
+
+
+def test_unchecked_construction_detects_changed_internals(monkeypatch) -> None:
+    monkeypatch.setattr(
+        board_config, "_MODEL_SLOTS", board_config._MODEL_SLOTS + ("__new_state__",)
+    )
+    assert not board_config._unchecked_construction_supported()
+
+    monkeypatch.setattr(board_config, "_trusted", board_config._construct_checked)
+    config = BoardConfig.from_trusted(
+        {"relays": ["R1"], "channels": ["A", "B"], "connection_paths": []}
+    )
+    assert config == BoardConfig(
+        relays=["R1"], channels=["A", "B"], connection_paths=[]
+    )
+
+
+def test_board_config_integrity_problems() -> None:
+    config = BoardConfig.from_trusted(
+        {
+            "relays": ["R1", "R2", "R2"],
+            "channels": ["A", "B", "C"],
+            "connection_paths": [
+                {"src": "A", "dest": "B", "relays": ["R1"]},
+                {"src": "B", "dest": "A", "relays": ["R2"]},
+                {"src": "A", "dest": "D", "relays": ["R3"]},
+            ],
+            "initialization_commands": {"close_relays": ["R4"]},
+            "exclusive_connections": [{"src": "A", "dests": ["B", "E"]}],
+            "current_sensor_calibration": {"S1": {"scale": 2.0, "offset": 0.0}},
+            "presets": {
+                "p": {
+                    "connections": [
+                        {"src": "A", "dest": "C"},
+                        {"src": "{x}", "dest": "B"},
+                    ]
+                }
+            },
+        }
+    )
+
+    assert config.integrity_problems() == [
+        "Duplicate relay names",
+        "Duplicate path B <--> A",
+        "Path A <--> D uses undefined channel D",
+        "Path A <--> D uses undefined relay R3",
+        "Exclusive connection of A uses undefined channel E",
+        "Initialization command uses undefined relay R4",
+        "Calibration for undefined current sensor S1",
+        "Preset p uses undefined path A <--> C",
+    ]
+    with pytest.raises(BoardConfigIntegrityException) as e:
+        config.check_integrity()
+    assert len(e.value.problems) == 8
+
+
+def test_board_config_integrity_check_is_cached(yaml_config, monkeypatch) -> None:
+    config = BoardConfig.from_brd_string(yaml_config)
+    config.check_integrity()
+
+    def fail():
+        raise AssertionError("Checked twice")
+
+    monkeypatch.setattr(BoardConfig, "_find_integrity_problems", fail)
+    config.check_integrity()
+
+
+def test_board_config_integrity_check_after_modification(yaml_config) -> None:
+    config = BoardConfig.from_brd_string(yaml_config)
+    config.check_integrity()
+
+    config.relays.append("RELAY_CH01")
+    assert config.integrity_problems() == ["Duplicate relay names"]
+    config.relays.pop()
+    assert config.integrity_problems() == []
+
+
+def test_board_config_presets(yaml_config) -> None:
+    config = BoardConfig.from_brd_string(
+        yaml_config
+        + """
+    presets:
+      dut_to_bus:
+        connections:
+        - src: DUT_CH{ch:02d}
+          dest: BUS
+    """
+    )
+
+    (connection,) = config.presets["dut_to_bus"].connections
+    assert (connection.src, connection.dest) == ("DUT_CH{ch:02d}", "BUS")
+    assert BoardConfig.from_trusted(config.model_dump()) == config
@@ -1,8 +1,10 @@
 import tempfile
 
+import numpy as np
 import pytest
 
 from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.board_config import CurrentSensorCalibration
 from tests.shared import board_config
 
 
@@ -49,6 +51,22 @@ def test_set_all_relays(board_config: board_config):
     assert controller._pending_commit is True
 
 
+def test_set_relays(board_config: board_config):
+    controller = SimulatedBoardController(board_config)
+    controller.set_relays(0b1011, True)
+    controller.set_relays(0b0010, False)
+    assert controller._relay_state_buffer == [True, False, False, True]
+    assert controller._pending_commit is True
+    with pytest.raises(IndexError):
+        controller.set_relays(0b10000, True)
+
+
+def test_set_relay_out_of_range(board_config: board_config):
+    controller = SimulatedBoardController(board_config)
+    with pytest.raises(IndexError):
+        controller.set_relay(4, True)
+
+
 def test_commit_relays(board_config: board_config):
     controller = SimulatedBoardController(board_config)
     controller.set_relay(0, True)
@@ -66,3 +84,24 @@ def test_relays_pending_commit_error(board_config: board_config):
         match="Relay state is pending commit. Commit relays before reading.",
     ):
         _ = controller.relays
+
+
+def test_read_currents_applies_calibration(board_config: board_config):
+    board_config.current_sensor_calibration = {
+        "Sensor2": CurrentSensorCalibration(scale=0.5, offset=1.0)
+    }
+    controller = SimulatedBoardController(board_config)
+    controller.device_currents = [10, 10]
+    np.testing.assert_allclose(controller.read_currents(), [10.0, 6.0])
+
+    buffer = np.zeros(2)
+    assert controller.read_currents(out=buffer) is buffer
+    np.testing.assert_allclose(buffer, [10.0, 6.0])
+
+
+def test_read_currents_raw(board_config: board_config):
+    controller = SimulatedBoardController(board_config)
+    controller.device_currents = [-3, 4]
+    raw = controller.read_currents_raw()
+    assert raw.dtype == np.int16
+    np.testing.assert_array_equal(raw, [-3, 4])
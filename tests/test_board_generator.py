@@ -0,0 +1,98 @@
+import pytest
+
+from aliaroaccessoryboards import (
+    AccessoryBoard,
+    BoardConfig,
+    ExclusiveConnectionConflictException,
+    ResourceInUseException,
+    SimulatedBoardController,
+)
+from aliaroaccessoryboards.board_generator import (
+    dut_channel_names,
+    generate_board_config,
+    main,
+    write_brd_file,
+)
+
+
+def _assert_valid(config: BoardConfig) -> None:
+    relays = set(config.relays)
+    channels = set(config.channels)
+    assert len(relays) == len(config.relays)
+    assert len(channels) == len(config.channels)
+    keys = set()
+    for path in config.connection_paths:
+        assert {path.src, path.dest} <= channels
+        assert set(path.relays) <= relays
+        keys.add(frozenset((path.src, path.dest)))
+    assert len(keys) == len(config.connection_paths)
+    assert config.integrity_problems() == []
+    assert BoardConfig.model_validate(config.model_dump()) == config
+
+
+def test_single_stage_board():
+    config = generate_board_config(dut_channels=8, buses=2)
+    _assert_valid(config)
+    assert len(dut_channel_names(config)) == 8
+    assert len(config.relays) == 16
+    assert len(config.exclusive_connections) == 8
+
+    board = AccessoryBoard(config, SimulatedBoardController(config))
+    board.connect_channels("DUT_CH01", "BUS1_1")
+    with pytest.raises(ExclusiveConnectionConflictException):
+        board.connect_channels("DUT_CH01", "BUS1_2")
+
+
+def test_multi_stage_board_routes_through_shared_relays():
+    config = generate_board_config(dut_channels=16, buses=3, stages=3, outputs=4)
+    _assert_valid(config)
+    routed = [path for path in config.connection_paths if path.dest.startswith("OUT")]
+    assert len(routed) == 16 * 4
+    assert all(len(path.relays) == 4 for path in routed)
+
+
+def test_banked_board_shares_relays_within_bank():
+    config = generate_board_config(dut_channels=8, buses=2, bank_size=4)
+    _assert_valid(config)
+    board = AccessoryBoard(config, SimulatedBoardController(config))
+    board.connect_channels("DUT_CH01", "BUS1_1")
+    board.connect_channels("DUT_CH05", "BUS1_1")
+    with pytest.raises(ResourceInUseException):
+        board.connect_channels("DUT_CH02", "BUS1_1")
+
+
+def test_generation_is_deterministic_per_seed():
+    kwargs = {"dut_channels": 16, "stages": 2, "outputs": 4, "shuffle_relays": True}
+    assert generate_board_config(seed=1, **kwargs) == generate_board_config(
+        seed=1, **kwargs
+    )
+    assert generate_board_config(seed=1, **kwargs) != generate_board_config(
+        seed=2, **kwargs
+    )
+
+
+def test_invalid_arguments_raise_value_error():
+    with pytest.raises(ValueError):
+        generate_board_config(dut_channels=0)
+    with pytest.raises(ValueError):
+        generate_board_config(stages=2, outputs=0)
+
+
+def test_brd_file_round_trip(tmp_path):
+    config = generate_board_config(dut_channels=4, stages=2, outputs=2)
+    write_brd_file(config, tmp_path / "generated.brd")
+    assert BoardConfig.from_brd_file(tmp_path / "generated.brd") == config
+
+    main(
+        [
+            "--channels",
+            "4",
+            "--stages",
+            "2",
+            "--outputs",
+            "2",
+            "-o",
+            str(tmp_path / "cli.brd"),
+        ]
+    )
+    assert BoardConfig.from_brd_file(tmp_path / "cli.brd") == config
@@ -0,0 +1,55 @@
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.board_state import BoardState
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from tests.shared import board_config
+
+
+def test_acquire_and_release():
+    state = BoardState(4)
+    state.acquire([0, 3])
+    state.acquire([3])
+    assert list(state.relay_counts) == [1, 0, 0, 2]
+    assert state.used_mask == 0b1001
+
+    assert state.release([0, 3]) == 0b0001
+    assert state.used_mask == 0b1000
+    assert state.release([3]) == 0b1000
+    assert state.used_mask == 0
+    assert state.release([3]) == 0
+
+
+def test_clear_keeps_sources():
+    state = BoardState(2)
+    state.acquire([1])
+    state.connections.add(ConnectionKey("A", "B"))
+    state.sources.add("A")
+    state.clear()
+    assert state.connections == set()
+    assert list(state.relay_counts) == [0, 0]
+    assert state.used_mask == 0
+    assert state.sources == {"A"}
+
+
+def test_board_registers_shared_connection_keys(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    board.connect_channels("C", "A")
+    (key,) = board._connections
+    assert key is board._compiled.paths[0]
+    assert board._state.used_mask == 0b0001
+
+
+def test_peers_follow_connections():
+    state = BoardState(0)
+    state.add_connection(ConnectionKey("A", "BUS"))
+    assert state.peers == {"A": "BUS", "BUS": "A"}
+    state.add_connection(ConnectionKey("B", "BUS"))
+    assert set(state.peers_of("BUS")) == {"A", "B"}
+    assert tuple(state.peers_of("B")) == ("BUS",)
+
+    state.remove_connection(ConnectionKey("BUS", "A"))
+    assert state.peers == {"B": "BUS", "BUS": "B"}
+    assert state.peers_of("A") == ()
+    state.remove_connection(ConnectionKey("B", "BUS"))
+    assert state.peers == {}
+    assert state.connections == set()
@@ -0,0 +1,191 @@
+import math
+
+import pydantic
+import pydantic_yaml
+import pytest
+import yaml
+
+from aliaroaccessoryboards.board_config import BoardConfig, ConnectionPath
+from aliaroaccessoryboards.board_generator import generate_board_config
+from aliaroaccessoryboards.brd_loader import (
+    EntryConstructionError,
+    load_brd_data,
+    resolve_plain_scalar,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("RELAY_CH01", "RELAY_CH01"),
+        ("ON", "ON"),
+        ("no", "no"),
+        ("true", True),
+        ("~", None),
+        ("", None),
+        ("12", 12),
+        ("-3", -3),
+        ("0x1F", 31),
+        ("0o17", 15),
+        ("1.5", 1.5),
+        ("2e3", 2000.0),
+        (".inf", math.inf),
+        ("1_000", "1_000"),
+    ],
+)
+def test_resolve_plain_scalar(value, expected):
+    assert resolve_plain_scalar(value) == expected
+
+
+def test_load_brd_data_scalars():
+    data = load_brd_data(
+        """
+        names: [ON, OFF, "12", !!str 13, 14]
+        scale: 0.5
+        empty:
+        """
+    )
+    assert data == {"names": ["ON", "OFF", "12", "13", 14], "scale": 0.5, "empty": None}
+
+
+def test_load_brd_data_applies_item_constructors():
+    data = load_brd_data(
+        """
+        connection_paths:
+        - {src: A, dest: B, relays: [R1]}
+        other:
+        - {src: A}
+        """,
+        {"connection_paths": ConnectionPath.model_validate},
+    )
+    assert data["connection_paths"] == [
+        ConnectionPath(src="A", dest="B", relays=["R1"])
+    ]
+    assert data["other"] == [{"src": "A"}]
+
+
+def test_load_brd_data_aliases():
+    data = load_brd_data("a: &relays [R1, R2]\nb: *relays\n")
+    assert data["b"] == ["R1", "R2"]
+
+
+def test_load_brd_data_empty_document():
+    assert load_brd_data("") is None
+
+
+def test_load_brd_data_rejects_multiple_documents():
+    with pytest.raises(yaml.YAMLError):
+        load_brd_data("a: 1\n---\nb: 2\n")
+
+
+def test_load_brd_data_rejects_duplicate_keys():
+    with pytest.raises(yaml.YAMLError, match="duplicate key 'relays'") as info:
+        load_brd_data("relays: [R1]\nchannels: [A]\nrelays: [R2]\n")
+    assert info.value.problem_mark.line == 2
+
+
+def test_load_brd_data_reports_failing_entry():
+    text = """
+connection_paths:
+- {src: A, dest: B, relays: [R1]}
+- foreach: {ch: 1..2}
+  items:
+  - {src: A, dest: "C{ch}", relays: [R1]}
+- {src: A, dest: D}
+"""
+    with pytest.raises(EntryConstructionError) as info:
+        load_brd_data(text, {"connection_paths": ConnectionPath.model_validate})
+    assert info.value.key == "connection_paths"
+    assert info.value.index == 3
+    assert info.value.problem_mark.line == 6
+    assert isinstance(info.value.error, pydantic.ValidationError)
+
+
+def test_streaming_load_matches_pydantic_yaml():
+    config = generate_board_config(dut_channels=16, buses=2, stages=2, outputs=2)
+    text = pydantic_yaml.to_yaml_str(config)
+
+    assert BoardConfig.from_brd_string(text) == config
+    assert pydantic_yaml.parse_yaml_raw_as(BoardConfig, text) == config
+
+
+def test_template_expansion():
+    data = load_brd_data(
+        """
+        relays:
+        - RELAY_GND
+        - foreach: {ch: 1..2, pol: [NEG, POS]}
+          items:
+          - RELAY_CH{ch:02d}_{pol}
+        """
+    )
+    assert data["relays"] == [
+        "RELAY_GND",
+        "RELAY_CH01_NEG",
+        "RELAY_CH01_POS",
+        "RELAY_CH02_NEG",
+        "RELAY_CH02_POS",
+    ]
+
+
+def test_template_descending_range():
+    data = load_brd_data("a:\n- foreach: {i: 3..1}\n  items:\n  - X{i}\n")
+    assert data["a"] == ["X3", "X2", "X1"]
+
+
+def test_nested_templates_see_outer_variables():
+    data = load_brd_data(
+        """
+        exclusive_connections:
+        - foreach: {ch: 1..2}
+          items:
+          - src: DUT_CH{ch}
+            dests:
+            - foreach: {bus: [A, B]}
+              items:
+              - BUS_{bus}_{ch}
+        - src: GND
+          dests:
+          - foreach: {bus: [A, B]}
+            items:
+            - BUS_{bus}
+        """
+    )
+    assert data["exclusive_connections"] == [
+        {"src": "DUT_CH1", "dests": ["BUS_A_1", "BUS_B_1"]},
+        {"src": "DUT_CH2", "dests": ["BUS_A_2", "BUS_B_2"]},
+        {"src": "GND", "dests": ["BUS_A", "BUS_B"]},
+    ]
+
+
+def test_templates_are_expanded_before_item_constructors():
+    data = load_brd_data(
+        """
+        connection_paths:
+        - foreach: {ch: 1..2}
+          items:
+          - src: DUT_CH{ch}
+            dest: BUS
+            relays:
+            - RELAY_CH{ch}
+        """,
+        {"connection_paths": ConnectionPath.model_validate},
+    )
+    assert data["connection_paths"] == [
+        ConnectionPath(src="DUT_CH1", dest="BUS", relays=["RELAY_CH1"]),
+        ConnectionPath(src="DUT_CH2", dest="BUS", relays=["RELAY_CH2"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "- foreach: {ch: 1..2}\n  items:\n  - X{undefined}\n",
+        "- foreach: {ch: one..two}\n  items:\n  - X{ch}\n",
+        "- foreach: {ch: 1..2}\n  item: X\n",
+        "- foreach: {}\n  items: []\n",
+    ],
+)
+def test_invalid_templates(template):
+    with pytest.raises(yaml.YAMLError):
+        load_brd_data("a:\n" + template)
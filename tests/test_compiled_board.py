@@ -0,0 +1,100 @@
+import gc
+import pickle
+
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.compiled_board import CompiledBoard, _compiled
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from tests.shared import board_config
+
+
+def test_compiled_board_tables(board_config: board_config):
+    board_config.initialization_commands.close_relays = ["BD"]
+    compiled = CompiledBoard(board_config)
+
+    assert compiled.relays == ("AC", "AD", "BC", "BD")
+    assert compiled.relay_index["BD"] == 3
+    assert compiled.channels == frozenset(board_config.channels)
+    assert compiled.connection_map[ConnectionKey("Y", "X")] == ("AC", "BD")
+    assert compiled.path_relay_indices[ConnectionKey("X", "Y")] == (0, 3)
+    assert compiled.path_masks[ConnectionKey("X", "Y")] == 0b1001
+    assert compiled.exclusive_connections["A"] == frozenset({"C", "D"})
+    assert compiled.close_relays == ("BD",)
+    assert compiled.close_mask == 0b1000
+    assert compiled.current_sensors == ("Sensor1", "Sensor2")
+    assert list(compiled.current_scale) == [1.0, 1.0]
+
+
+def test_compiled_board_reverse_indices(board_config: board_config):
+    compiled = CompiledBoard(board_config)
+
+    assert compiled.relay_paths == ((0, 4), (1,), (2,), (3, 4))
+    assert compiled.channel_paths["A"] == (0, 1)
+    assert compiled.channel_paths["X"] == (4,)
+    assert compiled.relayless_paths == ()
+    assert compiled.channel_index["X"] == 4
+    assert compiled.path_channels.tolist() == [[0, 2], [0, 3], [1, 2], [1, 3], [4, 5]]
+    assert [compiled.paths[idx] for idx in compiled.relay_paths[3]] == [
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    ]
+
+
+def test_compiled_board_is_shared(board_config: board_config):
+    controllers = [SimulatedBoardController(board_config) for _ in range(3)]
+    boards = [AccessoryBoard(board_config, controller) for controller in controllers]
+
+    compiled = CompiledBoard.for_config(board_config)
+    assert all(board._compiled is compiled for board in boards)
+    assert all(c.compiled_board is compiled for c in controllers)
+    assert boards[0]._connection_map is boards[1]._connection_map
+    assert boards[0].relays is boards[2].relays
+
+    boards[0].connect_channels("A", "C")
+    assert boards[1]._connections == set()
+
+
+def test_compiled_board_is_immutable(board_config: board_config):
+    compiled = CompiledBoard.for_config(board_config)
+    with pytest.raises(AttributeError):
+        compiled.relays = ()
+    with pytest.raises(TypeError):
+        compiled.relay_index["AC"] = 1
+    with pytest.raises(TypeError):
+        compiled.connection_map.clear()
+    with pytest.raises(ValueError):
+        compiled.current_scale[0] = 2.0
+
+
+def test_compiled_board_tables_pickle(board_config: board_config):
+    compiled = CompiledBoard.for_config(board_config)
+    assert pickle.loads(pickle.dumps(compiled.path_masks)) == compiled.path_masks
+
+
+def test_compiled_board_is_dropped_when_unused(board_config: board_config):
+    config = board_config.model_copy(deep=True)
+    config.relays.append("Unused")
+    compiled = CompiledBoard.for_config(config)
+    assert compiled in _compiled.values()
+    del compiled
+    gc.collect()
+    assert all(len(compiled.relays) != 5 for compiled in list(_compiled.values()))
+
+
+def test_equal_configs_share_compiled_board(board_config: board_config):
+    compiled = CompiledBoard.for_config(board_config)
+    assert CompiledBoard.for_config(board_config.model_copy(deep=True)) is compiled
+
+
+def test_modified_config_is_compiled_again(board_config: board_config):
+    compiled = CompiledBoard.for_config(board_config)
+    board_config.initialization_commands.close_relays = ["BD"]
+    board_config.connection_paths[0].relays.append("BD")
+
+    assert compiled.close_mask == 0
+    assert compiled.path_masks[ConnectionKey("A", "C")] == 0b0001
+    recompiled = CompiledBoard.for_config(board_config)
+    assert recompiled.close_mask == 0b1000
+    assert recompiled.path_masks[ConnectionKey("A", "C")] == 0b1001
@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+from tests.shared import board_config
+
+
+@pytest.fixture
+def controller(board_config: board_config) -> SimulatedBoardController:
+    return SimulatedBoardController(board_config)
+
+
+def test_latest_is_none_before_sampling(controller):
+    sampler = CurrentSampler(controller)
+    assert sampler.latest() is None
+
+
+def test_sample_once_stores_readings(controller):
+    sampler = CurrentSampler(controller)
+    controller.device_currents = [10, -20]
+    timestamp, _ = sampler.sample_once()
+
+    latest_timestamp, latest_values = sampler.latest()
+    assert latest_timestamp == timestamp
+    np.testing.assert_array_equal(latest_values, [10, -20])
+    assert sampler.sample_count == 1
+
+
+def test_ring_buffer_keeps_most_recent_samples(controller):
+    sampler = CurrentSampler(controller, capacity=3)
+    for value in range(5):
+        controller.device_currents = [value, value]
+        sampler.sample_once()
+
+    timestamps, values = sampler.samples()
+    np.testing.assert_array_equal(values[:, 0], [2, 3, 4])
+    assert np.all(np.diff(timestamps) >= 0)
+
+
+def test_statistics(controller):
+    sampler = CurrentSampler(controller)
+    for first, second in [(1, -3), (3, 3), (-1, 0)]:
+        controller.device_currents = [first, second]
+        sampler.sample_once()
+
+    stats = sampler.statistics()
+    assert stats.count == 3
+    np.testing.assert_array_equal(stats.minimum, [-1, -3])
+    np.testing.assert_array_equal(stats.maximum, [3, 3])
+    np.testing.assert_allclose(stats.mean, [1, 0])
+    np.testing.assert_allclose(stats.rms, [np.sqrt(11 / 3), np.sqrt(6)])
+
+
+def test_statistics_without_samples_raises(controller):
+    with pytest.raises(ValueError):
+        CurrentSampler(controller).statistics()
+
+
+def test_subscribe_and_unsubscribe(controller):
+    sampler = CurrentSampler(controller)
+    received = []
+    unsubscribe = sampler.subscribe(lambda ts, values: received.append(values.copy()))
+    sampler.sample_once()
+    unsubscribe()
+    sampler.sample_once()
+    assert len(received) == 1
+
+
+def test_background_sampling(controller):
+    with CurrentSampler(controller, rate=1000) as sampler:
+        deadline = time.monotonic() + 1
+        while sampler.sample_count < 5 and time.monotonic() < deadline:
+            time.sleep(0.001)
+    assert not sampler.running
+    assert sampler.sample_count >= 5
+
+
+def test_failing_subscriber_is_recorded_and_others_still_run(controller):
+    sampler = CurrentSampler(controller)
+    received = []
+
+    def failing(ts, values):
+        raise RuntimeError("boom")
+
+    sampler.subscribe(failing)
+    sampler.subscribe(lambda ts, values: received.append(ts))
+    sampler.sample_once()
+    assert len(received) == 1
+    assert sampler.errors == 1
+    assert str(sampler.last_error) == "boom"
+
+
+def test_background_sampling_survives_read_errors(controller, monkeypatch):
+    read_currents = controller.read_currents
+    failures = []
+
+    def flaky_read_currents(*args, **kwargs):
+        if len(failures) < 3:
+            failures.append(None)
+            raise OSError("bus error")
+        return read_currents(*args, **kwargs)
+
+    monkeypatch.setattr(controller, "read_currents", flaky_read_currents)
+    with CurrentSampler(controller, rate=1000) as sampler:
+        deadline = time.monotonic() + 1
+        while sampler.sample_count < 5 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert sampler.running
+    assert sampler.sample_count >= 5
+    assert sampler.errors == 3
+    assert isinstance(sampler.last_error, OSError)
+
+
+def test_slow_reads_are_counted_as_overruns(controller, monkeypatch):
+    sampler = CurrentSampler(controller, overrun_threshold=0.001)
+    sampler.sample_once()
+    assert sampler.overruns == 0
+
+    read_currents = controller.read_currents
+
+    def slow_read(out=None):
+        time.sleep(0.005)
+        return read_currents(out=out)
+
+    monkeypatch.setattr(controller, "read_currents", slow_read)
+    sampler.sample_once()
+    assert sampler.overruns == 1
+    assert sampler.sample_count == 2
@@ -0,0 +1,76 @@
+import pytest
+
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.boardcontrollers.emulated_i2c_driver import (
+    EmulatedBoardDevice,
+    EmulatedI2CDriver,
+)
+from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
+    I2CDriverBoardController,
+)
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from tests.shared import board_config
+
+
+@pytest.fixture
+def i2c_driver() -> EmulatedI2CDriver:
+    return EmulatedI2CDriver(byte_time=0.001, transaction_time=0.01, sleep=False)
+
+
+@pytest.fixture
+def device(i2c_driver, board_config: board_config) -> EmulatedBoardDevice:
+    return i2c_driver.attach(0x40, EmulatedBoardDevice.from_board_config(board_config))
+
+
+@pytest.fixture
+def controller(i2c_driver, device, board_config) -> I2CDriverBoardController:
+    return I2CDriverBoardController(i2c_driver, 0x40, board_config, settle_time=0)
+
+
+def test_write_and_read_relays(controller, device) -> None:
+    controller.write_relays_to_device(0b1010)
+    assert device.relay_mask == 0b1010
+    assert controller.read_relays_from_device() == 0b1010
+
+
+def test_read_currents(controller, device) -> None:
+    device.currents = [12, -34]
+    assert list(controller.read_currents_from_device()) == [12, -34]
+    assert list(controller.read_currents_raw()) == [12, -34]
+
+
+def test_bus_accounting(controller, i2c_driver) -> None:
+    controller.write_relays_to_device(1)
+    assert i2c_driver.transactions == 1
+    assert i2c_driver.bytes_written == 1
+    assert i2c_driver.bus_time == pytest.approx(0.01 + 3 * 0.001)
+
+
+def test_unknown_address_raises_io_error(i2c_driver, board_config) -> None:
+    controller = I2CDriverBoardController(i2c_driver, 0x41, board_config, settle_time=0)
+    with pytest.raises(IOError):
+        controller.write_relays_to_device(1)
+
+
+def test_invalid_registers_raise_value_error(device) -> None:
+    with pytest.raises(ValueError):
+        device.read_register(I2CDriverBoardController.WRITE_RELAYS, 1)
+    with pytest.raises(ValueError):
+        device.write_register(I2CDriverBoardController.READ_RELAYS, b"\x00")
+
+
+def test_accessory_board_end_to_end(controller, device, i2c_driver, board_config):
+    board = AccessoryBoard(board_config, controller)
+    transactions = i2c_driver.transactions
+
+    board.connect_channels("A", "C")
+    board.connect_channels("B", "D")
+    assert device.relay_mask == 0b1001
+    assert i2c_driver.transactions - transactions == 2
+
+    board = AccessoryBoard(board_config, controller, reset=False)
+    assert board._connections == {
+        ConnectionKey("A", "C"),
+        ConnectionKey("B", "D"),
+        ConnectionKey("X", "Y"),
+    }
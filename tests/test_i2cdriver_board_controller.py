@@ -1,5 +1,7 @@
+import struct
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
@@ -63,3 +65,39 @@ def test_write_relays_multiple_boards(
     mock_i2c_driver.regwr.assert_called_with(
         0x25, 160, relay_mask.to_bytes(1, byteorder="big")
     )
+
+
+def test_read_currents_raw_decodes_bytes(
+    i2c_driver_board_controller, mock_i2c_driver
+) -> None:
+    mock_i2c_driver.regrd.return_value = struct.pack("<2h", 123, -456)
+    result = i2c_driver_board_controller.read_currents_raw()
+    assert result.dtype == np.int16
+    np.testing.assert_array_equal(result, [123, -456])
+    mock_i2c_driver.regrd.assert_called_once_with(0x40, 0, 4)
+
+
+def test_read_currents_raw_fills_buffer(
+    i2c_driver_board_controller, mock_i2c_driver
+) -> None:
+    mock_i2c_driver.regrd.return_value = struct.pack("<2h", 7, 8)
+    buffer = np.zeros(2, dtype=np.int16)
+    result = i2c_driver_board_controller.read_currents_raw(out=buffer)
+    assert result is buffer
+    np.testing.assert_array_equal(buffer, [7, 8])
+
+
+def test_write_relays_waits_for_settle_time(
+    mock_i2c_driver, board_config: board_config, monkeypatch
+) -> None:
+    import aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller as module
+
+    sleeps = []
+    monkeypatch.setattr(module, "sleep", sleeps.append)
+    I2CDriverBoardController(
+        mock_i2c_driver, 0x40, board_config
+    ).write_relays_to_device(1)
+    I2CDriverBoardController(
+        mock_i2c_driver, 0x40, board_config, settle_time=0
+    ).write_relays_to_device(1)
+    assert sleeps == [0.04]
@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+from aliaroaccessoryboards.interlock import OvercurrentInterlock
+from tests.shared import board_config
+
+
+def test_interlock_trips_and_reconciles_board(board: AccessoryBoard):
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor2": 5.0})
+    interlock.arm()
+    board.connect_channels("A", "C")
+
+    board.board_controller.device_currents = [100, 4]
+    sampler.sample_once()
+    assert not interlock.tripped
+
+    board.board_controller.device_currents = [0, -6]
+    sampler.sample_once()
+    assert interlock.tripped
+    assert board.board_controller.read_relays_from_device() == 0
+    assert board._connections == set()
+    assert interlock.trips[0].sensor == "Sensor2"
+    assert interlock.trips[0].value == -6
+    assert interlock.latency_report()["trips"] == 1
+
+    # The board is usable again after the trip.
+    board.connect_channels("A", "C")
+    assert board._connections == {ConnectionKey("A", "C")}
+
+
+def test_interlock_trip_discards_uncommitted_relay_changes(board: AccessoryBoard):
+    controller = board.board_controller
+    sampler = CurrentSampler(controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    board.connect_channels("A", "C")
+    controller.set_relay(3, True)
+
+    controller.device_currents = [2, 0]
+    sampler.sample_once()
+    assert interlock.tripped
+    assert sampler.errors == 0
+    assert board._connections == set()
+
+    # A later commit writes the safe mask, not the discarded changes.
+    controller.commit_relays()
+    assert controller.read_relays_from_device() == 0
+
+
+def test_interlock_trip_waits_for_board_operation(board: AccessoryBoard):
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    board.board_controller.device_currents = [2, 0]
+
+    with board.lock:
+        board.connect_channels("A", "C")
+        thread = threading.Thread(target=sampler.sample_once)
+        thread.start()
+        thread.join(0.05)
+        assert not interlock.tripped
+    thread.join()
+    assert interlock.tripped
+    assert board.board_controller.read_relays_from_device() == 0
+    assert board._connections == set()
+
+
+def test_interlock_latches_until_reset(board: AccessoryBoard):
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    board.board_controller.device_currents = [2, 0]
+    sampler.sample_once()
+    sampler.sample_once()
+    assert len(interlock.trips) == 1
+
+    interlock.reset()
+    sampler.sample_once()
+    assert len(interlock.trips) == 2
+
+
+def test_interlock_default_safe_mask_keeps_initial_relays(board_config: board_config):
+    board_config.initialization_commands.close_relays = ["BD"]
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    assert interlock.safe_mask == 1 << board_config.relays.index("BD")
+
+
+def test_interlock_unknown_sensor_raises_key_error(board: AccessoryBoard):
+    sampler = CurrentSampler(board.board_controller)
+    with pytest.raises(KeyError):
+        OvercurrentInterlock(board, sampler, {"Unknown": 1.0})
+
+
+def test_disarmed_interlock_does_not_trip(board: AccessoryBoard):
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    interlock.disarm()
+    board.board_controller.device_currents = [2, 0]
+    sampler.sample_once()
+    assert not interlock.tripped
@@ -0,0 +1,97 @@
+import pytest
+
+from aliaroaccessoryboards import (
+    AccessoryBoard,
+    PathUnsupportedException,
+    SimulatedBoardController,
+)
+from aliaroaccessoryboards.boardcontrollers.emulated_i2c_driver import (
+    EmulatedBoardDevice,
+    EmulatedI2CDriver,
+)
+from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
+    I2CDriverBoardController,
+)
+from aliaroaccessoryboards.metrics import Histogram, Metrics
+from tests.shared import board_config
+
+
+def test_histogram_buckets():
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == {"0.1": 2, "1.0": 3, "+Inf": 4}
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_measure_counts_exceptions_by_type():
+    metrics = Metrics()
+    with metrics.measure("op"):
+        pass
+    with pytest.raises(ValueError), metrics.measure("op"):
+        raise ValueError()
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["op_total"] == 2
+    assert counters['exceptions_total{operation="op",type="ValueError"}'] == 1
+    assert metrics.snapshot()["histograms"]["op_seconds"]["count"] == 2
+
+
+def test_prometheus_export():
+    metrics = Metrics(labels={"board": "bench1"}, buckets=[0.5])
+    metrics.increment("connect_total", 3)
+    metrics.observe("connect_seconds", 0.25)
+
+    assert metrics.to_prometheus() == (
+        "# TYPE aliaro_board_connect_total counter\n"
+        'aliaro_board_connect_total{board="bench1"} 3\n'
+        "# TYPE aliaro_board_connect_seconds histogram\n"
+        'aliaro_board_connect_seconds_bucket{board="bench1",le="0.5"} 1\n'
+        'aliaro_board_connect_seconds_bucket{board="bench1",le="+Inf"} 1\n'
+        'aliaro_board_connect_seconds_sum{board="bench1"} 0.25\n'
+        'aliaro_board_connect_seconds_count{board="bench1"} 1\n'
+    )
+
+
+def test_accessory_board_metrics(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    metrics = board.enable_metrics()
+
+    board.connect_channels("A", "C")
+    with pytest.raises(PathUnsupportedException):
+        board.connect_channels("C", "D")
+    board.disconnect_channels("A", "C")
+    board.reset()
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["connect_total"] == 2
+    assert counters["disconnect_total"] == 1
+    assert counters["reset_total"] == 1
+    assert "disconnect_all_total" not in counters
+    assert counters["commit_total"] == 4
+    assert counters["device_write_total"] == 4
+    assert counters["bytes_written_total"] == 4
+    assert counters["relay_read_total"] == 1
+    assert (
+        counters[
+            'exceptions_total{operation="connect",type="PathUnsupportedException"}'
+        ]
+        == 1
+    )
+
+    board.disable_metrics()
+    board.connect_channels("A", "C")
+    assert metrics.snapshot()["counters"]["connect_total"] == 2
+
+
+def test_i2c_settle_metrics(board_config: board_config):
+    driver = EmulatedI2CDriver()
+    driver.attach(0x40, EmulatedBoardDevice.from_board_config(board_config))
+    controller = I2CDriverBoardController(driver, 0x40, board_config, settle_time=1e-4)
+    board = AccessoryBoard(board_config, controller)
+    metrics = board.enable_metrics()
+
+    board.connect_channels("A", "C")
+    assert metrics.snapshot()["counters"]["settle_total"] == 1
+    assert metrics.histograms["settle_seconds"].sum >= 1e-4
@@ -0,0 +1,154 @@
+import random
+
+import numpy as np
+import pytest
+
+from aliaroaccessoryboards import AccessoryBoard, SimulatedBoardController
+from aliaroaccessoryboards.board_config import ConnectionPath
+from aliaroaccessoryboards.board_generator import generate_board_config
+from aliaroaccessoryboards.exceptions import (
+    AccessoryBoardException,
+    ExclusiveConnectionConflictException,
+    PathUnsupportedException,
+    ResourceInUseException,
+    SourceConflictException,
+)
+from aliaroaccessoryboards.plan_validation import PlanValidator
+from tests.shared import board_config
+
+
+@pytest.fixture
+def validator(board_config: board_config) -> PlanValidator:
+    return PlanValidator(board_config)
+
+
+def test_valid_plan(validator: PlanValidator):
+    plan = [[("A", "C")], [("A", "C"), ("B", "D")], [], [("C", "B"), ("A", "D")]]
+    assert validator.validate(plan) is None
+
+
+def test_relay_conflict(validator: PlanValidator):
+    failure = validator.validate([[("A", "C")], [("A", "C"), ("X", "Y")]])
+    assert failure.step == 1
+    assert isinstance(failure.exception, ResourceInUseException)
+    assert failure.exception.relay_name == "AC"
+    assert set(failure.exception.holder) == {"A", "C"}
+    assert "Relay in use" in failure.reason
+
+
+def test_exclusive_conflict(validator: PlanValidator):
+    failure = validator.validate([[("B", "C")], [("A", "C"), ("A", "D")]])
+    assert failure.step == 1
+    assert isinstance(failure.exception, ExclusiveConnectionConflictException)
+
+
+@pytest.fixture
+def config_with_extra_path(board_config: board_config) -> board_config:
+    # A is exclusive with C and D and can also be connected to X.
+    board_config = board_config.model_copy(deep=True)
+    board_config.relays.append("AX")
+    board_config.connection_paths.append(
+        ConnectionPath(src="A", dest="X", relays=["AX"])
+    )
+    return board_config
+
+
+def test_exclusive_source_connected_to_other_channel(config_with_extra_path):
+    validator = PlanValidator(config_with_extra_path)
+    failure = validator.validate([[("A", "C"), ("A", "X")]])
+    assert failure.step == 0
+    assert isinstance(failure.exception, ExclusiveConnectionConflictException)
+    assert failure.exception.existing_connection == "C"
+
+    # Like on the board, the rule depends on the order of the connections.
+    assert validator.validate([[("A", "X"), ("A", "C")]]) is None
+    assert validator.validate([[("A", "C"), ("A", "C")]]) is None
+
+
+def test_exclusive_rule_matches_accessory_board(config_with_extra_path):
+    validator = PlanValidator(config_with_extra_path)
+    pairs = [(path.src, path.dest) for path in config_with_extra_path.connection_paths]
+    rng = random.Random(2)
+    for _ in range(200):
+        step = rng.sample(pairs, rng.randint(1, 3))
+        board = AccessoryBoard(
+            config_with_extra_path, SimulatedBoardController(config_with_extra_path)
+        )
+        expected = None
+        try:
+            for channel1, channel2 in step:
+                board.connect_channels(channel1, channel2)
+        except AccessoryBoardException as e:
+            expected = type(e)
+
+        failure = validator.validate([step])
+        actual = None if failure is None else type(failure.exception)
+        assert actual == expected, step
+
+
+def test_source_conflict(validator: PlanValidator):
+    plan = [[("A", "C"), ("B", "D")], [("A", "C"), ("B", "C")]]
+    assert validator.validate(plan) is None
+    failure = validator.validate(plan, sources=["A", "B"])
+    assert failure.step == 1
+    assert isinstance(failure.exception, SourceConflictException)
+    assert failure.exception.conflicting_sources == {"A", "B"}
+
+
+def test_unsupported_path_and_invalid_channel(validator: PlanValidator):
+    failure = validator.validate([[("A", "C")], [("A", "B")]])
+    assert failure.step == 1
+    assert isinstance(failure.exception, PathUnsupportedException)
+
+    failure = validator.validate([[("A", "Q")]])
+    assert isinstance(failure.exception, KeyError)
+    assert "Q" in failure.reason
+
+
+def test_earlier_conflict_wins_over_encoding_failure(validator: PlanValidator):
+    failure = validator.validate([[("A", "C"), ("A", "D")], [("A", "B")]])
+    assert failure.step == 0
+
+
+def test_initially_closed_relays_are_reserved(board_config: board_config):
+    board_config.initialization_commands.close_relays = ["BD"]
+    failure = PlanValidator(board_config).validate([[("A", "C")], [("B", "D")]])
+    assert failure.step == 1
+    assert failure.exception.relay_name == "BD"
+
+
+def test_validate_indices_across_chunks(validator: PlanValidator, monkeypatch):
+    import aliaroaccessoryboards.plan_validation as module
+
+    monkeypatch.setattr(module, "CHUNK_SIZE", 4)
+    steps = np.tile(np.array([[0, 3], [1, 2], [0, 0]]), (5, 1))
+    assert validator.validate_indices(steps) is None
+    steps[13] = [0, 4]
+    assert validator.validate_indices(steps).step == 13
+
+
+def test_matches_accessory_board():
+    config = generate_board_config(dut_channels=6, buses=3, bank_size=2)
+    validator = PlanValidator(config)
+    channels = [path.src for path in config.connection_paths]
+    rng = random.Random(1)
+    for _ in range(200):
+        step = [
+            (rng.choice(channels), rng.choice(["BUS1_1", "BUS1_2", "BUS1_3"]))
+            for _ in range(rng.randint(1, 4))
+        ]
+        sources = rng.sample(["BUS1_1", "BUS1_2", "BUS1_3"] + channels, 2)
+
+        board = AccessoryBoard(config, SimulatedBoardController(config))
+        for source in sources:
+            board.mark_as_source(source)
+        expected = None
+        try:
+            for channel1, channel2 in step:
+                board.connect_channels(channel1, channel2)
+        except AccessoryBoardException as e:
+            expected = type(e)
+
+        failure = validator.validate([step], sources)
+        actual = None if failure is None else type(failure.exception)
+        assert actual == expected, step
@@ -0,0 +1,172 @@
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.board_config import (
+    BoardConfig,
+    PresetConnection,
+    RoutePreset,
+)
+from aliaroaccessoryboards.boardcontrollers.recording_board_controller import (
+    RecordingBoardController,
+)
+from aliaroaccessoryboards.boardcontrollers.replay_board_controller import (
+    replay_session,
+)
+from aliaroaccessoryboards.compiled_board import CompiledBoard
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.exceptions import (
+    ExclusiveConnectionConflictException,
+    PathUnsupportedException,
+    ResourceInUseException,
+    SourceConflictException,
+)
+from aliaroaccessoryboards.presets import compile_preset, preset_channels
+from aliaroaccessoryboards.relay_journal import JournalOperation, read_journal
+from tests.shared import board_config
+
+
+def test_compile_preset(board_config: board_config):
+    preset = compile_preset(
+        CompiledBoard(board_config), [("C", "A"), ("B", "D"), ("A", "C")]
+    )
+    assert preset.connections == (ConnectionKey("A", "C"), ConnectionKey("B", "D"))
+    assert preset.relay_mask == 0b1001
+
+
+@pytest.mark.parametrize(
+    "connections, exception",
+    [
+        ([("A", "Z")], KeyError),
+        ([("A", "B")], PathUnsupportedException),
+        ([("A", "C"), ("X", "Y")], ResourceInUseException),
+        ([("A", "C"), ("A", "D")], ExclusiveConnectionConflictException),
+    ],
+)
+def test_compile_preset_rejects_conflicts(
+    board_config: board_config, connections, exception
+):
+    with pytest.raises(exception):
+        compile_preset(CompiledBoard(board_config), connections)
+
+
+def test_preset_channels():
+    connections = [("DUT_CH{ch:02d}", "BUS")]
+    assert preset_channels(connections, {"ch": 7}) == [("DUT_CH07", "BUS")]
+    with pytest.raises(KeyError, match="ch"):
+        preset_channels(connections, {})
+    with pytest.raises(ValueError, match="DUT_CH"):
+        preset_channels(connections, {"ch": "07"})
+    with pytest.raises(ValueError):
+        preset_channels([("DUT_CH{0}", "BUS")], {})
+
+
+def test_apply_preset_commits_once(board_config: board_config, tmp_path):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    board.enable_journal(tmp_path / "board.journal")
+    board.register_preset("pair", [("A", "C"), ("B", "D")])
+
+    board.apply_preset("pair")
+    board.disable_journal()
+
+    assert board._connections == {ConnectionKey("A", "C"), ConnectionKey("B", "D")}
+    assert board.board_controller.read_relays_from_device() == 0b1001
+    records = read_journal(tmp_path / "board.journal")
+    assert records["operation"].tolist() == [JournalOperation.PRESET]
+
+
+def test_apply_preset_is_atomic(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    board.register_preset("pair", [("A", "C"), ("B", "D")])
+    board.connect_channels("C", "B")
+
+    # A-C passes, B-D conflicts with B-C.
+    with pytest.raises(ExclusiveConnectionConflictException):
+        board.apply_preset("pair")
+    assert board._connections == {ConnectionKey("B", "C")}
+    assert board._state.used_mask == 0b0100
+    assert board.board_controller.read_relays_from_device() == 0b0100
+
+    board.disconnect_all_channels()
+    board.mark_as_source("A")
+    board.mark_as_source("B")
+    board.connect_channels("B", "C")
+    with pytest.raises(SourceConflictException):
+        board.apply_preset("pair")
+    assert board._connections == {ConnectionKey("B", "C")}
+
+
+def test_apply_preset_keeps_existing_connections(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    board.connect_channels("A", "C")
+    board.register_preset("pair", [("A", "C"), ("B", "D")])
+
+    board.apply_preset("pair")
+    board.disconnect_channels("B", "D")
+
+    assert board._connections == {ConnectionKey("A", "C")}
+    assert board.board_controller.read_relays_from_device() == 0b0001
+
+
+def test_apply_parameterized_preset(board_config: board_config):
+    board_config.presets["to_c"] = RoutePreset(
+        connections=[PresetConnection(src="{channel}", dest="C")]
+    )
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+
+    board.apply_preset("to_c", channel="B")
+    assert board.peers_of("C") == {"B"}
+    with pytest.raises(PathUnsupportedException):
+        board.apply_preset("to_c", channel="X")
+    with pytest.raises(KeyError, match="Unknown preset"):
+        board.apply_preset("missing")
+    # Only valid parameter values are cached.
+    assert set(board._compiled_presets) == {(("B", "C"),)}
+
+
+def test_apply_preset_with_unhashable_parameter(board_config: board_config):
+    board_config.presets["pick"] = RoutePreset(
+        connections=[PresetConnection(src="{channels[0]}", dest="C")]
+    )
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+
+    board.apply_preset("pick", channels=["A", "B"])
+    assert board.peers_of("C") == {"A"}
+    with pytest.raises(ValueError):
+        board.apply_preset("pick", channels=[])
+
+
+def test_register_preset_validates_and_replaces(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    with pytest.raises(PathUnsupportedException):
+        board.register_preset("bad", [("A", "B")])
+
+    board.register_preset("route", [("A", "C")])
+    board.apply_preset("route")
+    board.disconnect_all_channels()
+    board.register_preset("route", [("B", "D")])
+    board.apply_preset("route")
+    assert board._connections == {ConnectionKey("B", "D")}
+
+
+def test_bundled_board_presets():
+    config = BoardConfig.from_device_name("32ch_instrumentation_switch")
+    board = AccessoryBoard(config, SimulatedBoardController(config))
+
+    board.apply_preset("dut_to_j4", ch=5)
+    assert board.net_of("DUT_CH05") == {"DUT_CH05", "BUS_POS", "J4_CENTER"}
+    assert board.net_of("DUT_GND") == {"DUT_GND", "BUS_NEG", "J4_SHIELD"}
+
+
+def test_presets_are_recorded_and_replayed(board_config: board_config):
+    controller = RecordingBoardController(
+        SimulatedBoardController(board_config), board_config
+    )
+    board = AccessoryBoard(board_config, controller)
+    controller.attach(board)
+    board.register_preset("to_c", [("{channel}", "C")])
+    board.apply_preset("to_c", channel="A")
+
+    assert controller.session.operations[-1].kwargs == {"channel": "A"}
+    result = replay_session(board_config, controller.session)
+    assert result.mismatches == []
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from aliaroaccessoryboards import AccessoryBoard, SimulatedBoardController
+from aliaroaccessoryboards.boardcontrollers.emulated_i2c_driver import (
+    EmulatedBoardDevice,
+    EmulatedI2CDriver,
+)
+from aliaroaccessoryboards.boardcontrollers.i2cdriver_board_controller import (
+    I2CDriverBoardController,
+)
+from tests.shared import board_config
+
+
+def test_profile_simulated_board(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    with board.profile() as profile:
+        board.connect_channels("A", "C")
+        board.disconnect_channels("A", "C")
+        board.reset()
+
+    assert profile.operations["connect_channels"].calls == 1
+    assert profile.operations["reset"].calls == 1
+    assert profile.operations["disconnect_all_channels"].calls == 1
+    assert profile.phases["validate_relays"].calls == 1
+    assert profile.phases["validate_channel_names"].calls == 2
+    assert profile.phases["write_relays_to_device"].calls == 4
+    assert profile.phases["build_relay_mask"].calls == 4
+    assert profile.phases["settle"].calls == 4
+
+    report = profile.report()
+    assert report.index("Operation") < report.index("Phase")
+    assert "validate_single_source" in report
+
+
+def test_profile_try_operations_share_validation_phases(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    with board.profile() as profile:
+        board.try_connect("A", "C")
+        board.try_connect("X", "Y")
+        board.try_disconnect("A", "C")
+
+    assert profile.operations["try_connect"].calls == 2
+    assert profile.operations["try_disconnect"].calls == 1
+    assert profile.phases["validate_relays"].calls == 2
+    assert profile.phases["validate_channel_names"].calls == 3
+
+
+def test_profile_i2c_board_times_settle(board_config: board_config):
+    driver = EmulatedI2CDriver()
+    driver.attach(0x40, EmulatedBoardDevice.from_board_config(board_config))
+    controller = I2CDriverBoardController(driver, 0x40, board_config, settle_time=1e-4)
+    board = AccessoryBoard(board_config, controller)
+    with board.profile() as profile:
+        board.connect_channels("A", "C")
+
+    assert profile.phases["settle"].calls == 1
+    assert profile.phases["settle"].total >= 1e-4
+
+
+def test_profiling_is_removed_after_block(board_config: board_config):
+    controller = SimulatedBoardController(board_config)
+    controller.set_relay = MagicMock()
+    board = AccessoryBoard(board_config, controller)
+    with board.profile():
+        pass
+
+    assert "_validate_relays" not in vars(board)
+    assert "write_relays_to_device" not in vars(controller)
+    assert isinstance(controller.set_relay, MagicMock)
+
+
+def test_nested_profiling_raises(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    with board.profile(), pytest.raises(RuntimeError), board.profile():
+        pass
+
+
+def test_empty_profile_report(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    with board.profile() as profile:
+        pass
+    assert profile.report() == "No operations profiled."
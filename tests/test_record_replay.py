@@ -0,0 +1,93 @@
+import pytest
+
+from aliaroaccessoryboards import SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.boardcontrollers import replay_board_controller
+from aliaroaccessoryboards.boardcontrollers.recording_board_controller import (
+    RecordedSession,
+    RecordingBoardController,
+)
+from aliaroaccessoryboards.boardcontrollers.replay_board_controller import (
+    ReplayBoardController,
+    replay_session,
+)
+from aliaroaccessoryboards.exceptions import ResourceInUseException
+from tests.shared import board_config
+
+
+@pytest.fixture
+def recorded_session(board_config: board_config, tmp_path) -> RecordedSession:
+    controller = RecordingBoardController(
+        SimulatedBoardController(board_config), board_config
+    )
+    board = AccessoryBoard(board_config, controller)
+    controller.attach(board)
+    board.connect_channels("A", "C")
+    with pytest.raises(ResourceInUseException):
+        board.connect_channels("X", "Y")
+    board.connect_channels("B", "D")
+    board.board_controller.read_currents()
+    board.disconnect_all_channels()
+
+    path = tmp_path / "session.json"
+    controller.session.save(path)
+    return RecordedSession.load(path)
+
+
+def test_recording_captures_device_calls_and_operations(recorded_session):
+    names = [event.name for event in recorded_session.operations]
+    assert names == [
+        "connect_channels",
+        "connect_channels",
+        "connect_channels",
+        "disconnect_all_channels",
+    ]
+    assert recorded_session.operations[1].error == "ResourceInUseException"
+    writes = [
+        event.args[0]
+        for event in recorded_session.device_events
+        if event.name == "write_relays_to_device"
+    ]
+    assert writes == [0, 0, 0b0001, 0b1001, 0]
+    assert all(event.duration >= 0 for event in recorded_session.events)
+
+
+def test_replay_matches_recording(board_config: board_config, recorded_session):
+    result = replay_session(board_config, recorded_session)
+    assert result.operations == 4
+    assert result.mismatches == []
+    assert result.operation_seconds <= result.elapsed
+
+
+def test_replay_reports_behavior_changes(board_config: board_config, recorded_session):
+    # A board config that no longer shares relay AC between A-C and X-Y.
+    board_config = board_config.model_copy(deep=True)
+    board_config.connection_paths[-1].relays = ["AD"]
+    result = replay_session(board_config, recorded_session)
+    assert any("recorded ResourceInUseException" in m for m in result.mismatches)
+    assert any("expected write_relays_to_device" in m for m in result.mismatches)
+
+
+def test_replay_original_timing(
+    board_config: board_config, recorded_session, monkeypatch
+):
+    events = [
+        event._replace(duration=0.01)
+        if event.name == "write_relays_to_device"
+        else event
+        for event in recorded_session.events
+    ]
+    session = RecordedSession(events, recorded_session.sources)
+    assert replay_session(board_config, session, timing="original").elapsed >= 0.05
+
+    sleeps = []
+    monkeypatch.setattr(replay_board_controller.time, "sleep", sleeps.append)
+    replay_session(board_config, session, timing="zero")
+    assert sleeps == []
+
+
+def test_replay_controller_rejects_unknown_timing(
+    board_config: board_config, recorded_session
+):
+    with pytest.raises(ValueError):
+        ReplayBoardController(board_config, recorded_session, timing="fast")
@@ -0,0 +1,102 @@
+import numpy as np
+
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.current_sampler import CurrentSampler
+from aliaroaccessoryboards.interlock import OvercurrentInterlock
+from aliaroaccessoryboards.relay_journal import (
+    JournalOperation,
+    RelayJournal,
+    read_journal,
+    unpack_relays,
+)
+
+
+def test_append_and_read(tmp_path):
+    path = tmp_path / "relays.journal"
+    journal = RelayJournal(path, relay_count=12, board_id=7)
+    journal.append(JournalOperation.CONNECT, 0b1)
+    journal.append(JournalOperation.DISCONNECT, 0b1000_0000_0010)
+    journal.flush()
+
+    records = read_journal(path)
+    assert len(records) == 2
+    assert list(records["operation"]) == [
+        JournalOperation.CONNECT,
+        JournalOperation.DISCONNECT,
+    ]
+    assert list(records["board_id"]) == [7, 7]
+    assert np.all(np.diff(records["timestamp_ns"].astype(np.int64)) >= 0)
+    relays = unpack_relays(records, 12)
+    assert relays.shape == (2, 12)
+    assert list(np.flatnonzero(relays[0])) == [0]
+    assert list(np.flatnonzero(relays[1])) == [1, 11]
+    journal.close()
+
+
+def test_reopen_appends(tmp_path):
+    path = tmp_path / "relays.journal"
+    journal = RelayJournal(path, relay_count=4)
+    journal.append(JournalOperation.CONNECT, 1)
+    journal.close()
+
+    journal = RelayJournal(path, relay_count=4)
+    journal.append(JournalOperation.RESET, 0)
+    journal.close()
+    assert list(read_journal(path)["operation"]) == [
+        JournalOperation.CONNECT,
+        JournalOperation.RESET,
+    ]
+
+
+def test_rotation(tmp_path):
+    path = tmp_path / "relays.journal"
+    journal = RelayJournal(path, relay_count=4, max_bytes=64 + 3 * 24, backups=2)
+    assert journal.capacity == 3
+    for mask in range(10):
+        journal.append(JournalOperation.CONNECT, mask)
+    journal.close()
+
+    assert len(read_journal(path)) == 1
+    assert not path.with_name(path.name + ".3").exists()
+    records = read_journal(path, include_rotated=True)
+    # Files hold masks 3-5, 6-8 and 9; the oldest file was dropped.
+    masks = records["mask"][:, 0]
+    assert list(masks) == list(range(3, 10))
+
+
+def test_board_journals_applied_masks(board: AccessoryBoard, tmp_path):
+    path = tmp_path / "board.journal"
+    board.enable_journal(path, board_id=3)
+    board.connect_channels("A", "C")
+    board.connect_channels("B", "D")
+    board.disconnect_channels("A", "C")
+    board.reset()
+    board.disable_journal()
+
+    records = read_journal(path)
+    assert list(records["operation"]) == [
+        JournalOperation.CONNECT,
+        JournalOperation.CONNECT,
+        JournalOperation.DISCONNECT,
+        JournalOperation.DISCONNECT_ALL,
+        JournalOperation.RESET,
+    ]
+    relays = unpack_relays(records, len(board.relays))
+    names = [{board.relays[idx] for idx in np.flatnonzero(row)} for row in relays]
+    assert names == [{"AC"}, {"AC", "BD"}, {"BD"}, set(), set()]
+
+
+def test_interlock_trip_is_journaled(board: AccessoryBoard, tmp_path):
+    path = tmp_path / "board.journal"
+    board.enable_journal(path)
+    sampler = CurrentSampler(board.board_controller)
+    interlock = OvercurrentInterlock(board, sampler, {"Sensor1": 1.0})
+    interlock.arm()
+    board.connect_channels("A", "C")
+    board.board_controller.device_currents = [2, 0]
+    sampler.sample_once()
+    board.disable_journal()
+
+    records = read_journal(path)
+    assert records["operation"][-1] == JournalOperation.INTERLOCK
+    assert not unpack_relays(records, len(board.relays))[-1].any()
@@ -0,0 +1,96 @@
+import pytest
+
+from aliaroaccessoryboards import SharedStateReader, SimulatedBoardController
+from aliaroaccessoryboards.accessory_board import AccessoryBoard
+from aliaroaccessoryboards.connection_key import ConnectionKey
+from aliaroaccessoryboards.shared_state import SharedStatePublisher
+from tests.shared import board_config
+
+
+@pytest.fixture
+def publisher() -> SharedStatePublisher:
+    publisher = SharedStatePublisher(None, 4, ["A", "B", "C", "D"], 4)
+    yield publisher
+    publisher.close()
+
+
+def test_reader_sees_published_state(publisher: SharedStatePublisher):
+    reader = SharedStateReader(publisher.name)
+    publisher.publish(0b1010, [ConnectionKey("A", "C"), ConnectionKey("B", "D")])
+
+    snapshot = reader.read()
+    assert snapshot.relay_mask == 0b1010
+    assert snapshot.connections == {ConnectionKey("A", "C"), ConnectionKey("B", "D")}
+    assert snapshot.sequence == 2
+    assert reader.channels == ("A", "B", "C", "D")
+    reader.close()
+
+
+def test_sequence_advances_on_every_publish(publisher: SharedStatePublisher):
+    reader = SharedStateReader(publisher.name)
+    publisher.publish(0, [])
+    first = reader.sequence
+    publisher.publish(1, [])
+    assert reader.sequence == first + 2
+    reader.close()
+
+
+def test_reader_times_out_while_update_in_progress(publisher: SharedStatePublisher):
+    reader = SharedStateReader(publisher.name)
+    # Simulate a publisher that stopped mid-update.
+    publisher._shm.buf[24] = 1
+    with pytest.raises(TimeoutError):
+        reader.read(timeout=0.01)
+    reader.close()
+
+
+def test_publish_too_many_connections_raises(publisher: SharedStatePublisher):
+    connections = [ConnectionKey("A", ch) for ch in "BCD"] + [ConnectionKey("B", "C")]
+    connections.append(ConnectionKey("C", "D"))
+    with pytest.raises(ValueError):
+        publisher.publish(0, connections)
+
+
+def test_accessory_board_publishes_state_changes(board_config: board_config):
+    board = AccessoryBoard(board_config, SimulatedBoardController(board_config))
+    publisher = board.publish_state()
+    reader = SharedStateReader(publisher.name)
+    assert reader.read().connections == frozenset()
+
+    board.connect_channels("A", "C")
+    snapshot = reader.read()
+    assert snapshot.connections == {ConnectionKey("A", "C")}
+    assert snapshot.relay_mask == 1 << board_config.relays.index("AC")
+
+    board.disconnect_channels("A", "C")
+    assert reader.read().relay_mask == 0
+
+    reader.close()
+    board.stop_publishing_state()
+
+
+def test_reader_does_not_patch_resource_tracker(publisher: SharedStatePublisher):
+    from multiprocessing import resource_tracker
+
+    register = resource_tracker.register
+    reader = SharedStateReader(publisher.name)
+    assert resource_tracker.register is register
+    reader.close()
+    # The segment outlives the reader.
+    reader = SharedStateReader(publisher.name)
+    try:
+        assert reader.channels == ("A", "B", "C", "D")
+    finally:
+        reader.close()
+
+
+def test_self_loop_connection_round_trips(publisher: SharedStatePublisher):
+    reader = SharedStateReader(publisher.name)
+    try:
+        publisher.publish(0, [ConnectionKey("A", "A"), ConnectionKey("B", "C")])
+        assert reader.read().connections == {
+            ConnectionKey("A", "A"),
+            ConnectionKey("B", "C"),
+        }
+    finally:
+        reader.close()
@@ -1,8 +1,11 @@
+import time
+
 import pytest
 
 from aliaroaccessoryboards.boardcontrollers.simulated_board_controller import (
     SimulatedBoardController,
 )
+from aliaroaccessoryboards.metrics import Metrics
 from tests.shared import board_config
 
 
@@ -39,3 +42,55 @@ def test_current_count_property(
     board_config: board_config, simulated_board_controller
 ) -> None:
     assert simulated_board_controller.current_count == len(board_config.current_sensors)
+
+
+def test_device_relays_reflects_relay_mask(simulated_board_controller) -> None:
+    simulated_board_controller.write_relays_to_device(0b1001)
+    assert simulated_board_controller.device_relay_mask == 0b1001
+    assert simulated_board_controller.device_relays == (True, False, False, True)
+
+    simulated_board_controller.device_relays = [False, True, True, False]
+    assert simulated_board_controller.read_relays_from_device() == 0b0110
+
+    # In-place writes to the snapshot fail instead of being silently lost.
+    with pytest.raises(TypeError):
+        simulated_board_controller.device_relays[0] = True
+
+
+def test_latency_and_settle_time(board_config: board_config) -> None:
+    controller = SimulatedBoardController(
+        board_config, write_latency=0.01, read_latency=0.005, settle_time=0.02
+    )
+    start = time.perf_counter()
+    controller.write_relays_to_device(0b1)
+    assert time.perf_counter() - start >= 0.03
+
+    start = time.perf_counter()
+    controller.read_relays_from_device()
+    controller.read_currents_from_device()
+    assert time.perf_counter() - start >= 0.01
+
+
+def test_jitter_is_reproducible(board_config: board_config, monkeypatch) -> None:
+    import aliaroaccessoryboards.boardcontrollers.simulated_board_controller as module
+
+    delays = []
+    for _ in range(2):
+        controller = SimulatedBoardController(
+            board_config, read_latency=0.001, jitter=0.001, seed=42
+        )
+        sleeps = []
+        monkeypatch.setattr(module, "sleep", sleeps.append)
+        controller.read_relays_from_device()
+        controller.read_relays_from_device()
+        delays.append(sleeps)
+    assert delays[0] == delays[1]
+    assert all(0.001 <= delay <= 0.002 for delay in delays[0])
+    assert delays[0][0] != delays[0][1]
+
+
+def test_settle_is_recorded_in_metrics(board_config: board_config) -> None:
+    controller = SimulatedBoardController(board_config, settle_time=0.001)
+    controller.metrics = Metrics()
+    controller.write_relays_to_device(0)
+    assert controller.metrics.snapshot()["counters"]["settle_total"] == 1